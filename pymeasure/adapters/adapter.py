@@ -24,6 +24,7 @@
 
 import numpy as np
 from copy import copy
+from time import sleep, time
 
 
 class Adapter(object):
@@ -59,6 +60,82 @@ class Adapter(object):
         """
         raise NameError("Adapter (sub)class has not implemented reading")
 
+    def write_raw(self, data, end=True):
+        """ Writes bytes to the instrument
+
+        :param data: Bytes to be sent to the instrument
+        :param end: False if more bytes of the same message follow
+        """
+        raise NameError("Adapter (sub)class has not implemented raw writing")
+
+    def write_binary_values(self, command, values, dtype=np.float32, chunk_size=None):
+        """ Writes a command followed by the values as an IEEE 488.2
+        definite length binary block (e.g. :code:`#18<8 bytes>`)
+
+        :param command: SCPI command string that precedes the block
+        :param values: Values (e.g. a NumPy array), which are sent as the
+                       bytes of an array of the data type
+        :param dtype: The NumPy data type of the values, including the byte
+                      order expected by the instrument (e.g. '<i2')
+        :param chunk_size: The maximum number of bytes written at once, or
+                           None to write the message at once
+        """
+        block = np.ascontiguousarray(values, dtype=dtype).tobytes()
+        length = str(len(block))
+        message = ("%s#%d%s" % (command, len(length), length)).encode() + block + b"\n"
+        if chunk_size is None:
+            self.write_raw(message)
+        else:
+            for start in range(0, len(message), chunk_size):
+                self.write_raw(message[start:start + chunk_size],
+                               end=start + chunk_size >= len(message))
+
+    def read_stb(self):
+        """ Returns the status byte of the instrument, which is read with
+        the *STB? query unless the adapter supports a serial poll
+
+        :returns: Integer status byte
+        """
+        return int(self.ask("*STB?"))
+
+    def wait_for(self, condition, timeout=None, delay=0.1, should_stop=lambda: False):
+        """ Blocks until the condition function returns True, by calling it
+        every delay time in seconds. This is the fallback for the
+        instruments that can not request service when they are ready.
+
+        :param condition: A function that returns True when the wait is over
+        :param timeout: A time in seconds after which a TimeoutError is
+                        raised, or None to wait indefinitely
+        :param delay: A time in seconds between the checks of the condition
+        :param should_stop: A function that returns True if the wait should
+                            stop early
+        :returns: True if the condition is met, False if stopped early
+        """
+        t = time()
+        while not condition():
+            if should_stop():
+                return False
+            if timeout is not None and time() - t > timeout:
+                raise TimeoutError("Timed out after %g seconds" % timeout)
+            sleep(delay)
+        return True
+
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=lambda: False):
+        """ Blocks until the instrument requests service (SRQ), which is
+        signaled by bit 6 of the status byte. The instrument has to be
+        configured to request service for the event of interest (e.g. with
+        *SRE). The status byte is polled every delay time in seconds, unless
+        the adapter supports waiting for service request events.
+
+        :param timeout: A time in seconds after which a TimeoutError is
+                        raised (25 s by default), or None to wait indefinitely
+        :param delay: A time in seconds between the checks of the status byte
+        :param should_stop: A function that returns True if the wait should
+                            stop early
+        :returns: True if service was requested, False if stopped early
+        """
+        return self.wait_for(lambda: self.read_stb() & 64, timeout, delay, should_stop)
+
     def values(self, command, separator=',', cast=float):
         """ Writes a command to the instrument and returns a list of formatted
         values from the result 
@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import re
 import time
 
 import serial
@@ -99,6 +100,24 @@ class PrologixAdapter(SerialAdapter):
         command += "\n"
         self.connection.write(command.encode())
 
+    def write_raw(self, data, end=True):
+        """ Writes bytes to the GPIB address stored in the :attr:`.address`,
+        escaping the characters that the Prologix controller interprets.
+        Each call is sent as a separate message terminated by the controller,
+        so a message can not be split across calls.
+
+        :param data: Bytes to be sent to the instrument
+        :param end: Has to be True, as partial messages are not supported
+        """
+        if not end:
+            raise ValueError("Prologix adapters can not send partial messages, "
+                             "send the message at once (e.g. chunk_size=None)")
+        if self.address is not None:
+            address_command = "++addr %d\n" % self.address
+            self.connection.write(address_command.encode())
+        escaped = re.sub(rb"([\x1b\r\n+])", b"\x1b\\1", data)
+        self.connection.write(escaped + b"\n")
+
     def read(self):
         """ Reads the response of the instrument until timeout
 
@@ -107,6 +126,24 @@ class PrologixAdapter(SerialAdapter):
         self.write("++read eoi")
         return b"\n".join(self.connection.readlines()).decode()
 
+    def read_bytes(self, size):
+        """ Reads the specified number of bytes of the response of the
+        instrument, or fewer if the read times out
+
+        :param size: Number of bytes to read
+        :returns: Bytes response of the instrument
+        """
+        self.write("++read eoi")
+        return self.connection.read(size)
+
+    def read_stb(self):
+        """ Returns the status byte of the instrument by a serial poll
+
+        :returns: Integer status byte
+        """
+        self.write("++spoll")
+        return int(self.connection.readline().decode())
+
     def gpib(self, address, rw_delay=None):
         """ Returns and PrologixAdapter object that references the GPIB
         address specified, while sharing the Serial connection with other
@@ -119,15 +156,6 @@ class PrologixAdapter(SerialAdapter):
         rw_delay = rw_delay or self.rw_delay
         return PrologixAdapter(self.connection, address, rw_delay=rw_delay)
 
-    def wait_for_srq(self, timeout=25, delay=0.1):
-        """ Blocks until a SRQ, and leaves the bit high
-
-        :param timeout: Timeout duration in seconds
-        :param delay: Time delay between checking SRQ in seconds
-        """
-        while int(self.ask("++srq")) != 1:  # TODO: Include timeout!
-            time.sleep(delay)
-
     def __repr__(self):
         if self.address is not None:
             return "<PrologixAdapter(port='%s',address=%d)>" % (
@@ -59,6 +59,14 @@ class SerialAdapter(Adapter):
         """
         self.connection.write(command.encode())  # encode added for Python 3
 
+    def write_raw(self, data, end=True):
+        """ Writes bytes to the instrument
+
+        :param data: Bytes to be sent to the instrument
+        :param end: False if more bytes of the same message follow
+        """
+        self.connection.write(data)
+
     def read(self):
         """ Reads until the buffer is empty and returns the resulting
         ASCII respone
@@ -67,6 +75,26 @@ class SerialAdapter(Adapter):
         """
         return b"\n".join(self.connection.readlines()).decode()
 
+    def read_bytes(self, size):
+        """ Reads the specified number of bytes, or fewer if the read
+        times out, and returns them without decoding
+
+        :param size: Number of bytes to read
+        """
+        return self.connection.read(size)
+
+    def read_until(self, terminator=b"\n"):
+        """ Reads bytes up to and including the terminator, or until the
+        read timeout, and returns them without decoding
+
+        :param terminator: Bytes that end the reply
+        """
+        return self.connection.read_until(terminator)
+
+    def reset_input_buffer(self):
+        """ Discards the bytes received but not yet read """
+        self.connection.reset_input_buffer()
+
     def binary_values(self, command, header_bytes=0, dtype=np.float32):
         """ Returns a numpy array from a query for binary data 
 
@@ -76,9 +104,8 @@ class SerialAdapter(Adapter):
         :returns: NumPy array of values
         """
         self.connection.write(command.encode())
-        binary = self.connection.read().decode()
-        header, data = binary[:header_bytes], binary[header_bytes:]
-        return np.fromstring(data, dtype=dtype)
+        binary = self.connection.read()
+        return np.frombuffer(binary, dtype=dtype, offset=header_bytes)
 
     def __repr__(self):
         return "<SerialAdapter(port='%s')>" % self.connection.port
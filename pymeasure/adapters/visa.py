@@ -27,6 +27,9 @@ import logging
 import copy
 import visa
 import numpy as np
+from time import time
+from pyvisa.constants import EventType, EventMechanism, StatusCode
+from pyvisa.errors import VisaIOError
 from pkg_resources import parse_version
 
 from .adapter import Adapter
@@ -85,6 +88,20 @@ class VISAAdapter(Adapter):
         """
         self.connection.write(command)
 
+    def write_raw(self, data, end=True):
+        """ Writes bytes to the instrument, ending the message (e.g. with
+        EOI on GPIB) only if end is True
+
+        :param data: Bytes to be sent to the instrument
+        :param end: False if more bytes of the same message follow
+        """
+        send_end = self.connection.send_end
+        self.connection.send_end = end
+        try:
+            self.connection.write_raw(data)
+        finally:
+            self.connection.send_end = send_end
+
     def read(self):
         """ Reads until the buffer is empty and returns the resulting
         ASCII response
@@ -93,6 +110,14 @@ class VISAAdapter(Adapter):
         """
         return self.connection.read()
 
+    def read_raw(self):
+        """ Reads until the buffer is empty and returns the response as
+        bytes, without decoding
+
+        :returns: Bytes response of the instrument.
+        """
+        return self.connection.read_raw()
+
     def read_bytes(self, size):
         """ Reads specified number of bytes from the buffer and returns
         the resulting ASCII response
@@ -102,6 +127,55 @@ class VISAAdapter(Adapter):
         """
         return self.connection.read_bytes(size)
 
+    def read_stb(self):
+        """ Returns the status byte of the instrument by a serial poll,
+        which does not go through the message queue of the instrument
+
+        :returns: Integer status byte
+        """
+        return int(self.connection.read_stb())
+
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=lambda: False):
+        """ Blocks until the instrument requests service (SRQ), which is
+        received as a VISA service request event when the interface supports
+        it, or polled from the status byte every delay time otherwise.
+        The status byte is only read once, after enabling the events, so
+        that the bus is not polled while waiting.
+
+        :param timeout: A time in seconds after which a TimeoutError is
+                        raised (25 s by default), or None to wait indefinitely
+        :param delay: A time in seconds after which the should_stop function
+                      is checked
+        :param should_stop: A function that returns True if the wait should
+                            stop early
+        :returns: True if service was requested, False if stopped early
+        """
+        try:
+            self.connection.enable_event(EventType.service_request, EventMechanism.queue)
+        except (VisaIOError, NotImplementedError):
+            log.debug("Service request events are not supported, polling instead")
+            return super().wait_for_srq(timeout, delay, should_stop)
+        try:
+            # A request before the events were enabled is not queued
+            if self.read_stb() & 64:
+                return True
+            t = time()
+            while True:
+                try:
+                    self.connection.wait_on_event(EventType.service_request,
+                                                  int(delay * 1e3))
+                    return True
+                except VisaIOError as e:
+                    if e.error_code != StatusCode.error_timeout:
+                        raise
+                if should_stop():
+                    return False
+                if timeout is not None and time() - t > timeout:
+                    raise TimeoutError("Timed out after %g seconds" % timeout)
+        finally:
+            self.connection.disable_event(EventType.service_request, EventMechanism.queue)
+            self.connection.discard_events(EventType.service_request, EventMechanism.queue)
+
     def ask(self, command):
         """ Writes the command to the instrument and returns the resulting
         ASCII response
@@ -131,8 +205,7 @@ class VISAAdapter(Adapter):
         """
         self.connection.write(command)
         binary = self.connection.read_raw()
-        header, data = binary[:header_bytes], binary[header_bytes:]
-        return np.fromstring(data, dtype=dtype)
+        return np.frombuffer(binary, dtype=dtype, offset=header_bytes)
 
     def config(self, is_binary=False, datatype='str',
                container=np.array, converter='s',
@@ -153,10 +226,3 @@ class VISAAdapter(Adapter):
         self.connection.values_format.separator = separator
         self.connection.values_format.is_big_endian = is_big_endian
 
-    def wait_for_srq(self, timeout=25, delay=0.1):
-        """ Blocks until a SRQ, and leaves the bit high
-
-        :param timeout: Timeout duration in seconds
-        :param delay: Time delay between checking SRQ in seconds
-        """
-        self.connection.wait_for_srq(timeout * 1000)
@@ -76,13 +76,18 @@ class VXI11Adapter(Adapter):
         """
         return self.connection.ask(command)
 
-    def write_raw(self, command):
+    def write_raw(self, command, end=True):
         """ Wrapper function for the write_raw command using the
         vxi11 interface.
 
         :param command: binary string with the command that will be
                         transmitted to the instrument
+        :param end: Has to be True, as each call is sent as a separate
+                    message
         """
+        if not end:
+            raise ValueError("VXI-11 adapters can not send partial messages, "
+                             "send the message at once (e.g. chunk_size=None)")
         self.connection.write_raw(command)
 
     def read_raw(self):
@@ -72,7 +72,7 @@ class BrowserItem(QtGui.QTreeWidgetItem):
             """)
 
     def setProgress(self, progress):
-        self.progressbar.setValue(progress)
+        self.progressbar.setValue(int(progress))
 
 
 class Browser(QtGui.QTreeWidget):
@@ -23,6 +23,7 @@
 #
 
 import logging
+import os
 
 import pyqtgraph as pg
 import numpy as np
@@ -33,35 +34,227 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+class MinMaxDecimator(object):
+    """ Reduces x-y data for display by keeping the minimum and maximum of
+    consecutive blocks of points, which preserves the envelope of the curve
+    with at most two points per block. The reduction is incremental: only the
+    points that complete new blocks are processed when the data grows, and
+    the block size is doubled by merging neighbouring blocks whenever the
+    number of blocks exceeds ``max_blocks``.
+
+    :param max_blocks: The maximum number of blocks, typically the width of
+                       the plot in pixels
+    """
+
+    def __init__(self, max_blocks=1000):
+        self.max_blocks = max(int(max_blocks), 1)
+        self.reset()
+
+    def reset(self):
+        """ Discards the reduced data """
+        self.block_size = 1
+        self._count = 0
+        self._x = np.empty((0, 2))
+        self._y = np.empty((0, 2))
+
+    @staticmethod
+    def _reduce(x, y):
+        """ Returns the (x, y) pairs of the minimum and maximum of each row,
+        in their original order
+        """
+        valid = ~np.isnan(y)
+        imin = np.argmin(np.where(valid, y, np.inf), axis=1)
+        imax = np.argmax(np.where(valid, y, -np.inf), axis=1)
+        first, last = np.minimum(imin, imax), np.maximum(imin, imax)
+        rows = np.arange(len(x))
+        return (np.column_stack((x[rows, first], x[rows, last])),
+                np.column_stack((y[rows, first], y[rows, last])))
+
+    def _grow(self):
+        """ Doubles the block size by merging pairs of blocks """
+        blocks = len(self._x) // 2
+        self._x, self._y = self._reduce(self._x[:2 * blocks].reshape(blocks, 4),
+                                        self._y[:2 * blocks].reshape(blocks, 4))
+        self.block_size *= 2
+        self._count = blocks * self.block_size
+
+    def decimate(self, x, y):
+        """ Returns the decimated x and y arrays of the data, which must
+        extend the data of the previous call, unless reset is called.
+        Only the points that were not reduced before are read, so that
+        the arrays can be memory-mapped.
+        """
+        size = len(x)
+        if size < self._count:
+            self.reset()
+        if size <= 2 * self.max_blocks and self.block_size == 1:
+            return np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        while size // self.block_size > self.max_blocks:
+            self._grow()
+
+        complete = (size // self.block_size) * self.block_size
+        if complete > self._count:
+            x_new, y_new = self._reduce(
+                np.asarray(x[self._count:complete], dtype=float).reshape(-1, self.block_size),
+                np.asarray(y[self._count:complete], dtype=float).reshape(-1, self.block_size))
+            self._x = np.concatenate((self._x, x_new))
+            self._y = np.concatenate((self._y, y_new))
+            self._count = complete
+
+        return (np.concatenate((self._x.ravel(), np.asarray(x[complete:], dtype=float))),
+                np.concatenate((self._y.ravel(), np.asarray(y[complete:], dtype=float))))
+
+
 class ResultsCurve(pg.PlotDataItem):
     """ Creates a curve loaded dynamically from a file through the Results
     object and supports error bars. The data can be forced to fully reload
     on each update, useful for cases when the data is changing across the full
     file instead of just appending.
+
+    Large data sets are decimated to a min/max envelope of about two points
+    per pixel before being handed to PyQtGraph, unless decimation is disabled.
+    With :meth:`.set_full_resolution`, the points in the visible x range are
+    shown at full resolution, which is useful when zoomed in.
+
+    With ``project_columns``, only the plotted columns of the results are
+    read, at the cost of reading the data again when the axes change.
+
+    The curve is dirty when the revision of its results, or the
+    modification time or size of their data file, has changed since the
+    last update, so that a :class:`.PlotFrame` only polls the results of
+    curves which have new data. The revision is only advanced by a
+    :class:`.Recorder` in this process, while the file state also covers
+    files written by other processes. Changes of the view, which affect the
+    decimated data, re-render the curve when they happen.
     """
 
     def __init__(self, results, x, y, xerr=None, yerr=None,
-                 force_reload=False, **kwargs):
+                 force_reload=False, decimate=True, project_columns=False, **kwargs):
         super().__init__(**kwargs)
         self.results = results
         self.pen = kwargs.get('pen', None)
         self.x, self.y = x, y
         self.force_reload = force_reload
+        self.decimate = decimate
+        self.project_columns = project_columns
+        self.full_resolution = False
+        self._decimator = MinMaxDecimator()
+        self._decimated_columns = None
+        self._rendered = None
+        self._state = None
         if xerr or yerr:
             self._errorBars = pg.ErrorBarItem(pen=kwargs.get('pen', None))
             self.xerr, self.yerr = xerr, yerr
 
+    def set_full_resolution(self, enabled):
+        """ Shows the points in the visible x range at full resolution
+        instead of the decimated curve when enabled
+        """
+        self.full_resolution = enabled
+        self._rendered = None
+        self.update()
+
+    def unload(self):
+        """ Releases the data of the curve and of its results, which is
+        read again on the next update
+        """
+        self.results.unload()
+        self.clear()
+        self._decimator.reset()
+        self._rendered = None
+        self._state = None
+
+    def _view_key(self):
+        """ Returns the state of the view that the displayed data depends on """
+        if not self.decimate:
+            return None
+        if self.full_resolution:
+            view_box = self.getViewBox()
+            if view_box is not None:
+                return tuple(view_box.viewRange()[0])
+            return None
+        return self._plot_width()
+
+    def _view_changed(self):
+        """ Re-renders the curve if the view change affects its data """
+        if self._rendered is not None and self._rendered[-1] != self._view_key():
+            self.update()
+
+    def viewRangeChanged(self):
+        super().viewRangeChanged()
+        self._view_changed()
+
+    def viewTransformChanged(self):
+        super().viewTransformChanged()
+        self._view_changed()
+
+    def _results_state(self):
+        """ Returns the revision of the results and, if they are read from
+        a file, its modification time and size
+        """
+        try:
+            stat = os.stat(self.results.data_filename)
+        except (AttributeError, TypeError, OSError):  # Remote or several files
+            return self.results.revision
+        return self.results.revision, stat.st_mtime_ns, stat.st_size
+
+    def is_dirty(self):
+        """ Returns True if the results have changed since the last update """
+        return self.force_reload or self._state != self._results_state()
+
+    def _plot_width(self):
+        view_box = self.getViewBox()
+        if view_box is not None and view_box.width() > 0:
+            return int(view_box.width())
+        return 1000
+
+    def _decimated(self, x, y):
+        """ Returns the x and y arrays to be displayed """
+        if self.full_resolution:
+            view_box = self.getViewBox()
+            if view_box is not None:
+                x_min, x_max = view_box.viewRange()[0]
+                visible = (x >= x_min) & (x <= x_max)
+                return x[visible], y[visible]
+            return x, y
+        columns = (self.x, self.y)
+        if self.force_reload or columns != self._decimated_columns:
+            self._decimator.reset()
+            self._decimated_columns = columns
+        self._decimator.max_blocks = self._plot_width()
+        return self._decimator.decimate(x, y)
+
     def update(self):
-        """Updates the data by polling the results"""
+        """Updates the data by polling the results, re-rendering the
+        curve only if new data has arrived or the axes have changed
+        """
+        self._state = self._results_state()
+        if self.project_columns:
+            columns = [self.x, self.y]
+            if hasattr(self, '_errorBars'):
+                columns += [self.xerr, self.yerr]
+            self.results.set_columns(
+                sorted(set(column for column in columns if column is not None)))
         if self.force_reload:
             self.results.reload()
-        data = self.results.data  # get the current snapshot
+            self._rendered = None
+        # Get the current snapshot, which may be memory-mapped
+        x, y = self.results.column(self.x), self.results.column(self.y)
+
+        rendered = (len(x), self.x, self.y, self._view_key())
+        if rendered == self._rendered:
+            return
+        self._rendered = rendered
 
         # Set x-y data
-        self.setData(data[self.x], data[self.y])
+        if self.decimate:
+            self.setData(*self._decimated(x, y))
+        else:
+            self.setData(np.asarray(x), np.asarray(y))
 
         # Set error bars if enabled at construction
         if hasattr(self, '_errorBars'):
+            data = self.results.data
             self._errorBars.setOpts(
                 x=data[self.x],
                 y=data[self.y],
@@ -73,44 +266,83 @@ class ResultsCurve(pg.PlotDataItem):
             )
 
 
-# TODO: Add method for changing x and y
-
-
 class BufferCurve(pg.PlotDataItem):
-    """ Creates a curve based on a predefined buffer size and allows
-    data to be added dynamically, in additon to supporting error bars
+    """ Creates a curve based on a buffer, which grows as needed, and allows
+    data to be added dynamically, in additon to supporting error bars.
+
+    With ``batch``, appended points are only stored in the buffer and the
+    curve is re-rendered by :meth:`.update`, which a :class:`.PlotFrame`
+    calls on each refresh, so that all the points appended between two
+    refreshes are drawn at once. Otherwise, the curve is re-rendered on
+    each append, which is needed if no timer calls :meth:`.update`.
     """
 
     data_updated = QtCore.QSignal()
 
-    def __init__(self, errors=False, **kwargs):
+    def __init__(self, errors=False, batch=False, **kwargs):
         super().__init__(**kwargs)
+        self.batch = batch
         if errors:
             self._errorBars = pg.ErrorBarItem(pen=kwargs.get('pen', None))
         self._buffer = None
+        self._updated = False
 
     def prepare(self, size, dtype=np.float32):
-        """ Prepares the buffer based on its size, data type """
+        """ Prepares the buffer based on its initial size, data type """
         if hasattr(self, '_errorBars'):
             self._buffer = np.empty((size, 4), dtype=dtype)
         else:
             self._buffer = np.empty((size, 2), dtype=dtype)
         self._ptr = 0
 
+    def _reserve(self, size):
+        """ Doubles the size of the buffer until it can hold size points """
+        capacity = max(len(self._buffer), 1)
+        if size <= len(self._buffer):
+            return
+        while capacity < size:
+            capacity *= 2
+        buffer = np.empty((capacity, self._buffer.shape[1]), dtype=self._buffer.dtype)
+        buffer[:self._ptr] = self._buffer[:self._ptr]
+        self._buffer = buffer
+
     def append(self, x, y, xError=None, yError=None):
         """ Appends data to the curve with optional errors """
+        self.extend([x], [y],
+                    None if xError is None else [xError],
+                    None if yError is None else [yError])
+
+    def extend(self, x, y, xError=None, yError=None):
+        """ Appends arrays of data to the curve with optional errors """
         if self._buffer is None:
             raise Exception("BufferCurve buffer must be prepared")
-        if len(self._buffer) <= self._ptr:
-            raise Exception("BufferCurve overflow")
+        size = len(x)
+        self._reserve(self._ptr + size)
 
         # Set x-y data
-        self._buffer[self._ptr, :2] = [x, y]
+        self._buffer[self._ptr:self._ptr + size, 0] = x
+        self._buffer[self._ptr:self._ptr + size, 1] = y
+
+        # Set errors if enabled at construction
+        if hasattr(self, '_errorBars'):
+            self._buffer[self._ptr:self._ptr + size, 2] = xError
+            self._buffer[self._ptr:self._ptr + size, 3] = yError
+
+        self._ptr += size
+        self._updated = True
+        if not self.batch:
+            self.update()
+
+    def update(self):
+        """ Re-renders the curve if data was appended since the last update """
+        if not self._updated:
+            return
+        self._updated = False
+
         self.setData(self._buffer[:self._ptr, :2])
 
         # Set error bars if enabled at construction
         if hasattr(self, '_errorBars'):
-            self._buffer[self._ptr, 2:] = [xError, yError]
             self._errorBars.setOpts(
                 x=self._buffer[:self._ptr, 0],
                 y=self._buffer[:self._ptr, 1],
@@ -121,7 +353,6 @@ class BufferCurve(pg.PlotDataItem):
                 beam=np.max(self._buffer[:self._ptr, 2:])
             )
 
-        self._ptr += 1
         self.data_updated.emit()
 
 
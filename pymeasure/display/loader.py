@@ -0,0 +1,141 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .Qt import QtCore
+from ..experiment.results import Results
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class ResultsLoader(QtCore.QObject):
+    """ Loads data files into :class:`.Results` objects on a pool of
+    threads, so that large files do not block the user interface.
+
+    For each file, :code:`header_loaded` is emitted with the Results once
+    the header is parsed. Unless only the header is requested, or once
+    :meth:`.load_data` is called, :code:`progress` is emitted with the Results and
+    the percentage of the data read, and :code:`loaded` is emitted with the
+    Results once all the data is read. If loading fails, :code:`failed` is
+    emitted with the filename and the exception. The signals are emitted
+    from the loading threads, apart from :code:`loaded`, and are delivered
+    to the slots of QObjects in the main thread through the Qt event loop.
+
+    The data is read into a separate Results object on the loading thread,
+    which the Results emitted with :code:`header_loaded` takes over in the
+    thread of the loader, right before :code:`loaded` is emitted. Until
+    then, the emitted Results is not modified by the loading thread.
+
+    :param procedure_class: Procedure class used to parse the headers
+    :param max_workers: Maximum number of files loaded in parallel
+    """
+
+    header_loaded = QtCore.QSignal(object)
+    progress = QtCore.QSignal(object, float)
+    loaded = QtCore.QSignal(object)
+    failed = QtCore.QSignal(str, object)
+    _data_read = QtCore.QSignal(object, object)
+
+    def __init__(self, procedure_class=None, max_workers=4, parent=None):
+        super().__init__(parent)
+        self.procedure_class = procedure_class
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = set()
+        self._closed = False
+        self._data_read.connect(self._adopt_data)
+
+    def load(self, filename, read_data=True):
+        """ Queues a file to be loaded
+
+        :param filename: The data filename
+        :param read_data: If False, only the header is read
+        """
+        self._submit(self._load, filename, read_data)
+
+    def load_data(self, results):
+        """ Queues the data of Results, whose header has been loaded, to be read """
+        self._submit(self._read_data, results)
+
+    def _submit(self, function, *args):
+        future = self._executor.submit(function, *args)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+
+    def _load(self, filename, read_data):
+        try:
+            results = Results.load(filename, self.procedure_class)
+        except Exception as e:
+            log.exception("Failed to load %s" % filename)
+            self._emit(self.failed, filename, e)
+            return
+        self._emit(self.header_loaded, results)
+        if read_data:
+            self._read_data(results)
+
+    def _read_data(self, results):
+        filename = results.data_filename
+        try:
+            last_progress = [-1]
+
+            def progress(value):
+                if int(value) > last_progress[0]:  # Limit the number of signals
+                    last_progress[0] = int(value)
+                    self._emit(self.progress, results, value)
+
+            reader = Results.load(filename, self.procedure_class)
+            reader.reload(progress=progress)
+            self._emit(self._data_read, results, reader)
+        except Exception as e:
+            log.exception("Failed to load %s" % filename)
+            self._emit(self.failed, filename, e)
+
+    def _emit(self, signal, *args):
+        """ Emits a signal unless the loader has been shut down """
+        if not self._closed:
+            signal.emit(*args)
+
+    def _adopt_data(self, results, reader):
+        """ Hands the data read on a loading thread to the Results """
+        results.adopt_data(reader)
+        self.loaded.emit(results)
+
+    def shutdown(self):
+        """ Shuts down the thread pool without waiting for the queued files,
+        which are cancelled, and disconnects the signals, so that the files
+        being loaded do not emit to destroyed objects
+        """
+        self._closed = True
+        for future in list(self._futures):
+            future.cancel()
+        for signal in (self.header_loaded, self.progress, self.loaded, self.failed,
+                       self._data_read):
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # No connections
+        self._executor.shutdown(wait=False)
@@ -26,10 +26,11 @@ import logging
 
 import os
 import re
+import time
 import pyqtgraph as pg
 
 from .browser import Browser
-from .curves import ResultsCurve, Crosshairs
+from .curves import ResultsCurve, BufferCurve, Crosshairs
 from .inputs import BooleanInput, IntegerInput, ListInput, ScientificInput, StringInput
 from .log import LogHandler
 from .Qt import QtCore, QtGui
@@ -44,9 +45,16 @@ class PlotFrame(QtGui.QFrame):
     """ Combines a PyQtGraph Plot with Crosshairs. Refreshes
     the plot based on the refresh_time, and allows the axes
     to be changed on the fly, which updates the plotted data
+
+    A single timer refreshes all curves, and only the curves with new
+    data are updated. When updating takes more than LOAD_FRACTION of the
+    refresh interval, the interval is doubled, up to MAX_REFRESH_FACTOR
+    times the refresh_time, and it is reduced again once the load drops.
     """
 
     LABEL_STYLE = {'font-size': '10pt', 'font-family': 'Arial', 'color': '#000000'}
+    LOAD_FRACTION = 0.5
+    MAX_REFRESH_FACTOR = 16
     updated = QtCore.QSignal()
     x_axis_changed = QtCore.QSignal(str)
     y_axis_changed = QtCore.QSignal(str)
@@ -55,6 +63,7 @@ class PlotFrame(QtGui.QFrame):
         super().__init__(parent)
         self.refresh_time = refresh_time
         self.check_status = check_status
+        self.full_resolution = False
         self._setup_ui()
         self.change_x_axis(x_axis)
         self.change_y_axis(y_axis)
@@ -96,13 +105,45 @@ class PlotFrame(QtGui.QFrame):
         self.coordinates.setText("(%g, %g)" % (x, y))
 
     def update_curves(self):
+        start = time.perf_counter()
         for item in self.plot.items:
-            if isinstance(item, ResultsCurve):
+            if isinstance(item, BufferCurve):
+                item.update()
+            elif isinstance(item, ResultsCurve):
+                if not item.is_dirty():
+                    continue
                 if self.check_status:
                     if item.results.procedure.status == Procedure.RUNNING:
                         item.update()
                 else:
                     item.update()
+        self.adapt_refresh_time(time.perf_counter() - start)
+
+    def adapt_refresh_time(self, elapsed):
+        """ Adapts the interval of the refresh timer to the time
+        elapsed while updating the curves
+
+        :param elapsed: Duration of the last update in seconds
+        """
+        minimum = int(self.refresh_time * 1e3)
+        interval = self.timer.interval()
+        load = elapsed * 1e3 / max(interval, 1)
+        if load > self.LOAD_FRACTION:
+            interval = min(2 * interval, self.MAX_REFRESH_FACTOR * minimum)
+        elif load < self.LOAD_FRACTION / 4:
+            interval = max(interval // 2, minimum)
+        if interval != self.timer.interval():
+            log.debug("PlotFrame refresh interval changed to %d ms", interval)
+            self.timer.setInterval(interval)
+
+    def set_full_resolution(self, enabled):
+        """ Shows the visible range of all curves at full resolution
+        instead of decimated when enabled
+        """
+        self.full_resolution = bool(enabled)
+        for item in self.plot.items:
+            if isinstance(item, ResultsCurve):
+                item.set_full_resolution(self.full_resolution)
 
     def parse_axis(self, axis):
         """ Returns the units of an axis by searching the string
@@ -177,6 +218,9 @@ class PlotWidget(QtGui.QWidget):
         self.columns_x.activated.connect(self.update_x_column)
         self.columns_y.activated.connect(self.update_y_column)
 
+        self.full_resolution_check = QtGui.QCheckBox('Full resolution', self)
+        self.full_resolution_check.setToolTip('Show the visible range without decimation')
+
         self.plot_frame = PlotFrame(
             self.columns[0],
             self.columns[1],
@@ -185,6 +229,7 @@ class PlotWidget(QtGui.QWidget):
         )
         self.updated = self.plot_frame.updated
         self.plot = self.plot_frame.plot
+        self.full_resolution_check.toggled.connect(self.plot_frame.set_full_resolution)
         self.columns_x.setCurrentIndex(0)
         self.columns_y.setCurrentIndex(1)
 
@@ -199,6 +244,7 @@ class PlotWidget(QtGui.QWidget):
         hbox.addWidget(self.columns_x)
         hbox.addWidget(self.columns_y_label)
         hbox.addWidget(self.columns_y)
+        hbox.addWidget(self.full_resolution_check)
 
         vbox.addLayout(hbox)
         vbox.addWidget(self.plot_frame)
@@ -219,6 +265,7 @@ class PlotWidget(QtGui.QWidget):
                              )
         curve.setSymbol(None)
         curve.setSymbolBrush(None)
+        curve.full_resolution = self.plot_frame.full_resolution
         return curve
 
     def update_x_column(self, index):
@@ -25,13 +25,17 @@
 import logging
 
 import os
+from collections import OrderedDict
+
 import pyqtgraph as pg
 
 from .browser import BrowserItem
 from .curves import ResultsCurve
+from .loader import ResultsLoader
 from .manager import Manager, Experiment
 from .Qt import QtCore, QtGui
 from .widgets import PlotWidget, BrowserWidget, InputsWidget, LogWidget, ResultsDialog
+from ..experiment import Procedure
 from ..experiment.results import Results
 
 log = logging.getLogger(__name__)
@@ -138,9 +142,19 @@ class ManagedWindow(QtGui.QMainWindow):
 
     .. _pyqtgraph.PlotItem: http://www.pyqtgraph.org/documentation/graphicsItems/plotitem.html
 
+    Opened files are loaded on background threads, showing their progress
+    in the browser, and the curves are added as each file finishes loading.
+    The data of opened experiments is only read when their curve is shown.
+    Opened experiments whose files do not fit in MEMORY_BUDGET bytes, along
+    with the data already loaded or being loaded, are added hidden. When the
+    data loaded in memory exceeds MEMORY_BUDGET bytes, the data of the least
+    recently shown experiments is released, first of the hidden ones and
+    then of the shown ones, which are hidden. The data is read again when
+    they are shown.
 
     """
     EDITOR = 'gedit'
+    MEMORY_BUDGET = 500e6
 
     def __init__(self, procedure_class, inputs=(), displays=(), x_axis=None, y_axis=None,
                  log_channel='', log_level=logging.INFO, parent=None):
@@ -155,6 +169,8 @@ class ManagedWindow(QtGui.QMainWindow):
         log.setLevel(log_level)
         self.log.setLevel(log_level)
         self.x_axis, self.y_axis = x_axis, y_axis
+        self._loaded_experiments = OrderedDict()
+        self._loading = {}  # Results being loaded and the size of their files
         self._setup_ui()
         self._layout()
         self.setup_plot(self.plot)
@@ -203,6 +219,12 @@ class ManagedWindow(QtGui.QMainWindow):
         self.manager.finished.connect(self.finished)
         self.manager.log.connect(self.log.handle)
 
+        self.loader = ResultsLoader(parent=self)
+        self.loader.header_loaded.connect(self.experiment_header_loaded)
+        self.loader.progress.connect(self.experiment_load_progress)
+        self.loader.loaded.connect(self.experiment_loaded)
+        self.loader.failed.connect(self.experiment_load_failed)
+
     def _layout(self):
         self.main = QtGui.QWidget(self)
 
@@ -245,6 +267,7 @@ class ManagedWindow(QtGui.QMainWindow):
         self.resize(1000, 800)
 
     def quit(self, evt=None):
+        self.loader.shutdown()
         self.close()
 
     def browser_item_changed(self, item, column):
@@ -253,12 +276,70 @@ class ManagedWindow(QtGui.QMainWindow):
             experiment = self.manager.experiments.with_browser_item(item)
             if state == 0:
                 self.plot.removeItem(experiment.curve)
+                self.unload_experiments()
             else:
                 experiment.curve.x = self.plot_widget.plot_frame.x_axis
                 experiment.curve.y = self.plot_widget.plot_frame.y_axis
-                experiment.curve.update()
+                if experiment.results in self._loading:
+                    pass  # Shown once loaded
+                elif (not experiment.results.is_loaded() and
+                      experiment.procedure.status not in (Procedure.QUEUED,
+                                                          Procedure.RUNNING)):
+                    self._load_data(experiment.results)
+                else:
+                    self.load_experiment(experiment)
                 self.plot.addItem(experiment.curve)
 
+    def _load_data(self, results):
+        """ Reads the data of an opened experiment on the loader threads """
+        self._loading[results] = os.path.getsize(results.data_filename)
+        self.loader.load_data(results)
+
+    def load_experiment(self, experiment):
+        """ Updates the curve of an experiment, which reads its data if it
+        is not loaded, and releases the data of hidden experiments if the
+        memory budget is exceeded
+        """
+        experiment.curve.update()
+        self._loaded_experiments.pop(experiment, None)
+        self._loaded_experiments[experiment] = True  # Most recently used last
+        self.unload_experiments()
+
+    def memory_usage(self):
+        """ Returns the number of bytes of the loaded data, and of the
+        files being loaded """
+        return (sum(experiment.results.memory_usage()
+                    for experiment in self._loaded_experiments) +
+                sum(self._loading.values()))
+
+    def unload_experiments(self):
+        """ Releases the data of the least recently shown experiments, until
+        the loaded data fits in the MEMORY_BUDGET. The hidden experiments
+        are released first, then the shown ones, which are hidden, apart
+        from the most recently shown experiment.
+        """
+        usage = {experiment: experiment.results.memory_usage()
+                 for experiment in self._loaded_experiments}
+        total = sum(usage.values()) + sum(self._loading.values())
+        for hidden_only in (True, False):
+            for experiment in list(self._loaded_experiments)[:-1]:
+                if total <= self.MEMORY_BUDGET:
+                    return
+                hidden = experiment.browser_item.checkState(0) == QtCore.Qt.Unchecked
+                if hidden_only and not hidden:
+                    continue
+                if experiment.procedure.status in (Procedure.QUEUED, Procedure.RUNNING):
+                    continue
+                if not hidden:
+                    self.browser.blockSignals(True)
+                    experiment.browser_item.setCheckState(0, QtCore.Qt.Unchecked)
+                    self.browser.blockSignals(False)
+                    self.plot.removeItem(experiment.curve)
+                experiment.curve.unload()
+                del self._loaded_experiments[experiment]
+                total -= usage[experiment]
+                log.debug("Released the data of %s" % experiment.data_filename)
+
     def browser_item_menu(self, position):
         item = self.browser.itemAt(position)
 
@@ -305,6 +386,7 @@ class ManagedWindow(QtGui.QMainWindow):
                                            QtGui.QMessageBox.No, QtGui.QMessageBox.No)
         if reply == QtGui.QMessageBox.Yes:
             self.manager.remove(experiment)
+            self._loaded_experiments.pop(experiment, None)
 
     def show_experiments(self):
         root = self.browser.invisibleRootItem()
@@ -320,6 +402,7 @@ class ManagedWindow(QtGui.QMainWindow):
 
     def clear_experiments(self):
         self.manager.clear()
+        self._loaded_experiments.clear()
 
     def open_experiment(self):
         dialog = ResultsDialog(self.procedure_class.DATA_COLUMNS, self.x_axis, self.y_axis)
@@ -333,12 +416,51 @@ class ManagedWindow(QtGui.QMainWindow):
                 elif filename == '':
                     return
                 else:
-                    results = Results.load(filename)
-                    experiment = self.new_experiment(results)
-                    experiment.curve.update()
-                    experiment.browser_item.progressbar.setValue(100.)
-                    self.manager.load(experiment)
-                    log.info('Opened data file %s' % filename)
+                    self.loader.load(filename, read_data=False)
+
+    def _experiment_with_results(self, results):
+        for experiment in self.manager.experiments:
+            if experiment.results is results:
+                return experiment
+        return None
+
+    def experiment_header_loaded(self, results):
+        """ Adds the experiment of a file whose header has been read, and
+        reads its data if it fits in the MEMORY_BUDGET, or hides it otherwise
+        """
+        experiment = self.new_experiment(results)
+        size = os.path.getsize(results.data_filename)
+        if self.memory_usage() + size <= self.MEMORY_BUDGET:
+            self._load_data(results)
+            self.manager.load(experiment)
+        else:
+            experiment.browser_item.setCheckState(0, QtCore.Qt.Unchecked)
+            self.manager.load(experiment)
+            self.plot.removeItem(experiment.curve)
+            log.info("Opened %s hidden, as its data exceeds the memory budget" %
+                     results.data_filename)
+
+    def experiment_load_progress(self, results, progress):
+        experiment = self._experiment_with_results(results)
+        if experiment is not None:
+            experiment.browser_item.setProgress(progress)
+
+    def experiment_loaded(self, results):
+        """ Shows the curve of an experiment whose data has been loaded """
+        self._loading.pop(results, None)
+        experiment = self._experiment_with_results(results)
+        if experiment is not None:
+            experiment.browser_item.setProgress(100.)
+            self.load_experiment(experiment)
+            log.info('Opened data file %s' % results.data_filename)
+
+    def experiment_load_failed(self, filename, error):
+        for results in list(self._loading):
+            if results.data_filename == filename:
+                del self._loading[results]
+        QtGui.QMessageBox.warning(self, "Load Error",
+                                  "The file %s could not be opened: %s" % (
+                                      os.path.basename(filename), error))
 
     def change_color(self, experiment):
         color = QtGui.QColorDialog.getColor(
@@ -464,6 +586,9 @@ class ManagedWindow(QtGui.QMainWindow):
             self.browser_widget.clear_button.setEnabled(True)
 
     def finished(self, experiment):
+        self._loaded_experiments.pop(experiment, None)
+        self._loaded_experiments[experiment] = True
+        self.unload_experiments()
         if not self.manager.experiments.has_next():
             self.abort_button.setEnabled(False)
             self.browser_widget.clear_button.setEnabled(True)
@@ -25,8 +25,10 @@
 from .parameters import (Parameter, IntegerParameter, FloatParameter,
                         VectorParameter, ListParameter, BooleanParameter, Measurable)
 from .procedure import Procedure, UnknownProcedure
-from .results import Results, unique_filename
+from .results import Results, BinaryResults, ResultsIndex, unique_filename, concat_results
+from .catalog import ResultsCatalog
 from .workers import Worker
 from .listeners import Listener, Recorder
+from .remote import ResultsServer, RemoteResults
 from .config import get_config
 from .experiment import Experiment, get_array, get_array_steps, get_array_zero
@@ -0,0 +1,219 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+import os
+import sqlite3
+
+from .compression import has_extension
+from .results import Results, BinaryResults, ResultsIndex
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class ResultsCatalog(object):
+    """ Indexes the data files in a directory tree into a local SQLite
+    database, storing the procedure, parameter values, modification time,
+    size and number of rows of each file. The index is updated
+    incrementally, parsing only the headers of new or modified files, and
+    can be queried by procedure and parameter values without reading the
+    files.
+
+    .. code-block:: python
+
+        catalog = ResultsCatalog('data')
+        catalog.update()
+        for results in catalog.query('IVProcedure', [('Field', '>', 1)]):
+            print(results.data_filename, results.data.shape)
+
+    Numeric parameter values are compared as numbers in the units in which
+    they are stored, and other values are compared as text.
+
+    :cvar CATALOG_FILENAME: The name of the database file in the directory
+    :cvar OPERATORS: The comparison operators supported in queries
+
+    :param directory: The root directory of the data files
+    :param extension: The extension of the data files (default: csv), which
+                      also matches the files compressed with gzip or zstd
+    :param database: The database filename, which defaults to
+                     CATALOG_FILENAME in the directory
+    """
+
+    CATALOG_FILENAME = '.pymeasure_catalog.sqlite'
+    OPERATORS = ('=', '!=', '<', '<=', '>', '>=')
+
+    def __init__(self, directory, extension='csv', database=None):
+        self.directory = os.path.abspath(directory)
+        self.extension = extension
+        if database is None:
+            database = os.path.join(self.directory, self.CATALOG_FILENAME)
+        self.database = database
+        self.connection = sqlite3.connect(database)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                procedure TEXT,
+                header TEXT NOT NULL,
+                header_count INTEGER NOT NULL,
+                rows INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS parameters (
+                file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+                name TEXT NOT NULL,
+                value TEXT,
+                number REAL,
+                units TEXT
+            );
+            CREATE INDEX IF NOT EXISTS parameters_name_number
+                ON parameters (name, number);
+            CREATE INDEX IF NOT EXISTS parameters_file ON parameters (file_id);
+        """)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+    def _scan(self):
+        """ Yields the path and stat result of each data file in the tree """
+        for root, directories, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if has_extension(filename, self.extension):
+                    path = os.path.join(root, filename)
+                    try:
+                        yield path, os.stat(path)
+                    except OSError:
+                        continue  # Removed while scanning
+
+    @staticmethod
+    def _number(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _insert(self, path, stat):
+        header, header_count = Results.read_header(path)
+        module, procedure_class, parameters = Results.parse_header_fields(header)
+        procedure = procedure_class if module is None else "%s.%s" % (
+            module, procedure_class)
+        rows = ResultsIndex.count_rows(path, header_count,
+                                       BinaryResults.parse_dtype(header))
+        cursor = self.connection.execute(
+            "INSERT INTO files (path, mtime, size, procedure, header, header_count, rows) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, stat.st_mtime, stat.st_size, procedure, header, header_count, rows))
+        self.connection.executemany(
+            "INSERT INTO parameters (file_id, name, value, number, units) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(cursor.lastrowid, name, value, self._number(value), units)
+             for name, (value, units) in parameters.items()])
+
+    def update(self):
+        """ Scans the directory tree, indexing new or modified files and
+        removing deleted files. Returns the number of indexed files.
+        """
+        known = {path: (mtime, size) for path, mtime, size in
+                 self.connection.execute("SELECT path, mtime, size FROM files")}
+        indexed = 0
+        with self.connection:
+            for path, stat in self._scan():
+                state = known.pop(path, None)
+                if state == (stat.st_mtime, stat.st_size):
+                    continue
+                if state is not None:
+                    self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                try:
+                    self._insert(path, stat)
+                    indexed += 1
+                except Exception:
+                    log.warning("Could not index %s" % path, exc_info=True)
+            self.connection.executemany("DELETE FROM files WHERE path = ?",
+                                        [(path,) for path in known])
+        log.info("%s indexed %d files in %s" % (
+            self.__class__.__name__, indexed, self.directory))
+        return indexed
+
+    def select(self, procedure=None, conditions=(), after=None, before=None):
+        """ Returns the sorted list of filenames matching the query
+
+        :param procedure: Name of the procedure class, optionally with its module
+        :param conditions: Iterable of (parameter name, operator, value) tuples,
+                           where the operator is one of OPERATORS
+        :param after: Only match files modified after this timestamp (or datetime)
+        :param before: Only match files modified before this timestamp (or datetime)
+        """
+        query = "SELECT path FROM files WHERE 1"
+        arguments = []
+        if procedure is not None:
+            query += " AND (procedure = ? OR procedure LIKE ?)"
+            arguments += [procedure, '%.' + procedure]
+        for name, operator, value in conditions:
+            if operator not in self.OPERATORS:
+                raise ValueError("Unsupported operator '%s' in catalog query" % operator)
+            column = 'value' if self._number(value) is None else 'number'
+            query += (" AND id IN (SELECT file_id FROM parameters "
+                      "WHERE name = ? AND %s %s ?)" % (column, operator))
+            arguments += [name, value if column == 'value' else float(value)]
+        for timestamp, operator in ((after, '>'), (before, '<')):
+            if timestamp is not None:
+                if hasattr(timestamp, 'timestamp'):
+                    timestamp = timestamp.timestamp()
+                query += " AND mtime %s ?" % operator
+                arguments.append(timestamp)
+        query += " ORDER BY path"
+        return [path for path, in self.connection.execute(query, arguments)]
+
+    def query(self, procedure=None, conditions=(), after=None, before=None,
+              procedure_class=None):
+        """ Yields a :class:`.Results` object for each file matching the query,
+        as described in :meth:`.select`. The procedures are reconstructed
+        from the indexed headers and the data is read on its first access.
+        """
+        for path in self.select(procedure, conditions, after, before):
+            header, header_count = self.connection.execute(
+                "SELECT header, header_count FROM files WHERE path = ?", (path,)).fetchone()
+            results = Results(Results.parse_header(header, procedure_class), path)
+            results._header_count = header_count
+            yield results
+
+    def parameters(self, data_filename):
+        """ Returns a dictionary of the (value, units) of each parameter of
+        an indexed file
+        """
+        return {name: (value, units) for name, value, units in self.connection.execute(
+            "SELECT name, value, units FROM parameters JOIN files ON files.id = file_id "
+            "WHERE path = ?", (os.path.abspath(data_filename),))}
+
+    def close(self):
+        """ Closes the database """
+        self.connection.close()
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __repr__(self):
+        return "<{}(directory='{}',files={})>".format(
+            self.__class__.__name__, self.directory, len(self))
@@ -0,0 +1,169 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+import gzip
+import io
+import os
+import time
+import zlib
+from logging import FileHandler
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
+
+
+def compression(filename):
+    """ Returns the compression of a file, 'gzip' or 'zstd', inferred from
+    its extension, or None if the file is not compressed
+    """
+    return COMPRESSIONS.get(os.path.splitext(filename)[1].lower())
+
+
+def has_extension(filename, extension):
+    """ Returns True if the filename ends with the extension, which may be
+    followed by the extension of a compression, e.g. 'data.csv.gz' for csv
+    """
+    name, ext = os.path.splitext(filename)
+    if ext.lower() in COMPRESSIONS:
+        filename = name
+    return filename.endswith('.' + extension)
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ImportError("zstandard is required for zstd compressed results, "
+                          "which is installed with the zstd extra of pymeasure")
+
+
+def open_file(filename, mode='r', **kwargs):
+    """ Opens a file like :code:`open`, compressing or decompressing the
+    stream according to the extension of the filename
+    """
+    kind = compression(filename)
+    if kind == 'gzip':
+        if 'b' not in mode and 't' not in mode:
+            mode += 't'
+        return gzip.open(filename, mode, **kwargs)
+    elif kind == 'zstd':
+        _require_zstandard()
+        f = zstandard.open(filename, mode, **kwargs)
+        if mode == 'rb':
+            return io.BufferedReader(f)  # Supports reading lines
+        return f
+    return open(filename, mode, **kwargs)
+
+
+class StreamReader(object):
+    """ Reads the lines appended to a compressed file, which may still be
+    written. The decompression state is kept between the reads, so that
+    only the new part of the file is decompressed, and an incomplete last
+    line is held back until it is completed.
+
+    :param filename: The compressed file
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.kind = compression(filename)
+        if self.kind == 'zstd':
+            _require_zstandard()
+        self.reset()
+
+    def reset(self):
+        """ Restarts reading from the beginning of the file """
+        self.position = 0
+        self._decompressor = None
+        self._remainder = b''
+
+    def _new_decompressor(self):
+        if self.kind == 'zstd':
+            return zstandard.ZstdDecompressor().decompressobj()
+        return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+
+    def _decompress(self, raw):
+        """ Decompresses the stream, which may consist of several members
+        (gzip) or frames (zstd) appended to each other
+        """
+        blocks = []
+        while raw:
+            if self._decompressor is None:
+                self._decompressor = self._new_decompressor()
+            blocks.append(self._decompressor.decompress(raw))
+            if self._decompressor.eof:
+                raw = self._decompressor.unused_data
+                self._decompressor = None
+            else:
+                raw = b''
+        return b''.join(blocks)
+
+    def read_lines(self, size=-1):
+        """ Returns the text of the complete lines written since the
+        last read, reading at most size bytes of the file if positive
+        """
+        with open(self.filename, 'rb') as f:
+            f.seek(self.position)
+            raw = f.read(size)
+        self.position += len(raw)
+        text = self._remainder + self._decompress(raw)
+        end = text.rfind(b'\n') + 1
+        self._remainder = text[end:]
+        return text[:end].decode()
+
+
+class CompressedFileHandler(FileHandler):
+    """ File handler that appends the formatted data to a compressed file.
+    The compressed stream is flushed at most every flush_interval seconds,
+    at which point the data written so far can be read back, so that the
+    stream is not fragmented into many small compressed blocks.
+
+    :param filename: The compressed file, with a .gz or .zst extension
+    :param flush_interval: The minimum time in seconds between flushes
+    """
+
+    FLUSH_INTERVAL = 1.
+
+    def __init__(self, filename, flush_interval=None, **kwargs):
+        kwargs.pop('mode', None)
+        self.flush_interval = (self.FLUSH_INTERVAL if flush_interval is None
+                               else flush_interval)
+        self._flushed = time.monotonic()
+        super().__init__(filename, mode='a', **kwargs)
+
+    def _open(self):
+        return open_file(self.baseFilename, self.mode, encoding=self.encoding)
+
+    def flush(self):
+        now = time.monotonic()
+        if now - self._flushed >= self.flush_interval:
+            super().flush()
+            self._flushed = now
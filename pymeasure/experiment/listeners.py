@@ -53,33 +53,35 @@ class Listener(StoppableThread):
     a ZMQ TCP port and can be stopped by a thread-safe method call
     """
 
-    def __init__(self, port, topic='', timeout=0.01):
+    def __init__(self, port, topic='', timeout=0.01, host='localhost'):
         """ Constructs the Listener object with a subscriber port
         over which to listen for messages
 
         :param port: TCP port to listen on
         :param topic: Topic to listen on
         :param timeout: Timeout in seconds to recheck stop flag
+        :param host: Host name or address of the publisher (default: localhost)
         """
         super().__init__()
 
         self.port = port
         self.topic = topic
+        self.host = host
         self.context = zmq.Context()
         log.debug("%s has ZMQ Context: %r" % (self.__class__.__name__, self.context))
         self.subscriber = self.context.socket(zmq.SUB)
-        self.subscriber.connect('tcp://localhost:%d' % port)
+        self.subscriber.connect('tcp://%s:%d' % (host, port))
         self.subscriber.setsockopt(zmq.SUBSCRIBE, topic.encode())
-        log.info("%s connected to '%s' topic on tcp://localhost:%d" % (
-            self.__class__.__name__, topic, port))
+        log.info("%s connected to '%s' topic on tcp://%s:%d" % (
+            self.__class__.__name__, topic, host, port))
 
         self.poller = zmq.Poller()
         self.poller.register(self.subscriber, zmq.POLLIN)
         self.timeout = timeout
 
     def receive(self, flags=0):
-        topic, record = self.subscriber.recv_serialized(deserialize=cloudpickle.loads, flags=flags)
-        return topic, record
+        topic, record = self.subscriber.recv_multipart(flags=flags)
+        return topic.decode(), cloudpickle.loads(record)
 
     def message_waiting(self):
         return self.poller.poll(self.timeout)
@@ -99,11 +101,17 @@ class Recorder(QueueListener):
         """ Constructs a Recorder to record the Procedure data into
         the file path, by waiting for data on the subscription port
         """
-        handlers = []
-        for filename in results.data_filenames:
-            fh = FileHandler(filename=filename, **kwargs)
-            fh.setFormatter(results.formatter)
-            fh.setLevel(logging.NOTSET)
-            handlers.append(fh)
+        handlers = [results.handler(filename, **kwargs)
+                    for filename in results.data_filenames]
 
+        self.results = results
         super().__init__(queue, *handlers)
+
+    def handle(self, record):
+        super().handle(record)
+        self.results.mark_updated()
+
+    def close(self):
+        """ Closes the files, which completes compressed streams """
+        for handler in self.handlers:
+            handler.close()
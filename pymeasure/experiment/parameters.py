@@ -22,6 +22,8 @@
 # THE SOFTWARE.
 #
 
+import time
+
 
 class Parameter(object):
     """ Encapsulates the information for an experiment parameter
@@ -400,17 +402,24 @@ class Measurable(object):
     if never set).
 
     :var value: The value of the parameter
+    :var timestamp: The time at which the value was last measured
 
     :param name: The parameter name
     :param fget: The parameter fget function (e.g. an instrument parameter)
     :param default: The default value
+    :param bus: The instrument or bus that the fget function communicates
+                with, which allows a :class:`.Procedure` to measure the
+                Measurables of different buses concurrently
     """
     DATA_COLUMNS = []
 
-    def __init__(self, name, fget=None, units=None, measure=True, default=None, **kwargs):
+    def __init__(self, name, fget=None, units=None, measure=True, default=None,
+                 bus=None, **kwargs):
         self.name = name
         self.units = units
         self.measure = measure
+        self.bus = bus
+        self.timestamp = None
         if fget is not None:
             self.fget = fget
             self._value = fget()
@@ -425,6 +434,7 @@ class Measurable(object):
     def value(self):
         if hasattr(self, 'fget'):
             self._value = self.fget()
+        self.timestamp = time.time()
         return self._value
 
     @value.setter
@@ -24,7 +24,8 @@
 
 import logging
 import sys
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from importlib.machinery import SourceFileLoader
 
 from .parameters import Parameter, Measurable
@@ -51,10 +52,28 @@ class Procedure(object):
     
     If keyword arguments are provided, they are added to the object as
     attributes.
+
+    The Parameter and Measurable attributes of a procedure class are
+    looked up once, on the construction of its first instance, so that
+    Parameters should be defined as class attributes.
+
+    The optional DATA_TYPES dictionary declares the type of data columns
+    (e.g. :code:`{'Iteration': 'int32', 'Voltage': 'float32'}`), which the
+    :class:`.Results` use when reading the data instead of inferring it.
+
+    With MEASURE_CONCURRENTLY, :meth:`.get_datapoint` measures the
+    Measurables of each bus in a separate thread, so that the time of a
+    datapoint is that of the slowest bus instead of the sum of all of them.
+    The Measurables of a bus, and those without a bus, are measured in turn.
+    With MEASURE_TIMESTAMPS, the time at which each Measurable was measured
+    is added to the datapoint as a '<name> Time' column.
     """
 
     DATA_COLUMNS = []
+    DATA_TYPES = {}
     MEASURE = {}
+    MEASURE_CONCURRENTLY = False
+    MEASURE_TIMESTAMPS = False
     FINISHED, FAILED, ABORTED, QUEUED, RUNNING = 0, 1, 2, 3, 4
     STATUS_STRINGS = {
         FINISHED: 'Finished', FAILED: 'Failed', 
@@ -78,7 +97,7 @@ class Procedure(object):
         # TODO: Refactor measurable-s implementation to be consistent with parameters
 
         self.MEASURE = {}
-        for item in dir(self):
+        for item in self._attribute_names()[1]:
             parameter = getattr(self, item)
             if isinstance(parameter, Measurable):
                 if parameter.measure:
@@ -86,9 +105,38 @@ class Procedure(object):
 
         if not self.DATA_COLUMNS:
             self.DATA_COLUMNS = Measurable.DATA_COLUMNS
+        if self.MEASURE_TIMESTAMPS:
+            self.DATA_COLUMNS = list(self.DATA_COLUMNS) + [
+                key + " Time" for key in self.MEASURE
+                if key + " Time" not in self.DATA_COLUMNS]
+
+    def _measure_bus(self, keys):
+        """ Returns the values and timestamps of the Measurables of a bus,
+        which are measured in turn
+        """
+        data = {}
+        for key in keys:
+            measurable = getattr(self, self.MEASURE[key])
+            data[key] = measurable.value
+            if self.MEASURE_TIMESTAMPS:
+                data[key + " Time"] = measurable.timestamp
+        return data
 
     def get_datapoint(self):
-        data = {key: getattr(self, self.MEASURE[key]).value for key in self.MEASURE}
+        if not self.MEASURE_CONCURRENTLY:
+            return self._measure_bus(self.MEASURE)
+
+        buses = {}
+        for key in self.MEASURE:
+            bus = getattr(self, self.MEASURE[key]).bus
+            buses.setdefault(bus, []).append(key)
+        data = {}
+        with ThreadPoolExecutor(max_workers=len(buses) or 1,
+                                thread_name_prefix='measure') as executor:
+            futures = [executor.submit(self._measure_bus, keys)
+                       for keys in buses.values()]
+            for future in futures:
+                data.update(future.result())
         return data
 
     def measure(self):
@@ -96,6 +144,22 @@ class Procedure(object):
         log.debug("Produced numbers: %s" % data)
         self.emit('results', data)
 
+    @classmethod
+    def _attribute_names(cls):
+        """ Returns the names of the Parameter and Measurable attributes of
+        the class, which are looked up once and cached in the class
+        """
+        if '_attribute_cache' not in cls.__dict__:
+            parameters, measurables = [], []
+            for item in dir(cls):
+                attribute = getattr(cls, item, None)
+                if isinstance(attribute, Parameter):
+                    parameters.append(item)
+                elif isinstance(attribute, Measurable):
+                    measurables.append(item)
+            cls._attribute_cache = (parameters, measurables)
+        return cls._attribute_cache
+
     def _update_parameters(self):
         """ Collects all the Parameter objects for the procedure and stores
         them in a meta dictionary so that the actual values can be set in 
@@ -103,10 +167,11 @@ class Procedure(object):
         """
         if not self._parameters:
             self._parameters = {}
-        for item in dir(self):
+        for item in self._attribute_names()[0]:
             parameter = getattr(self, item)
             if isinstance(parameter, Parameter):
-                self._parameters[item] = deepcopy(parameter)
+                # Only the value differs between instances
+                self._parameters[item] = copy(parameter)
                 if parameter.is_set():
                     setattr(self, item, parameter.value)
                 else:
@@ -0,0 +1,308 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+
+import pandas as pd
+
+from .results import Results
+from ..thread import StoppableThread
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+try:
+    import zmq
+    import cloudpickle
+except ImportError:
+    zmq = None
+    cloudpickle = None
+    log.warning("ZMQ and cloudpickle are required for TCP communication")
+
+
+def _topic(name, step=None):
+    """ Returns the ZMQ topic frame for a stream. A trailing slash keeps
+    the prefix matching of subscriptions exact, so that 'results/1/' does
+    not also match 'results/10/'.
+    """
+    if step is None:
+        return ('%s/' % name).encode()
+    return ('%s/%d/' % (name, step)).encode()
+
+
+class ResultsServer(StoppableThread):
+    """ ResultsServer subscribes to the messages published by a
+    :class:`.Worker` and serves them to any number of remote clients.
+    Clients that join late first request a snapshot of all the data
+    recorded so far and then apply the live deltas that follow it.
+
+    The Worker publishes each message as a topic frame followed by the
+    pickled record. Every datapoint is given a sequence number, which is published along
+    with the record on the 'results/1/' topic. For slow clients, the
+    records with a sequence number divisible by each of the ``decimations``
+    are also published on a 'results/<step>/' topic. All other messages
+    of the Worker (status, progress, ...) are forwarded on a '<topic>/'
+    topic.
+
+    The server must be started before the Worker, since messages that are
+    published before the subscription is established are not received
+    (as for any :class:`.Listener`).
+
+    .. code-block:: python
+
+        results = Results(procedure, data_filename)
+        server = ResultsServer(results, port=5888, publish_port=5889,
+                               snapshot_port=5890, decimations=(10, 100))
+        server.start()
+        worker = Worker(results, port=5888)
+        worker.start()
+
+    :param results: :class:`.Results` object of the run being served
+    :param port: TCP port on which the Worker publishes
+    :param publish_port: TCP port on which the live deltas are published
+    :param snapshot_port: TCP port on which snapshots are served
+    :param host: Host name or address of the Worker (default: localhost)
+    :param decimations: Iterable of integer steps of the downsampled streams
+    :param timeout: Timeout in seconds to recheck stop flag
+    """
+
+    def __init__(self, results, port, publish_port, snapshot_port,
+                 host='localhost', decimations=(), timeout=0.01):
+        super().__init__()
+        if zmq is None:
+            raise ImportError("ZMQ and cloudpickle are required for the ResultsServer")
+        self.results = results
+        self.port = port
+        self.publish_port = publish_port
+        self.snapshot_port = snapshot_port
+        self.host = host
+        self.decimations = tuple(int(step) for step in decimations if int(step) > 1)
+        self.timeout = timeout
+
+        self.status = results.procedure.status
+        self._records = []
+
+    def snapshot(self, step=1):
+        """ Returns a dictionary with the header, the data recorded so far
+        (every step-th record) and the sequence number of the last record
+        """
+        step = max(int(step), 1)
+        return {
+            'header': self.results.header(),
+            'columns': list(self.results.procedure.DATA_COLUMNS),
+            'data_filename': self.results.data_filename,
+            'status': self.status,
+            'sequence': len(self._records) - 1,
+            'records': self._records[::step],
+        }
+
+    def handle(self, topic, record, publisher):
+        """ Stores a message received from the Worker and publishes it
+        to the clients
+        """
+        if topic == 'results':
+            sequence = len(self._records)
+            self._records.append(record)
+            message = cloudpickle.dumps((sequence, record))
+            publisher.send_multipart([_topic('results', 1), message])
+            for step in self.decimations:
+                if sequence % step == 0:
+                    publisher.send_multipart([_topic('results', step), message])
+        else:
+            if topic == 'status':
+                self.status = record
+            publisher.send_multipart([_topic(topic), cloudpickle.dumps(record)])
+
+    def run(self):
+        context = zmq.Context()
+        subscriber = context.socket(zmq.SUB)
+        subscriber.connect('tcp://%s:%d' % (self.host, self.port))
+        subscriber.setsockopt(zmq.SUBSCRIBE, b'')
+        publisher = context.socket(zmq.PUB)
+        publisher.bind('tcp://*:%d' % self.publish_port)
+        snapshots = context.socket(zmq.REP)
+        snapshots.bind('tcp://*:%d' % self.snapshot_port)
+        log.info("%s relaying tcp://%s:%d on ports %d (deltas) and %d (snapshots)" % (
+            self.__class__.__name__, self.host, self.port,
+            self.publish_port, self.snapshot_port))
+
+        poller = zmq.Poller()
+        poller.register(subscriber, zmq.POLLIN)
+        poller.register(snapshots, zmq.POLLIN)
+        try:
+            while not self.should_stop():
+                events = dict(poller.poll(int(self.timeout * 1e3)))
+                if subscriber in events:
+                    topic, record = subscriber.recv_multipart()
+                    self.handle(topic.decode(), cloudpickle.loads(record), publisher)
+                if snapshots in events:
+                    request = cloudpickle.loads(snapshots.recv())
+                    snapshots.send(cloudpickle.dumps(self.snapshot(**request)))
+        finally:
+            for socket in (subscriber, publisher, snapshots):
+                socket.close(linger=0)
+            context.term()
+            log.info("%s stopped" % self.__class__.__name__)
+
+    def __repr__(self):
+        return "<%s(port=%s,publish_port=%s,snapshot_port=%s,should_stop=%s)>" % (
+            self.__class__.__name__, self.port, self.publish_port,
+            self.snapshot_port, self.should_stop())
+
+
+class RemoteResults(object):
+    """ Provides a read-only, :class:`.Results`-like view of a run that is
+    served by a :class:`.ResultsServer`, possibly on another machine.
+    On construction a snapshot of the existing data is requested, and
+    each access of :attr:`.data` appends the records that have been
+    received since. If a gap in the sequence of records is detected,
+    the snapshot is requested again.
+
+    :param host: Host name or address of the ResultsServer
+    :param publish_port: TCP port on which the server publishes deltas
+    :param snapshot_port: TCP port on which the server serves snapshots
+    :param step: Downsampling step, which must be 1 or one of the
+                 decimations of the server (default: 1)
+    :param procedure_class: Procedure class used to parse the header
+    :param timeout: Timeout in seconds to wait for a snapshot
+    """
+
+    def __init__(self, host, publish_port, snapshot_port, step=1,
+                 procedure_class=None, timeout=5.):
+        if zmq is None:
+            raise ImportError("ZMQ and cloudpickle are required for RemoteResults")
+        self.host = host
+        self.publish_port = publish_port
+        self.snapshot_port = snapshot_port
+        self.step = max(int(step), 1)
+        self.procedure_class = procedure_class
+        self.timeout = timeout
+
+        self.context = zmq.Context()
+        self.subscriber = self.context.socket(zmq.SUB)
+        self.subscriber.connect('tcp://%s:%d' % (host, publish_port))
+        self.subscriber.setsockopt(zmq.SUBSCRIBE, _topic('results', self.step))
+        self.subscriber.setsockopt(zmq.SUBSCRIBE, _topic('status'))
+        self.subscriber.setsockopt(zmq.SUBSCRIBE, _topic('progress'))
+
+        self.procedure = None
+        self.progress = 0.
+        self._pending = []
+        self.resync()
+
+    def _request_snapshot(self):
+        requester = self.context.socket(zmq.REQ)
+        requester.connect('tcp://%s:%d' % (self.host, self.snapshot_port))
+        try:
+            requester.send(cloudpickle.dumps({'step': self.step}))
+            if not requester.poll(int(self.timeout * 1e3)):
+                raise TimeoutError("No snapshot received from tcp://%s:%d" % (
+                    self.host, self.snapshot_port))
+            return cloudpickle.loads(requester.recv())
+        finally:
+            requester.close(linger=0)
+
+    def resync(self):
+        """ Requests a snapshot of the data from the server, replacing
+        all the data received so far
+        """
+        snapshot = self._request_snapshot()
+        if self.procedure is None:
+            try:
+                self.procedure = Results.parse_header(
+                    snapshot['header'][:-1], self.procedure_class)
+            except Exception:
+                log.warning("Could not reconstruct the procedure of %s" % (
+                    snapshot['data_filename']), exc_info=True)
+        if self.procedure is not None:
+            self.procedure.status = snapshot['status']
+        self.data_filename = snapshot['data_filename']
+        self.columns = snapshot['columns']
+        self._sequence = snapshot['sequence']
+        self._pending = []
+        self._data = pd.DataFrame(snapshot['records'], columns=self.columns)
+
+    def _next_sequence(self):
+        """ Returns the sequence number of the next expected record """
+        return (self._sequence // self.step + 1) * self.step
+
+    def receive(self):
+        """ Collects all messages that are waiting, without blocking """
+        while self.subscriber.poll(0):
+            topic, message = self.subscriber.recv_multipart()
+            if topic == _topic('results', self.step):
+                sequence, record = cloudpickle.loads(message)
+                if sequence <= self._sequence:
+                    continue  # Already part of the snapshot
+                if sequence > self._next_sequence():
+                    log.info("%s missed records, requesting a new snapshot" % (
+                        self.__class__.__name__))
+                    self.resync()
+                    continue
+                self._pending.append(record)
+                self._sequence = sequence
+            elif topic == _topic('status'):
+                if self.procedure is not None:
+                    self.procedure.status = cloudpickle.loads(message)
+            elif topic == _topic('progress'):
+                self.progress = cloudpickle.loads(message)
+
+    @property
+    def revision(self):
+        """ Sequence number of the last record received, which changes
+        whenever new data is available
+        """
+        self.receive()
+        return self._sequence
+
+    @property
+    def data(self):
+        self.receive()
+        if self._pending:
+            new_data = pd.DataFrame(self._pending, columns=self.columns)
+            self._pending = []
+            if len(self._data) == 0:
+                self._data = new_data
+            else:
+                self._data = pd.concat([self._data, new_data], ignore_index=True)
+        return self._data
+
+    def column(self, name):
+        """ Returns the values of a data column as an array """
+        return self.data[name].values
+
+    def reload(self):
+        """ Requests a full snapshot of the data from the server """
+        self.resync()
+
+    def close(self):
+        """ Closes the connections to the server """
+        self.subscriber.close(linger=0)
+        self.context.term()
+
+    def __repr__(self):
+        return "<{}(host='{}',filename='{}',step={},shape={})>".format(
+            self.__class__.__name__, self.host, self.data_filename,
+            self.step, self.data.shape
+        )
@@ -23,61 +23,200 @@
 #
 
 import logging
+from logging import FileHandler
 
+import json
 import os
 import re
 import sys
+import threading
+import zlib
 from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 from importlib.machinery import SourceFileLoader
 from datetime import datetime
+from io import StringIO
 
+import numpy as np
 import pandas as pd
 
 from .procedure import Procedure, UnknownProcedure
 from .parameters import Parameter
+from .compression import (compression, has_extension, open_file, StreamReader,
+                          CompressedFileHandler)
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Arguments of read_csv that skip malformed lines, which changed in pandas 1.3
+if tuple(int(v) for v in re.findall(r'\d+', pd.__version__)[:2]) >= (1, 3):
+    _SKIP_BAD_LINES = {'on_bad_lines': 'skip'}
+else:
+    _SKIP_BAD_LINES = {'error_bad_lines': False, 'warn_bad_lines': False}
+
+
+_last_indices = {}
+_last_indices_lock = threading.Lock()
+
+
+def _last_index(directory, basename, suffix, ext):
+    """ Returns the highest index of the existing files, scanning the
+    directory only once for each base name
+    """
+    key = (directory, basename, suffix, ext)
+    if key not in _last_indices:
+        pattern = re.compile(r"%s_(\d+)%s\.%s$" % (
+            re.escape(basename), re.escape(suffix), re.escape(ext)))
+        last = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match:
+                    last = max(last, int(match.group(1)))
+        _last_indices[key] = last
+    return _last_indices[key]
+
 
 def unique_filename(directory, prefix='DATA', suffix='', ext='csv',
                     dated_folder=False, index=True, datetimeformat="%Y-%m-%d"):
     """ Returns a unique filename based on the directory and prefix
+
+    With an index, the directory is scanned once for the highest index
+    in use, which is then cached, and the file is created empty so that
+    concurrent threads and processes never get the same filename.
     """
     now = datetime.now()
     directory = os.path.abspath(directory)
     if dated_folder:
         directory = os.path.join(directory, now.strftime('%Y-%m-%d'))
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    os.makedirs(directory, exist_ok=True)
     if index:
-        i = 1
         basename = "%s%s" % (prefix, now.strftime(datetimeformat))
         basepath = os.path.join(directory, basename)
-        filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
-        while os.path.exists(filename):
-            i += 1
-            filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
+        with _last_indices_lock:
+            i = _last_index(directory, basename, suffix, ext)
+            while True:
+                i += 1
+                filename = "%s_%d%s.%s" % (basepath, i, suffix, ext)
+                try:
+                    os.close(os.open(filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                except FileExistsError:
+                    continue  # Created by another process
+                break
+            _last_indices[(directory, basename, suffix, ext)] = i
     else:
         basename = "%s%s%s.%s" % (prefix, now.strftime(datetimeformat), suffix, ext)
         filename = os.path.join(directory, basename)
     return filename
 
 
+def _read_data_file(data_filename, columns=None, parameters=None, downcast=True):
+    """ Returns the data of a file as a DataFrame, with a column for each
+    of the parameters in the header, and the list of parameter names. Used
+    by :func:`.concat_results`, which runs it in worker processes.
+    """
+    header, _ = Results.read_header(data_filename)
+    _, _, header_parameters = Results.parse_header_fields(header)
+    data = pd.read_csv(data_filename, comment=Results.COMMENT, usecols=columns)
+    if downcast:
+        for column in data.select_dtypes('float').columns:
+            values = data[column].astype(np.float32)
+            # Only downcast if no precision is lost (e.g. not for timestamps)
+            if np.array_equal(values.to_numpy(np.float64), data[column].to_numpy(),
+                              equal_nan=True):
+                data[column] = values
+        for column in data.select_dtypes('integer').columns:
+            data[column] = pd.to_numeric(data[column], downcast='integer')
+    if parameters is None:
+        parameters = list(header_parameters)
+    for name in parameters:
+        value = header_parameters.get(name, (None, None))[0]
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            pass
+        data[name] = value
+    return data, parameters
+
+
+def concat_results(data_filenames, columns=None, parameters=None, filename_column=None,
+                   categorical=True, downcast=True, processes=None):
+    """ Returns a single DataFrame with the data of several data files, which
+    are read in parallel by a pool of processes. The parameter values found
+    in the header of each file are added as columns, so that the runs can
+    be told apart and grouped. As the pool spawns processes, scripts calling
+    this function should guard their main code with
+    :code:`if __name__ == '__main__':`.
+
+    .. code-block:: python
+
+        data = concat_results(glob('data/*.csv'), columns=['Voltage', 'Current'],
+                              parameters=['Magnetic Field'])
+        data.groupby('Magnetic Field').mean()
+
+    :param data_filenames: List of data filenames
+    :param columns: Optional list of the data columns to read
+    :param parameters: Optional list of the parameter names to add as
+                       columns, which defaults to all parameters
+    :param filename_column: Optional name of a column holding the filename
+    :param categorical: If True, the parameter and filename columns are
+                        stored as categories, which saves memory
+    :param downcast: If True, integer data columns are downcast to the
+                     smallest integer type holding their values, and float
+                     columns to 32 bit floats if their values are unchanged
+    :param processes: Number of processes, which defaults to the number of
+                      CPUs. With 1 process, the files are read sequentially.
+    """
+    data_filenames = list(data_filenames)
+    arguments = (columns, parameters, downcast)
+    if processes == 1 or len(data_filenames) <= 1:
+        loaded = [_read_data_file(filename, *arguments) for filename in data_filenames]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            loaded = list(executor.map(
+                _read_data_file, data_filenames,
+                *[[argument] * len(data_filenames) for argument in arguments]))
+    if not loaded:
+        return pd.DataFrame(columns=columns)
+
+    frames = [frame for frame, _ in loaded]
+    names = []
+    for _, frame_parameters in loaded:
+        names.extend(name for name in frame_parameters if name not in names)
+    if filename_column is not None:
+        for filename, frame in zip(data_filenames, frames):
+            frame[filename_column] = filename
+        names.append(filename_column)
+
+    data = pd.concat(frames, ignore_index=True)
+    if categorical:
+        for name in names:
+            data[name] = data[name].astype('category')
+    return data
+
+
+def crc32(line):
+    """ Returns the CRC32 checksum of a line as 8 hexadecimal digits """
+    return '%08x' % zlib.crc32(line.encode())
+
+
 class CSVFormatter(logging.Formatter):
     """ Formatter of data results """
 
-    def __init__(self, columns, delimiter=','):
+    def __init__(self, columns, delimiter=',', checksum=False):
         """Creates a csv formatter for a given list of columns (=header).
 
         :param columns: list of column names.
         :type columns: list
         :param delimiter: delimiter between columns.
         :type delimiter: str
+        :param checksum: append the CRC32 of each line as a comment.
+        :type checksum: bool
         """
         super().__init__()
         self.columns = columns
         self.delimiter = delimiter
+        self.checksum = checksum
 
     def format(self, record):
         """Formats a record as csv.
@@ -86,12 +225,59 @@ class CSVFormatter(logging.Formatter):
         :type record: dict
         :return: a string
         """
-        return self.delimiter.join('{}'.format(record[x]) for x in self.columns)
+        line = self.delimiter.join('{}'.format(record[x]) for x in self.columns)
+        if self.checksum:
+            line += Results.COMMENT + crc32(line)
+        return line
 
     def format_header(self):
         return self.delimiter.join(self.columns)
 
 
+class BinaryFormatter(logging.Formatter):
+    """ Formatter of data results as fixed-width binary records """
+
+    def __init__(self, columns, dtype):
+        """Creates a binary formatter for a given list of columns (=header).
+
+        :param columns: list of column names.
+        :type columns: list
+        :param dtype: structured numpy data type of a record.
+        :type dtype: numpy.dtype
+        """
+        super().__init__()
+        self.columns = columns
+        self.dtype = np.dtype(dtype)
+
+    def format(self, record):
+        """Formats a record as the bytes of a structured array element.
+
+        :param record: record to format.
+        :type record: dict
+        :return: bytes
+        """
+        return np.array(tuple(record[x] for x in self.dtype.names),
+                        dtype=self.dtype).tobytes()
+
+    def format_header(self):
+        return ','.join(self.columns)
+
+
+class BinaryFileHandler(FileHandler):
+    """ File handler that appends the bytes of formatted records """
+
+    def __init__(self, filename, **kwargs):
+        kwargs.pop('mode', None)
+        kwargs.pop('encoding', None)
+        super().__init__(filename, mode='ab', **kwargs)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.write(self.format(record))
+        self.flush()
+
+
 class Results(object):
     """ The Results class provides a convenient interface to reading and
     writing data in connection with a :class:`.Procedure` object.
@@ -100,26 +286,56 @@ class Results(object):
     :cvar DELIMITER: The character used to delimit the data (default: ,)
     :cvar LINE_BREAK: The character used for line breaks (default \\n)
     :cvar CHUNK_SIZE: The length of the data chuck that is read
+    :cvar BLOCK_SIZE: The number of bytes read at once when reloading
+
+    :ivar revision: Counter incremented each time new data is written to
+                    the file by a :class:`.Recorder`, which allows readers
+                    to skip polling the file when nothing has changed
+
+    If the data file already exists and is not empty, only the header is
+    used on construction and the data is read on the first access of
+    :attr:`.data`.
+    The data columns are read with the types declared in the DATA_TYPES of
+    the procedure, and the read can be restricted to a subset of the
+    columns with :meth:`.set_columns`.
+
+    Only complete lines are read, so that a line that is being written is
+    read once it is complete. With ``checksum``, the CRC32 of each line is
+    appended as a comment, which readers ignore, and :meth:`.recover`
+    truncates the file of a crashed run after the last valid record.
+
+    Files with a .gz or .zst extension are written as gzip or zstd
+    compressed streams, which are flushed periodically, and are read back
+    incrementally while they are written.
 
     :param procedure: Procedure object
     :param data_filename: The data filename where the data is or should be
                           stored
+    :param columns: Optional list of the data columns to read
+    :param checksum: Append the CRC32 checksum of each line written
     """
 
     COMMENT = '#'
     DELIMITER = ','
     LINE_BREAK = "\n"
     CHUNK_SIZE = 1000
+    BLOCK_SIZE = 1 << 20
 
-    def __init__(self, procedure, data_filename):
+    def __init__(self, procedure, data_filename, columns=None, checksum=False):
         if not isinstance(procedure, Procedure):
             raise ValueError("Results require a Procedure object")
         self.procedure = procedure
         self.procedure_class = procedure.__class__
         self.parameters = procedure.parameter_objects()
         self._header_count = -1
+        self._columns = None if columns is None else list(columns)
+        self._labels = None
+        self._stream = None
+        self._position = 0
+        self.revision = 0
 
-        self.formatter = CSVFormatter(columns=self.procedure.DATA_COLUMNS)
+        self.formatter = CSVFormatter(columns=self.procedure.DATA_COLUMNS,
+                                      checksum=checksum)
 
         if isinstance(data_filename, (list, tuple)):
             data_filenames, data_filename = data_filename, data_filename[0]
@@ -129,13 +345,14 @@ class Results(object):
         self.data_filename = data_filename
         self.data_filenames = data_filenames
 
-        if os.path.exists(data_filename):  # Assume header is already written
-            self.reload()
+        if os.path.exists(data_filename) and os.path.getsize(data_filename) > 0:
+            # Assume header is already written
+            self._data = None  # Data is read on the first access
             self.procedure.status = Procedure.FINISHED
             # TODO: Correctly store and retrieve status
         else:
             for filename in self.data_filenames:
-                with open(filename, 'w') as f:
+                with open_file(filename, 'w') as f:
                     f.write(self.header())
                     f.write(self.labels())
             self._data = None
@@ -189,6 +406,22 @@ class Results(object):
         h = [Results.COMMENT + l for l in h]  # Comment each line
         return Results.LINE_BREAK.join(h) + Results.LINE_BREAK
 
+    def handler(self, filename, **kwargs):
+        """ Returns a logging handler that appends the formatted data to
+        a file, which is used by the :class:`.Recorder`
+        """
+        if compression(filename) is None:
+            handler = FileHandler(filename=filename, **kwargs)
+        else:
+            handler = CompressedFileHandler(filename=filename, **kwargs)
+        handler.setFormatter(self.formatter)
+        handler.setLevel(logging.NOTSET)
+        return handler
+
+    def mark_updated(self):
+        """ Marks that new data has been written to the file """
+        self.revision += 1
+
     def labels(self):
         """ Returns the columns labels as a string to be written
         to the file
@@ -210,17 +443,14 @@ class Results(object):
         return data
 
     @staticmethod
-    def parse_header(header, procedure_class=None):
-        """ Returns a Procedure object with the parameters as defined in the
-        header text.
+    def parse_header_fields(header):
+        """ Returns the procedure module, procedure class name and a dictionary
+        of the parameter (value, units) tuples by name, as defined in the
+        header text, without constructing the procedure.
         """
-        if procedure_class is not None:
-            procedure = procedure_class()
-        else:
-            procedure = None
-
         header = header.split(Results.LINE_BREAK)
         procedure_module = None
+        procedure_class = None
         parameters = {}
         for line in header:
             if line.startswith(Results.COMMENT):
@@ -244,6 +474,21 @@ class Results(object):
                         search.group("value"),
                         search.group("units")
                     )
+        return procedure_module, procedure_class, parameters
+
+    @staticmethod
+    def parse_header(header, procedure_class=None):
+        """ Returns a Procedure object with the parameters as defined in the
+        header text.
+        """
+        if procedure_class is not None:
+            procedure = procedure_class()
+        else:
+            procedure = None
+
+        procedure_module, header_class, parameters = Results.parse_header_fields(header)
+        if header_class is not None:
+            procedure_class = header_class
         if procedure is None:
             if procedure_class is None:
                 raise ValueError("Header does not contain the Procedure class")
@@ -280,75 +525,289 @@ class Results(object):
         return procedure
 
     @staticmethod
-    def load(data_filename, procedure_class=None):
-        """ Returns a Results object with the associated Procedure object and
-        data
+    def read_header(data_filename):
+        """ Returns the header text of a data file, without the final line
+        break, and the number of header lines
         """
         header = ""
         header_read = False
         header_count = 0
-        with open(data_filename, 'r') as f:
+        with open_file(data_filename, 'rb') as f:  # The data section may be binary
             while not header_read:
-                line = f.readline()
+                line = f.readline().decode()
                 if line.startswith(Results.COMMENT):
                     header += line.strip() + Results.LINE_BREAK
                     header_count += 1
                 else:
                     header_read = True
-        procedure = Results.parse_header(header[:-1], procedure_class)
-        results = Results(procedure, data_filename)
+        return header[:-1], header_count
+
+    @staticmethod
+    def load(data_filename, procedure_class=None, columns=None):
+        """ Returns a Results object with the associated Procedure object and
+        data, optionally restricted to a list of columns
+        """
+        header, header_count = Results.read_header(data_filename)
+        procedure = Results.parse_header(header, procedure_class)
+        dtype = BinaryResults.parse_dtype(header)
+        if dtype is None:
+            results = Results(procedure, data_filename, columns=columns)
+        else:
+            results = BinaryResults(procedure, data_filename, dtype=dtype, columns=columns)
         results._header_count = header_count
         return results
 
     @property
     def data(self):
-        # Need to update header count for correct referencing
-        if self._header_count == -1:
-            self._header_count = len(
-                self.header()[-1].split(Results.LINE_BREAK))
         if self._data is None or len(self._data) == 0:
             # Data has not been read
             try:
                 self.reload()
-            except Exception:
+            except (OSError, pd.errors.EmptyDataError) as e:
+                log.warning("Unable to read '%s': %s", self.data_filename, e)
                 # Empty dataframe
-                self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
+                self._data = pd.DataFrame(columns=self._columns if self._columns is not None
+                                          else self.procedure.DATA_COLUMNS)
+        elif self._stream is not None:  # Decompress the new data, if any
+            self._read_stream()
         else:  # Concatenate additional data, if any, to already loaded data
-            skiprows = len(self._data) + self._header_count
-            chunks = pd.read_csv(
-                self.data_filename,
-                comment=Results.COMMENT,
-                header=0,
-                names=self._data.columns,
-                chunksize=Results.CHUNK_SIZE, skiprows=skiprows, iterator=True
-            )
-            try:
-                tmp_frame = pd.concat(chunks, ignore_index=True)
-                # only append new data if there is any
-                # if no new data, tmp_frame dtype is object, which override's
-                # self._data's original dtype - this can cause problems plotting
-                # (e.g. if trying to plot int data on a log axis)
-                if len(tmp_frame) > 0:
-                    self._data = pd.concat([self._data, tmp_frame],
-                                           ignore_index=True)
-            except Exception:
-                pass  # All data is up to date
+            with open(self.data_filename, 'rb') as f:
+                f.seek(self._position)
+                content = f.read()
+            end = content.rfind(Results.LINE_BREAK.encode()) + 1
+            if end > 0:  # Only complete lines are read
+                self._position += end
+                self._append(self._parse(content[:end].decode(), names=self.read_labels()))
         return self._data
 
-    def reload(self):
+    def _parse(self, text, names=None):
+        """ Returns the DataFrame of the lines of text, which start with the
+        column labels unless the names are given. Malformed lines are
+        skipped with a warning, rather than stopping the read.
+        """
+        kwargs = dict(comment=Results.COMMENT, usecols=self._columns, dtype=self._dtypes())
+        if names is not None:
+            kwargs.update(header=None, names=names)
+        try:
+            try:
+                return pd.read_csv(StringIO(text), **kwargs)
+            except pd.errors.ParserError as e:
+                log.warning("Skipping malformed lines of '%s': %s", self.data_filename, e)
+                return pd.read_csv(StringIO(text), **_SKIP_BAD_LINES, **kwargs)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError):
+            raise
+        except ValueError as e:  # Values that do not match the declared types
+            raise ValueError("Unable to read the data of '%s' as the DATA_TYPES %s: %s" % (
+                self.data_filename, kwargs['dtype'], e)) from e
+
+    def _append(self, new_data):
+        """ Appends new data to the loaded data """
+        # only append new data if there is any
+        # if no new data, the dtype is object, which override's
+        # self._data's original dtype - this can cause problems plotting
+        # (e.g. if trying to plot int data on a log axis)
+        if len(new_data) > 0:
+            self._data = pd.concat([self._data, new_data], ignore_index=True)
+
+    @property
+    def columns(self):
+        """ The list of data columns that are read, or None for all columns """
+        return self._columns
+
+    def set_columns(self, columns):
+        """ Restricts the data that is read to a list of columns, or reads
+        all columns if None. Loaded data is kept if it holds all the columns,
+        otherwise it is read again on the next access of the data.
+        """
+        columns = None if columns is None else list(columns)
+        if columns == self._columns:
+            return
+        if (self._data is not None and columns is not None and
+                all(column in self._data.columns for column in columns)):
+            self._data = self._data[columns]
+        else:
+            self._data = None
+        self._columns = columns
+
+    def read_labels(self):
+        """ Returns the list of column labels written in the file """
+        if self._labels is None:
+            with open_file(self.data_filename, 'r') as f:
+                for line in f:
+                    if not line.startswith(Results.COMMENT):
+                        break
+            self._labels = line.rstrip(Results.LINE_BREAK).split(Results.DELIMITER)
+        return self._labels
+
+    def _dtypes(self):
+        """ Returns the declared types of the columns that are read, or None """
+        dtypes = {column: dtype for column, dtype in self.procedure.DATA_TYPES.items()
+                  if self._columns is None or column in self._columns}
+        return dtypes or None
+
+    def column(self, name):
+        """ Returns the values of a data column as an array """
+        return self.data[name].values
+
+    def is_loaded(self):
+        """ Returns True if the data has been read from the file """
+        return self._data is not None
+
+    def unload(self):
+        """ Releases the data read from the file, which is read again
+        on the next access of the data
+        """
+        self._data = None
+
+    def adopt_data(self, other):
+        """ Takes over the data that another Results object of the same file
+        has read, for example on another thread, so that this object is not
+        modified while it is used elsewhere
+        """
+        self._data = other._data
+        self._position = other._position
+        self._stream = other._stream
+        self._labels = other._labels
+
+    def memory_usage(self):
+        """ Returns the number of bytes used by the loaded data """
+        if self._data is None:
+            return 0
+        return int(self._data.memory_usage(index=True).sum())
+
+    def reload(self, progress=None):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
+
+        :param progress: Optional callable, which is called with the
+                         percentage of the file that has been read
+        """
+        if compression(self.data_filename) is not None:
+            self._reload_stream(progress)
+            return
+        size = max(os.path.getsize(self.data_filename), 1)
+        line_break = Results.LINE_BREAK.encode()
+        names = self.read_labels()
+        frames = []
+        rest = b''
+        with open(self.data_filename, 'rb') as f:
+            line = f.readline()
+            while line.startswith(Results.COMMENT.encode()):
+                line = f.readline()  # The last line read holds the labels
+            self._position = f.tell()
+            # Parse each block, so that only one block of text is in memory
+            for block in iter(lambda: f.read(Results.BLOCK_SIZE), b''):
+                block = rest + block
+                end = block.rfind(line_break) + 1
+                rest = block[end:]  # Only complete lines are read
+                if end > 0:
+                    frames.append(self._parse(block[:end].decode(), names=names))
+                    self._position += end
+                if progress is not None:
+                    progress(min(100. * f.tell() / size, 100.))
+        self._data = self._concat(frames, names)
+
+    def _concat(self, frames, names):
+        """ Returns the DataFrame of the frames parsed from the blocks of a file """
+        if not frames:
+            return pd.DataFrame(columns=self._columns if self._columns is not None else names)
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def recover(self):
+        """ Truncates the file after the last complete record, which has
+        the expected number of columns and a valid checksum, if any,
+        so that the data of a crashed run can be read and appended to.
+        Returns the number of bytes that are removed.
+        """
+        if compression(self.data_filename) is not None:
+            raise ValueError("Compressed files can not be truncated, as "
+                             "only their complete lines are read")
+        size = os.path.getsize(self.data_filename)
+        line_break = Results.LINE_BREAK.encode()
+        window = Results.BLOCK_SIZE
+        with open(self.data_filename, 'r+b') as f:
+            while True:
+                start = max(size - window, 0)
+                f.seek(start)
+                lines = f.read().split(line_break)
+                end = size - len(lines.pop())  # Remove the unterminated line
+                if start > 0:
+                    lines.pop(0)  # The first line may be incomplete
+                while lines and not self._is_valid(lines[-1]):
+                    end -= len(lines.pop()) + len(line_break)
+                if lines or start == 0:
+                    break
+                window *= 2
+            f.truncate(end)
+        if end < size:
+            log.warning("Removed %d bytes of incomplete records from '%s'",
+                        size - end, self.data_filename)
+            self._data = None
+        return size - end
+
+    def _is_valid(self, line):
+        """ Returns True if a line of the file is a comment or a record with
+        the expected number of columns and a valid checksum, if any
         """
-        chunks = pd.read_csv(
-            self.data_filename,
-            comment=Results.COMMENT,
-            chunksize=Results.CHUNK_SIZE,
-            iterator=True
-        )
         try:
-            self._data = pd.concat(chunks, ignore_index=True)
-        except Exception:
-            self._data = chunks.read()
+            line = line.decode()
+        except UnicodeDecodeError:
+            return False
+        if line.startswith(Results.COMMENT):
+            return True
+        record, _, checksum = line.partition(Results.COMMENT)
+        # Lines written in text mode on Windows end with CR LF
+        record, checksum = record.rstrip('\r'), checksum.strip()
+        if checksum and checksum != crc32(record):
+            return False
+        return len(record.split(Results.DELIMITER)) == len(self.read_labels())
+
+    def _reload_stream(self, progress=None):
+        """ Reads a compressed file from the beginning, keeping the
+        decompression state for the incremental reads
+        """
+        self._stream = StreamReader(self.data_filename)
+        size = max(os.path.getsize(self.data_filename), 1)
+        names = self.read_labels()
+        frames = []
+        header_read = False
+        while True:
+            text = self._stream.read_lines(Results.BLOCK_SIZE)
+            if not header_read:
+                text, header_read = self._skip_header(text)
+            if text:
+                frames.append(self._parse(text, names=names))
+            if progress is not None:
+                progress(min(100. * self._stream.position / size, 100.))
+            if self._stream.position >= size:
+                break
+        self._data = self._concat(frames, names)
+
+    @staticmethod
+    def _skip_header(text):
+        """ Returns the text after the header comments and the labels line,
+        and whether the labels line was found in the text
+        """
+        position = 0
+        while position < len(text):
+            end = text.find(Results.LINE_BREAK, position) + 1
+            if end == 0:
+                break
+            labels = not text.startswith(Results.COMMENT, position)
+            position = end
+            if labels:
+                return text[position:], True
+        return '', False
+
+    def _read_stream(self):
+        """ Appends the complete lines written to a compressed file since
+        the last read to the data
+        """
+        text = self._stream.read_lines()
+        if text:
+            self._append(self._parse(text, names=self.read_labels()))
 
     def __repr__(self):
         return "<{}(filename='{}',procedure={},shape={})>".format(
@@ -356,3 +815,303 @@ class Results(object):
             self.procedure.__class__.__name__,
             self.data.shape
         )
+
+
+class BinaryResults(Results):
+    """ The BinaryResults class stores the data as fixed-width binary
+    records following the same text header as :class:`.Results`, so that
+    the data can be memory-mapped with :code:`np.memmap` instead of being
+    loaded. :attr:`.records` and :meth:`.column` give access to the
+    complete records in the file without reading the data, and
+    :attr:`.data` returns a DataFrame as for text files.
+    :meth:`Results.load` returns a BinaryResults for binary files.
+
+    .. code-block:: python
+
+        results = BinaryResults(procedure, 'data.bin')
+        # ... run a Worker with the results
+        voltage = results.column('Voltage')[-1000:]  # Last 1000 points
+
+    :param procedure: Procedure object
+    :param data_filename: The data filename where the data is or should be
+                          stored
+    :param dtype: Structured numpy data type of the records, which defaults
+                  to the DATA_TYPES of the procedure, or float64 for the
+                  columns without a declared type
+    :param columns: Optional list of the data columns returned in data
+    """
+
+    FORMAT = "Format: binary "
+
+    def __init__(self, procedure, data_filename, dtype=None, columns=None):
+        if dtype is None:
+            dtype = [(column, procedure.DATA_TYPES.get(column, 'f8'))
+                     for column in procedure.DATA_COLUMNS]
+        if compression(data_filename if isinstance(data_filename, str)
+                       else data_filename[0]) is not None:
+            raise ValueError("Memory-mapped results can not be compressed")
+        self.dtype = np.dtype(dtype)
+        self._offset = None
+        super().__init__(procedure, data_filename, columns=columns)
+        self.formatter = BinaryFormatter(self.procedure.DATA_COLUMNS, self.dtype)
+
+    @staticmethod
+    def parse_dtype(header):
+        """ Returns the data type of the records defined in a header, or
+        None if the header is not the one of a binary file
+        """
+        marker = Results.COMMENT + BinaryResults.FORMAT
+        for line in header.split(Results.LINE_BREAK):
+            if line.startswith(marker):
+                return np.dtype([tuple(field) for field in
+                                 json.loads(line[len(marker):])])
+        return None
+
+    def header(self):
+        h = super().header()
+        self._header_count += 1
+        return h + Results.COMMENT + self.FORMAT + json.dumps(
+            self.dtype.descr) + Results.LINE_BREAK
+
+    def handler(self, filename, **kwargs):
+        handler = BinaryFileHandler(filename=filename, **kwargs)
+        handler.setFormatter(self.formatter)
+        handler.setLevel(logging.NOTSET)
+        return handler
+
+    def data_offset(self):
+        """ Returns the position of the first record in the file """
+        if self._offset is None:
+            with open(self.data_filename, 'rb') as f:
+                line = f.readline()
+                while line.startswith(Results.COMMENT.encode()):
+                    line = f.readline()  # The last line read holds the labels
+                self._offset = f.tell()
+        return self._offset
+
+    @property
+    def records(self):
+        """ A read-only memory-mapped structured array of the complete
+        records in the file
+        """
+        offset = self.data_offset()
+        count = (os.path.getsize(self.data_filename) - offset) // self.dtype.itemsize
+        if count <= 0:
+            return np.empty(0, dtype=self.dtype)
+        return np.memmap(self.data_filename, dtype=self.dtype, mode='r',
+                         offset=offset, shape=(count,))
+
+    def recover(self):
+        """ Truncates the file after the last complete record and returns
+        the number of bytes that are removed
+        """
+        offset = self.data_offset()
+        size = os.path.getsize(self.data_filename)
+        end = max(offset + (size - offset) // self.dtype.itemsize * self.dtype.itemsize,
+                  offset)
+        if end < size:
+            with open(self.data_filename, 'r+b') as f:
+                f.truncate(end)
+            log.warning("Removed %d bytes of incomplete records from '%s'",
+                        size - end, self.data_filename)
+            self._data = None
+        return size - end
+
+    def column(self, name):
+        """ Returns the memory-mapped values of a data column """
+        return self.records[name]
+
+    @property
+    def data(self):
+        records = self.records
+        columns = self._columns if self._columns is not None else list(self.dtype.names)
+        loaded = 0 if self._data is None else len(self._data)
+        if loaded > len(records):
+            self._data, loaded = None, 0
+        if self._data is None or len(records) > loaded:
+            new_data = pd.DataFrame({column: np.array(records[column][loaded:])
+                                     for column in columns}, columns=columns)
+            if self._data is None:
+                self._data = new_data
+            else:
+                self._data = pd.concat([self._data, new_data], ignore_index=True)
+        return self._data
+
+    def reload(self, progress=None):
+        self._data = None
+        self.data
+        if progress is not None:
+            progress(100.)
+
+
+class ResultsIndex(object):
+    """ Caches the parsed headers of the data files in a directory in a
+    sidecar index file, so that the files can be listed, filtered by their
+    procedure and parameters, and loaded as :class:`.Results` objects
+    without reading their data. An entry is parsed again when the
+    modification time or the size of its file changes.
+
+    Each entry is a dictionary with the 'mtime', 'size', 'header',
+    'header_count', 'procedure', 'parameters' (dictionary of the
+    [value, units] of each parameter by name), 'columns' and 'rows' of a
+    file, as well as its column 'stats' if requested.
+
+    .. code-block:: python
+
+        index = ResultsIndex('data')
+        index.update()
+        filenames = index.filter(lambda entry: entry['rows'] > 100)
+        results = [index.load(filename) for filename in filenames]
+
+    :cvar INDEX_FILENAME: The name of the sidecar index file
+
+    :param directory: The directory of the data files
+    :param extension: The extension of the data files (default: csv), which
+                      also matches the files compressed with gzip or zstd
+    :param stats: If True, the minimum, maximum and mean of each numeric
+                  column are stored, which requires reading the data once
+    """
+
+    INDEX_FILENAME = '.pymeasure_index.json'
+
+    def __init__(self, directory, extension='csv', stats=False):
+        self.directory = os.path.abspath(directory)
+        self.extension = extension
+        self.stats = stats
+        self.index_filename = os.path.join(self.directory, self.INDEX_FILENAME)
+        self.entries = {}
+        if os.path.exists(self.index_filename):
+            try:
+                with open(self.index_filename, 'r') as f:
+                    self.entries = json.load(f)
+            except ValueError:
+                log.warning("Ignoring corrupt index file %s" % self.index_filename)
+
+    @staticmethod
+    def data_offset(data_filename, header_count):
+        """ Returns the position of the first data row of an uncompressed
+        file, after the header and the column labels
+        """
+        with open(data_filename, 'rb') as f:
+            for i in range(header_count + 1):
+                f.readline()
+            return f.tell()
+
+    @staticmethod
+    def count_rows(data_filename, header_count, dtype=None):
+        """ Returns the number of data rows of a file, by counting its lines,
+        or its records if the dtype of a binary file is given
+        """
+        if dtype is not None:
+            size = os.path.getsize(data_filename)
+            offset = ResultsIndex.data_offset(data_filename, header_count)
+            return max(size - offset, 0) // dtype.itemsize
+        lines = 0
+        last = b''
+        with open_file(data_filename, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                lines += block.count(b'\n')
+                last = block[-1:]
+        if last not in (b'', b'\n'):
+            lines += 1  # Last line is not terminated
+        return max(lines - header_count - 1, 0)
+
+    def parse(self, data_filename, stat=None):
+        """ Returns the index entry of a data file """
+        if stat is None:
+            stat = os.stat(data_filename)
+        header, header_count = Results.read_header(data_filename)
+        module, procedure_class, parameters = Results.parse_header_fields(header)
+        dtype = BinaryResults.parse_dtype(header)
+        with open_file(data_filename, 'rb') as f:  # The data section may be binary
+            for i in range(header_count):
+                f.readline()
+            labels = f.readline().decode().rstrip(Results.LINE_BREAK)
+        entry = {
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            'header': header,
+            'header_count': header_count,
+            'procedure': procedure_class if module is None else "%s.%s" % (
+                module, procedure_class),
+            'parameters': parameters,
+            'columns': labels.split(Results.DELIMITER) if labels else [],
+            'rows': self.count_rows(data_filename, header_count, dtype),
+        }
+        if self.stats:
+            if dtype is None:
+                data = pd.read_csv(data_filename, comment=Results.COMMENT)
+            else:
+                data = pd.DataFrame(np.fromfile(
+                    data_filename, dtype=dtype, count=entry['rows'],
+                    offset=self.data_offset(data_filename, header_count)))
+            numeric = data.select_dtypes('number')
+            entry['stats'] = {
+                column: {
+                    'min': float(numeric[column].min()),
+                    'max': float(numeric[column].max()),
+                    'mean': float(numeric[column].mean()),
+                } for column in numeric.columns
+            }
+        return entry
+
+    def update(self):
+        """ Scans the directory, parsing the headers of new or modified
+        files and removing the entries of deleted files, and saves the
+        index if it has changed. Returns the number of parsed files.
+        """
+        entries = {}
+        parsed = 0
+        for item in os.scandir(self.directory):
+            if not has_extension(item.name, self.extension) or not item.is_file():
+                continue
+            stat = item.stat()
+            entry = self.entries.get(item.name)
+            if (entry is not None and entry['mtime'] == stat.st_mtime and
+                    entry['size'] == stat.st_size and
+                    (not self.stats or 'stats' in entry)):
+                entries[item.name] = entry
+                continue
+            try:
+                entries[item.name] = self.parse(item.path, stat)
+                parsed += 1
+            except Exception:
+                log.warning("Could not index %s" % item.path, exc_info=True)
+        changed = parsed > 0 or entries.keys() != self.entries.keys()
+        self.entries = entries
+        if changed:
+            self.save()
+        return parsed
+
+    def save(self):
+        """ Writes the index file, replacing it atomically """
+        temporary = self.index_filename + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(temporary, self.index_filename)
+
+    def filter(self, condition):
+        """ Returns the sorted list of filenames whose entry fulfills the
+        condition, which is a callable taking the entry dictionary
+        """
+        return sorted(os.path.join(self.directory, name)
+                      for name, entry in self.entries.items() if condition(entry))
+
+    def load(self, data_filename, procedure_class=None):
+        """ Returns a Results object of an indexed file from its cached
+        header, without reading the file. The data is read on its
+        first access.
+        """
+        entry = self.entries[os.path.basename(data_filename)]
+        procedure = Results.parse_header(entry['header'], procedure_class)
+        results = Results(procedure, os.path.join(self.directory,
+                                                  os.path.basename(data_filename)))
+        results._header_count = entry['header_count']
+        return results
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return "<{}(directory='{}',files={})>".format(
+            self.__class__.__name__, self.directory, len(self.entries))
@@ -92,7 +92,7 @@ class Worker(StoppableThread):
         log.debug("Emitting message: %s %s", topic, record)
 
         try:
-            self.publisher.send_serialized((topic, record), serialize=cloudpickle.dumps)
+            self.publisher.send_multipart([topic.encode(), cloudpickle.dumps(record)])
         except (NameError, AttributeError):
             pass  # No dumps defined
         if topic == 'results':
@@ -124,6 +124,7 @@ class Worker(StoppableThread):
             self.emit('progress', 100.)
 
         self.recorder.enqueue_sentinel()
+        self.recorder.close()
         self.monitor_queue.put(None)
 
     def run(self):
@@ -25,11 +25,10 @@
 # Parts of this code were copied and adapted from the Agilent33220A class.
 
 import logging
+import numpy as np
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set,\
     strict_range
-from time import time
-from pyvisa.errors import VisaIOError
 
 
 log = logging.getLogger(__name__)
@@ -344,47 +343,61 @@ class Agilent33500(Instrument):
         """
         self.write("DATA:VOL:CLE")
 
-    def data_arb(self, arb_name, data_points, data_format='DAC'):
+    def data_arb(self, arb_name, data_points, data_format='DAC', chunk_size=None, verify=True):
         """
         Uploads an arbitrary trace into the volatile memory of the device. The data_points can be given
-        as comma separated 16 bit DAC values (ranging from -32767 to +32767), as comma separated floating
-        point values (ranging from -1.0 to +1.0) or as a binary data stream. Check the manual for more
+        as 16 bit DAC values (ranging from -32767 to +32767) or as floating point values (ranging
+        from -1.0 to +1.0), for example as a NumPy array. The points are uploaded as a binary block of
+        little-endian 16 bit integers or 32 bit floats, respectively. Check the manual for more
         information. The storage depends on the device type and ranges from 8 Sa to 16 MSa (maximum).
-        TODO: *Binary is not yet implemented*
 
         :param arb_name: The name of the trace in the volatile memory. This is used to access the
                          trace.
         :param data_points: Individual points of the trace. The format depends on the format
                             parameter.
 
-                            format = 'DAC' (default): Accepts list of integer values ranging from
+                            format = 'DAC' (default): Accepts integer values ranging from
                             -32767 to +32767. Minimum of 8 a maximum of 65536 points.
 
-                            format = 'float': Accepts list of floating point values ranging from
+                            format = 'float': Accepts floating point values ranging from
                             -1.0 to +1.0. Minimum of 8 a maximum of 65536 points.
 
-                            format = 'binary': Accepts a binary stream of 8 bit data.
+                            format = 'binary': Accepts a NumPy array, which is uploaded as DAC
+                            values if it holds integers, or as floating point values otherwise.
         :param data_format: Defines the format of data_points. Can be 'DAC' (default), 'float' or
                             'binary'. See documentation on parameter data_points above.
+        :param chunk_size: The maximum number of bytes written at once, or None to write the
+                           trace at once.
+        :param verify: Checks that the number of points of the trace in the memory matches the
+                       uploaded points, and raises a ValueError otherwise.
         """
+        if data_format == 'binary':
+            data_points = np.asarray(data_points)
+            data_format = 'DAC' if data_points.dtype.kind in 'iu' else 'float'
         if data_format == 'DAC':
-            separator = ', '
-            data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
-            data_string = separator.join(data_points_str)  # Join strings with separator
-            print("DATA:ARB:DAC {}, {}".format(arb_name, data_string))
-            self.write("DATA:ARB:DAC {}, {}".format(arb_name, data_string))
-            return
+            command, dtype, limit = "DATA:ARB:DAC {}, ".format(arb_name), '<i2', 32767
         elif data_format == 'float':
-            separator = ', '
-            data_points_str = [str(item) for item in data_points]  # Turn list entries into strings
-            data_string = separator.join(data_points_str)  # Join strings with separator
-            print("DATA:ARB {}, {}".format(arb_name, data_string))
-            self.write("DATA:ARB {}, {}".format(arb_name, data_string))
-            return
-        elif data_format == 'binary':
-            raise NotImplementedError('The binary format has not yet been implemented. Use "DAC" or "float" instead.')
+            command, dtype, limit = "DATA:ARB {}, ".format(arb_name), '<f4', 1.0
         else:
             raise ValueError('Undefined format keyword was used. Valid entries are "DAC", "float" and "binary"')
+        data_points = np.asarray(data_points)
+        if data_points.size and np.abs(data_points).max() > limit:
+            raise ValueError("The {} data points have to range from {} to {}".format(
+                data_format, -limit, limit))
+        if data_format == 'DAC' and not np.array_equal(data_points, np.round(data_points)):
+            raise ValueError("The DAC data points have to be integers")
+
+        byte_order = self.ask("FORM:BORD?").strip()
+        self.write("FORM:BORD SWAP")  # Binary data is little-endian
+        try:
+            self.write_binary_values(command, data_points, dtype, chunk_size)
+        finally:
+            self.write("FORM:BORD {}".format(byte_order))
+        if verify:
+            points = int(self.ask("DATA:ATTR:POIN? {}".format(arb_name)))
+            if points != data_points.size:
+                raise ValueError("The trace '{}' has {} points instead of the {} uploaded".format(
+                    arb_name, points, data_points.size))
 
     display = Instrument.setting(
         "DISP:TEXT '%s'",
@@ -409,27 +422,21 @@ class Agilent33500(Instrument):
         :param should_stop: Optional function (returning a bool) to allow the
                             waiting to be stopped before its end.
 
+        The operation complete event requests service (SRQ), so that the
+        adapter can wait for the request instead of polling the instrument.
         """
-        self.write("*OPC?")
-
-        t0 = time()
-        while True:
-            try:
-                ready = bool(self.read())
-            except VisaIOError:
-                ready = False
-
-            if ready:
-                return
-
-            if timeout != 0 and time() - t0 > timeout:
-                raise TimeoutError(
-                    "Timeout expired while waiting for the Agilent 33220A" +
-                    " to finish the triggering."
-                )
-
-            if should_stop:
-                return
+        # Request service on the event status bit, set by operation complete
+        self.write("*CLS;*ESE 1;*SRE 32;*OPC")
+        try:
+            self.adapter.wait_for_srq(None if timeout == 0 else timeout,
+                                      should_stop=should_stop)
+        except TimeoutError:
+            raise TimeoutError(
+                "Timeout expired while waiting for the Agilent 33220A" +
+                " to finish the triggering."
+            )
+        finally:
+            self.write("*SRE 0")
 
     trigger_source = Instrument.control(
         "TRIG:SOUR?", "TRIG:SOUR %s",
@@ -32,6 +32,7 @@ from pymeasure.instruments.validators import (strict_discrete_set,
                                               truncated_discrete_set,
                                               strict_range)
 import numpy as np
+import threading
 import time
 import pandas as pd
 import os
@@ -131,6 +132,7 @@ class Agilent4156(Instrument):
             "Agilent 4155/4156 Semiconductor Parameter Analyzer",
             **kwargs
         )
+        self._data_lock = threading.Lock()
 
         self.smu1 = SMU(self.adapter, 'SMU1', **kwargs)
         self.smu2 = SMU(self.adapter, 'SMU2', **kwargs)
@@ -368,39 +370,62 @@ class Agilent4156(Instrument):
         varlist = dlist + dvar
         return list(filter(None, varlist))
 
-    def get_data(self, path=None):
+    def get_data(self, path=None, chunksize=10000):
         """
         Gets the measurement data from the instrument after completion. If the measurement period is set to :code:`INF` in the :meth:`~.Agilent4156.measure` method, then the measurement must be stopped using :meth:`~.Agilent4156.stop` before getting valid data.
 
+        The data of each variable is read in a binary transfer into a column
+        of a single array, from which the DataFrame is built at once. The
+        data format is reset to ASCII afterwards. Calls from several threads
+        are serialized, so that a transfer does not run while another one
+        changes the data format.
+
         :param path: Path for optional data export to CSV.
+        :param chunksize: Number of rows written to the CSV file at once.
         :returns: Pandas Dataframe
 
         .. code-block:: python
 
             df = instr.get_data(path='./datafolder/data1.csv')
         """
-        if int(self.ask('*OPC?')):
+        with self._data_lock:
+            self.ask('*OPC?')  # Waits for the measurement to complete
             header = self.data_variables
-        self.write(":FORM:DATA ASC")
-        # recursively get data for each variable
-        for i, listvar in enumerate(header):
-            data = self.values(":DATA? \'{}\'".format(listvar))
-            time.sleep(0.01)
-            if i == 0:
-                lastdata = data
-            else:
-                data = np.column_stack((lastdata, data))
-                lastdata = data
+            self.write(":FORM:DATA REAL,64")
+            try:
+                data = None
+                for i, listvar in enumerate(header):
+                    values = self._binary_data(":DATA? \'{}\'".format(listvar))
+                    if data is None:
+                        data = np.empty((len(values), len(header)))
+                    data[:, i] = values
+            finally:
+                self.write(":FORM:DATA ASC")
 
         df = pd.DataFrame(data=data, columns=header, index=None)
         if path is not None:
             _, ext = os.path.splitext(path)
             if ext != ".csv":
                 path = path + ".csv"
-            df.to_csv(path, index=False)
+            df.to_csv(path, index=False, chunksize=chunksize)
 
         return df
 
+    def _binary_data(self, command):
+        """ Returns the values of a definite length binary block (e.g.
+        :code:`#18<8 bytes>`) of big-endian 64 bit floats, which is the
+        response to the command in the REAL,64 data format.
+        """
+        self.write(command)
+        raw = self.read_raw()
+        start = raw.index(b'#')
+        digits = int(raw[start + 1:start + 2])
+        length = int(raw[start + 2:start + 2 + digits])
+        start += 2 + digits
+        if len(raw) < start + length:  # Stopped at a termination character in the data
+            raw += self.read_bytes(start + length - len(raw))
+        return np.frombuffer(raw, dtype='>f8', count=length // 8, offset=start)
+
 ##########
 # CHANNELS
 ##########
@@ -27,9 +27,10 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.signalrecovery.buffer import DSPCurveBuffer
 from pymeasure.instruments.validators import modular_range, truncated_discrete_set, truncated_range
 
-class Ametek7270(Instrument):
+class Ametek7270(Instrument, DSPCurveBuffer):
     """This is the class for the Ametek DSP 7270 lockin amplifier"""
 
     SENSITIVITIES = [
@@ -180,6 +181,17 @@ class Ametek7270(Instrument):
             "Ametek DSP 7270",
             **kwargs
         )
+        self.curve_bits = {
+            'x': 1,
+            'y': 2,
+            'mag': 4,
+            'phase': 8,
+            'sensitivity': 16,
+            'ADC1': 32,
+            'ADC2': 64,
+            'ADC3': 128,
+            'ADC4': 256
+        }
 
     def set_voltage_mode(self):
         """ Sets instrument to voltage control mode """
@@ -116,55 +116,91 @@ class SynchronousAI(object):
             rc = self.subdevice.command_test() # Verify command is correct
             if rc == None: break
         
-    def measure(self, hasAborted=lambda:False):
-        """ Initiates the scan after first checking the command
-        and does not block, returns the starting timestamp
+    def _polynomials(self, converters):
+        """ Returns the coefficients and expansion origins of the polynomials
+        that convert the raw values of each channel to physical values, or
+        None if the converters do not expose them
+        """
+        try:
+            coefficients = [np.asarray(c.get_to_physical_coefficients(), dtype=np.float64)
+                            for c in converters]
+            origins = [c.get_to_physical_expansion_origin() for c in converters]
+        except AttributeError:
+            return None
+        order = max(len(c) for c in coefficients)
+        table = np.zeros((order, len(converters)))
+        for i, c in enumerate(coefficients):
+            table[:len(c), i] = c
+        return table, np.array(origins, dtype=np.float64)
+
+    def _to_physical(self, raw, out, converters, polynomials):
+        """ Converts a block of raw scans (one column per channel) into
+        physical values in place of the out array
+        """
+        if polynomials is None:
+            for i, c in enumerate(converters):
+                out[:, i] = c.to_physical(raw[:, i])
+            return
+        coefficients, origins = polynomials
+        x = raw - origins
+        # Horner's scheme over all channels at once
+        result = np.full(raw.shape, coefficients[-1])
+        for c in coefficients[-2::-1]:
+            result *= x
+            result += c
+        out[:] = result
+
+    def measure(self, hasAborted=lambda:False, chunk_size=1024):
+        """ Initiates the scan after first checking the command and reads
+        the samples into the data array, which has one column per channel.
+        The raw samples are read in blocks of up to chunk_size scans straight
+        into a preallocated buffer, converted to physical values at once and
+        emitted as blocks with :code:`emit_data`
+
+        :param hasAborted: Function that returns True to stop the measurement
+        :param chunk_size: Maximum number of scans read from the device at once
         """
         self._verifyCommand()
         sleep(0.01)
         self.subdevice.command()
-        
+
         length = len(self.channels)
-        dtype = self.subdevice.get_dtype()
+        dtype = np.dtype(self.subdevice.get_dtype())
         converters = [c.get_converter() for c in self.channels]
+        polynomials = self._polynomials(converters)
 
         self.data = np.zeros((self.samples, length), dtype=np.float32)
+        raw = np.zeros((self.samples, length), dtype=dtype)
+        buffer = memoryview(raw).cast('B')
+        scan_size = dtype.itemsize*length
+        chunk_bytes = scan_size*chunk_size
 
         # Trigger AI
         self.subdevice.device.do_insn(inttrig_insn(self.subdevice))
-                
+
         # Measurement loop
-        count = 0
-        size = int(self.data.itemsize/2)*length
-        previous_bin_slice = b''
-        
-        while not hasAborted() and self.samples > count:
-            bin_slice = previous_bin_slice
-            while len(bin_slice) < size:
-                bin_slice += self.subdevice.device.file.read(size)
-            previous_bin_slice = bin_slice[size:]
-            bin_slice = bin_slice[:size]
-            slice = np.fromstring(
-                bin_slice,
-                dtype=dtype,
-                count=length
-            )
-
-            if len(slice) != length: # Reading finished
+        count = 0  # Converted scans
+        position = 0  # Bytes read
+        while not hasAborted() and position < len(buffer):
+            read = self.subdevice.device.file.readinto(
+                buffer[position:position + chunk_bytes])
+            if not read:  # Reading finished
                 break
+            position += read
+            scans = position // scan_size
+            if scans == count:
+                continue  # Wait for a complete scan
+
+            self._to_physical(raw[count:scans], self.data[count:scans],
+                              converters, polynomials)
+            self.emit_progress(100.*scans/self.samples)
+            self.emit_data(self.data[count:scans])
+            count = scans
 
-            # Convert to physical values
-            for i, c in enumerate(converters):
-                self.data[count,i] = c.to_physical(slice[i])
-            
-            self.emit_progress(100.*count/self.samples)
-            self.emit_data(self.data[count])
-            count += 1
-            
         # Cancel measurement if it is still running (abort event)
-        if self.subdevice.get_flags().running:             
+        if self.subdevice.get_flags().running:
             self.subdevice.cancel()
-                                
+
 
 """ Command for limited samples
 
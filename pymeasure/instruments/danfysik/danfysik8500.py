@@ -25,7 +25,6 @@
 from pymeasure.instruments import Instrument, RangeException
 from .adapters import DanfysikAdapter
 
-from time import sleep
 import numpy as np
 import re
 
@@ -174,8 +173,7 @@ class Danfysik8500(Instrument):
         :param delay: The delay time in seconds between each check for stability
         """
         self.wait_for_ready(has_aborted, delay)
-        while not has_aborted() and not self.is_current_stable():
-            sleep(delay)
+        self.adapter.wait_for(self.is_current_stable, delay=delay, should_stop=has_aborted)
 
     def is_current_stable(self):
         """ Returns True if the current is within 0.02 A of the
@@ -197,8 +195,7 @@ class Danfysik8500(Instrument):
         :param has_aborted: A function that returns True if the process should stop waiting
         :param delay: The delay time in seconds between each check for readiness
         """
-        while not has_aborted() and not self.is_ready():
-            sleep(delay)
+        self.adapter.wait_for(self.is_ready, delay=delay, should_stop=has_aborted)
 
     @property
     def status(self):
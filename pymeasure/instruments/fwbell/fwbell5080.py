@@ -22,10 +22,16 @@
 # THE SOFTWARE.
 #
 
+import logging
+from time import perf_counter
+
 from pymeasure.instruments import Instrument, RangeException
 from pymeasure.instruments.validators import truncated_discrete_set, strict_discrete_set
 from pymeasure.adapters import SerialAdapter
-from numpy import array, float64
+from numpy import array, empty, float64
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
 
 
 class FWBell5080(Instrument):
@@ -46,6 +52,9 @@ class FWBell5080(Instrument):
         fields = meter.fields(100)              # Samples 100 field measurements
         print(fields.mean(), fields.std())      # Prints the mean and standard deviation of the samples
 
+        fields, rate = meter.stream_fields(1000)  # Streams 1000 samples as fast as possible
+        print(rate)                             # Prints the achieved sample rate in Hz
+
     """
 
     id = Instrument.measurement(
@@ -76,7 +85,7 @@ class FWBell5080(Instrument):
 
     def __init__(self, port):
         super(FWBell5080, self).__init__(
-            SerialAdapter(port, 2400, timeout=0.5),
+            SerialAdapter(port, baudrate=2400, timeout=0.5),
             "F.W. Bell 5080 Handheld Gaussmeter"
         )
 
@@ -128,17 +137,57 @@ class FWBell5080(Instrument):
         """ Resets the instrument. """
         self.write("*OPC")
 
-    def fields(self, samples=1):
+    def fields(self, samples=1, stream=False):
         """ Returns a numpy array of field samples for a given sample number.
 
         :param samples: The number of samples to preform
+        :param stream: Streams the samples with :meth:`stream_fields` instead
+                       of querying them one by one
         """
         if samples < 1:
             raise Exception("F.W. Bell 5080 does not support samples less than 1.")
+        elif stream:
+            return self.stream_fields(samples)[0]
         else:
             data = [self.field for i in range(int(samples))]
             return array(data, dtype=float64)
 
+    def stream_fields(self, samples, window=16):
+        """ Streams field samples as fast as the instrument allows and
+        returns a tuple of a numpy array of the samples and the achieved
+        sample rate in Hz. Up to window queries are kept outstanding on the
+        serial port, and each reply is read up to its line terminator instead
+        of waiting for the read timeout. If the streaming fails, the replies
+        to the outstanding queries are discarded from the input buffer.
+
+        :param samples: The number of samples to preform
+        :param window: The maximum number of queries sent ahead of the replies
+        """
+        samples = int(samples)
+        if samples < 1:
+            raise Exception("F.W. Bell 5080 does not support samples less than 1.")
+        query = b":MEAS:FLUX?\n"
+        data = empty(samples, dtype=float64)
+        start = perf_counter()
+        sent = min(window, samples)
+        try:
+            self.adapter.write_raw(query * sent)
+            for i in range(samples):
+                reply = self.adapter.read_until(b"\r\n")
+                if not reply.endswith(b"\r\n"):
+                    raise TimeoutError("F.W. Bell 5080 did not reply to sample %d" % i)
+                if sent < samples:
+                    self.adapter.write_raw(query)
+                    sent += 1
+                data[i] = float(reply.split()[0])  # Remove units
+        except BaseException:
+            # Discard the replies to the outstanding queries
+            self.adapter.reset_input_buffer()
+            raise
+        rate = samples / (perf_counter() - start)
+        log.info("F.W. Bell 5080 streamed %d samples at %g Hz", samples, rate)
+        return data, rate
+
     def auto_range(self):
         """ Enables the auto range functionality. """
         self.write(":SENS:FLUX:RANG:AUTO")
@@ -26,6 +26,8 @@ import logging
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+import numpy as np
+
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set
 
@@ -116,3 +118,52 @@ class HP33120A(Instrument):
     def beep(self):
         """ Causes a system beep. """
         self.write("SYST:BEEP")
+
+    def data_arb(self, arb_name, data_points, data_format='DAC', chunk_size=None, verify=True):
+        """ Uploads an arbitrary waveform as a binary block of 16 bit DAC
+        values to the volatile memory, and copies it to the non-volatile
+        memory under the name, unless the name is 'VOLATILE'. The waveform
+        can then be selected with :code:`FUNC:USER` and the 'user'
+        :attr:`~.shape`.
+
+        :param arb_name: The name of the waveform in the non-volatile memory,
+                         or 'VOLATILE'
+        :param data_points: The points of the waveform (e.g. a NumPy array),
+                            from 8 to 16000 points
+        :param data_format: 'DAC' for integer values ranging from -2047 to
+                            +2047, or 'float' for values ranging from -1.0 to
+                            +1.0, which are scaled to DAC values
+        :param chunk_size: The maximum number of bytes written at once, or
+                           None to write the waveform at once
+        :param verify: Checks that the number of points in the volatile
+                       memory matches the uploaded points, and raises a
+                       ValueError otherwise
+        """
+        data_points = np.asarray(data_points)
+        if data_format == 'float':
+            limit = 1.0
+        elif data_format == 'DAC':
+            limit = 2047
+        else:
+            raise ValueError('Undefined format keyword was used. Valid entries are "DAC" and "float"')
+        if data_points.size and np.abs(data_points).max() > limit:
+            raise ValueError("The %s data points have to range from %g to %g" % (
+                data_format, -limit, limit))
+        if data_format == 'DAC' and not np.array_equal(data_points, np.round(data_points)):
+            raise ValueError("The DAC data points have to be integers")
+        if data_format == 'float':
+            data_points = np.round(data_points * 2047)
+
+        byte_order = self.ask("FORM:BORD?").strip()
+        self.write("FORM:BORD SWAP")  # Binary data is little-endian
+        try:
+            self.write_binary_values("DATA:DAC VOLATILE, ", data_points, '<i2', chunk_size)
+        finally:
+            self.write("FORM:BORD %s" % byte_order)
+        if verify:
+            points = int(self.ask("DATA:ATTR:POIN? VOLATILE"))
+            if points != data_points.size:
+                raise ValueError("The volatile memory has %d points instead of the %d uploaded" % (
+                    points, data_points.size))
+        if arb_name.upper() != 'VOLATILE':
+            self.write("DATA:COPY %s, VOLATILE" % arb_name)
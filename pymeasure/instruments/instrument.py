@@ -104,6 +104,12 @@ class Instrument(object):
         """
         return self.adapter.read()
 
+    def read_raw(self):
+        """ Reads from the instrument through the adapter and returns the
+        response as bytes.
+        """
+        return self.adapter.read_raw()
+
     def read_bytes(self, size):
         """ Reads specified number of bytes from the instrument through
         the adapter and returns the response.
@@ -119,6 +125,18 @@ class Instrument(object):
     def binary_values(self, command, header_bytes=0, dtype=np.float32):
         return self.adapter.binary_values(command, header_bytes, dtype)
 
+    def write_binary_values(self, command, values, dtype=np.float32, chunk_size=None):
+        """ Writes a command followed by the values as a binary block
+        through the adapter, passing on the arguments.
+        """
+        self.adapter.write_binary_values(command, values, dtype, chunk_size)
+
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=lambda: False):
+        """ Blocks until the instrument requests service through the
+        adapter, passing on the arguments.
+        """
+        return self.adapter.wait_for_srq(timeout, delay, should_stop)
+
     @staticmethod
     def control(get_command, set_command, docs,
                 validator=lambda v, vs: v, values=(), map_values=False,
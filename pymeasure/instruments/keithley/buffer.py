@@ -31,7 +31,6 @@ from pymeasure.instruments.validators import truncated_range
 from pymeasure.adapters import PrologixAdapter
 
 import numpy as np
-from time import sleep, time
 
 
 class KeithleyBuffer(object):
@@ -76,19 +75,18 @@ class KeithleyBuffer(object):
         returns early if the :code:`should_stop` function returns True or
         the timeout is reached before the buffer is full.
 
+        The buffer full bit, which is enabled by :meth:`~.config_buffer`,
+        requests service (SRQ), so that the adapter can wait for the request
+        instead of polling the instrument.
+
         :param should_stop: A function that returns True when this function should return early
         :param timeout: A time in seconds after which this function should return early
         :param interval: A time in seconds for how often to check if the buffer is full
         """
-        # TODO: Use SRQ initially instead of constant polling
-        #self.adapter.wait_for_srq()
-        t = time()
-        while not self.is_buffer_full():
-            sleep(interval)
-            if should_stop():
-                return
-            if (time()-t)>timeout:
-                raise Exception("Timed out waiting for Keithley buffer to fill.")
+        try:
+            self.adapter.wait_for_srq(timeout, interval, should_stop)
+        except TimeoutError:
+            raise TimeoutError("Timed out waiting for Keithley buffer to fill.")
 
     @property
     def buffer_data(self):
@@ -96,6 +94,35 @@ class KeithleyBuffer(object):
         self.write(":FORM:DATA ASCII")
         return np.array(self.values(":TRAC:DATA?"), dtype=np.float64)
 
+    def binary_buffer_data(self, command, elements=1, dtype='<f4'):
+        """ Returns a numpy array of the readings from a binary transfer of
+        the buffer, with a row for each of the elements of the readings.
+        The data format of the instrument is reset to ASCII afterwards.
+
+        :param command: The query of the buffer data (e.g. :code:`:TRAC:DATA?`)
+        :param elements: The number of elements of each reading
+        :param dtype: The NumPy data type of the transferred values
+        """
+        # Skips the indefinite length header (#0) and the final line break
+        data = self.binary_values(command, header_bytes=2, dtype=np.uint8)
+        self.write(":FORM:DATA ASCII")
+        size = np.dtype(dtype).itemsize * elements
+        values = data[:len(data) // size * size].view(dtype)
+        return values.reshape(-1, elements).T.astype(np.float64)
+
+    def upload_source_list(self, mode, points, chunk_size=100):
+        """ Uploads a list of source values to the source memory, appending
+        long lists in pieces to keep the commands short.
+
+        :param mode: The source function, either 'CURR' or 'VOLT'
+        :param points: The list of source values
+        :param chunk_size: The number of values sent in each command
+        """
+        for i in range(0, len(points), chunk_size):
+            self.write(":SOUR:LIST:%s%s %s" % (
+                mode, ':APP' if i > 0 else '',
+                ','.join('%.9g' % point for point in points[i:i + chunk_size])))
+
     def start_buffer(self):
         """ Starts the buffer. """
         self.write(":INIT")
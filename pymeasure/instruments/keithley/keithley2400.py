@@ -586,6 +586,67 @@ class Keithley2400(Instrument, KeithleyBuffer):
     def status(self):
         return self.ask("status:queue?;")
 
+    def config_list_sweep(self, points, source='current', delay=0, nplc=1):
+        """ Configures a sweep through a list of source values, which are
+        uploaded to the source memory at once, and stores the voltage,
+        current, resistance and time of each point in the buffer.
+
+        :param points: The list of source values, of at most 2500 points
+        :param source: The source mode, either 'current' or 'voltage'
+        :param delay: The source delay in seconds before each measurement
+        :param nplc: Number of power line cycles (NPLC) from 0.01 to 10
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if not 0 < len(points) <= 2500:
+            raise ValueError("Keithley 2400 list sweeps have 1 to 2500 points")
+        self.source_mode = source
+        mode = 'CURR' if source == 'current' else 'VOLT'
+        self.write(":SOUR:%s:MODE LIST;:SOUR:DEL %g" % (mode, delay))
+        self.upload_source_list(mode, points)
+        self.write(":SENS:FUNC:CONC ON;:SENS:FUNC 'VOLT','CURR','RES';"
+                   ":SENS:RES:MODE MAN;:SENS:VOLT:NPLC %f;:SENS:CURR:NPLC %f;"
+                   ":FORM:ELEM VOLT,CURR,RES,TIME;" % (nplc, nplc))
+        self.trigger_immediately()
+        # Enable the buffer full bit to request service
+        self.write(":STAT:PRES;*CLS;*SRE 1;:STAT:MEAS:ENAB 512;")
+        self.write(":TRAC:CLEAR;:TRAC:POIN %d;:TRIG:COUN %d;"
+                   ":TRAC:FEED SENSE;:TRAC:FEED:CONT NEXT;" % (len(points), len(points)))
+        self.check_errors()
+
+    def list_sweep(self, points, source='current', delay=0, nplc=1,
+                   timeout=60, should_stop=lambda: False):
+        """ Sweeps the source through a list of values with the internal
+        trigger, and returns the voltage, current, resistance and time
+        of the points as numpy arrays, which are read from the buffer in one
+        binary transfer. The source is enabled for the sweep.
+
+        .. code-block:: python
+
+            currents = np.linspace(0, 1e-3, 101)
+            voltages, currents, resistances, times = keithley.list_sweep(currents)
+
+        :param points: The list of source values, of at most 2500 points
+        :param source: The source mode, either 'current' or 'voltage'
+        :param delay: The source delay in seconds before each measurement
+        :param nplc: Number of power line cycles (NPLC) from 0.01 to 10
+        :param timeout: A time in seconds after which the sweep times out
+        :param should_stop: A function that returns True to stop waiting
+        """
+        self.config_list_sweep(points, source, delay, nplc)
+        self.enable_source()
+        self.start_buffer()
+        self.wait_for_buffer(should_stop, timeout)
+        return self.read_list_sweep()
+
+    def read_list_sweep(self):
+        """ Returns the voltage, current, resistance and time of the points
+        in the buffer as numpy arrays, which are read in one binary transfer
+        """
+        self.write(":FORM:DATA SREAL;:FORM:BORD SWAP")
+        voltage, current, resistance, times = self.binary_buffer_data(
+            ":TRAC:DATA?", elements=4, dtype='<f4')
+        return voltage, current, resistance, times
+
     def RvsI(self, startI, stopI, stepI, compliance, delay=10.0e-3, backward=False):
         num = int(float(stopI-startI)/float(stepI)) + 1
         currRange = 1.2*max(abs(stopI),abs(startI))
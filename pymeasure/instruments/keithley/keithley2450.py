@@ -515,6 +515,87 @@ class Keithley2450(Instrument, KeithleyBuffer):
         """ Returns the resistance standard deviation from the buffer """
         return self.standard_devs[2]
 
+    def config_list_sweep(self, points, source='current', delay=0, nplc=1):
+        """ Configures a sweep through a list of source values, which are
+        uploaded to the source memory at once, and stores the measured and
+        source value and time of each point in the default buffer.
+
+        :param points: The list of source values
+        :param source: The source mode, either 'current' or 'voltage'
+        :param delay: The source delay in seconds before each measurement
+        :param nplc: Number of power line cycles (NPLC) from 0.01 to 10
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if len(points) == 0:
+            raise ValueError("Keithley 2450 list sweeps need at least one point")
+        self.source_mode = source
+        mode = 'CURR' if source == 'current' else 'VOLT'
+        measure = 'VOLT' if source == 'current' else 'CURR'
+        self.write(":SENS:FUNC '%s';:SENS:%s:NPLC %f;" % (measure, measure, nplc))
+        self.upload_source_list(mode, points)
+        self.write(':TRAC:CLE "defbuffer1";:TRAC:POIN %d, "defbuffer1"' % len(points))
+        self.write(':SOUR:SWE:%s:LIST 1, %g, 1, OFF, "defbuffer1"' % (mode, delay))
+        self.check_errors()
+
+    def list_sweep(self, points, source='current', delay=0, nplc=1,
+                   timeout=60, should_stop=lambda: False):
+        """ Sweeps the source through a list of values with the internal
+        trigger, and returns the voltage, current, resistance and time
+        of the points as numpy arrays, which are read from the buffer in one
+        binary transfer. The source is enabled for the sweep. If the sweep
+        is stopped early, it is aborted and only the points acquired so far
+        are returned.
+
+        .. code-block:: python
+
+            voltages = np.linspace(0, 1, 101)
+            voltages, currents, resistances, times = keithley.list_sweep(
+                voltages, source='voltage')
+
+        :param points: The list of source values
+        :param source: The source mode, either 'current' or 'voltage'
+        :param delay: The source delay in seconds before each measurement
+        :param nplc: Number of power line cycles (NPLC) from 0.01 to 10
+        :param timeout: A time in seconds after which the sweep times out
+        :param should_stop: A function that returns True to stop waiting
+        """
+        self.config_list_sweep(points, source, delay, nplc)
+        self.enable_source()
+        # Request service on the event status bit, set by operation complete
+        self.write("*CLS;*ESE 1;*SRE 32;:INIT;*OPC")
+        try:
+            completed = self.adapter.wait_for_srq(timeout, should_stop=should_stop)
+        finally:
+            self.write("*SRE 0")
+        count = len(points)
+        if not completed:
+            self.write(":ABOR")
+            count = int(self.ask(':TRAC:ACT? "defbuffer1"'))
+        return self.read_list_sweep(count, source)
+
+    def read_list_sweep(self, count, source='current'):
+        """ Returns the voltage, current, resistance and time of the first
+        count points of the default buffer as numpy arrays, which are read
+        in one binary transfer
+
+        :param count: The number of points to read
+        :param source: The source mode of the sweep, either 'current' or 'voltage'
+        """
+        if count == 0:
+            empty = np.empty(0)
+            return empty, empty, empty, empty
+        self.write(":FORM:DATA REAL;:FORM:BORD SWAP")
+        measured, sourced, times = self.binary_buffer_data(
+            ':TRAC:DATA? 1, %d, "defbuffer1", READ, SOUR, REL' % count,
+            elements=3, dtype='<f8')
+        if source == 'current':
+            voltage, current = measured, sourced
+        else:
+            voltage, current = sourced, measured
+        with np.errstate(divide='ignore', invalid='ignore'):
+            resistance = voltage / current
+        return voltage, current, resistance, times
+
     def use_rear_terminals(self):
         """ Enables the rear terminals for measurement, and
         disables the front terminals. """
@@ -26,7 +26,6 @@ import logging
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-from time import sleep, time
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set
@@ -108,14 +107,13 @@ class LakeShore331(Instrument):
         setpoint_value = getattr(self, setpoint_name)
         def percent_difference(temperature):
             return abs(100*(temperature - setpoint_value)/setpoint_value)
-        t = time()
-        while percent_difference(getattr(self, temperature_name)) > accuracy:
-            sleep(interval)
-            if (time()-t) > timeout:
-                raise Exception((
-                    "Timeout occurred after waiting %g seconds for "
-                    "the LakeShore 331 temperature to reach %g K."
-                ) % (timeout, setpoint))
-            if should_stop():
-                return
+        try:
+            self.adapter.wait_for(
+                lambda: percent_difference(getattr(self, temperature_name)) <= accuracy,
+                timeout, interval, should_stop)
+        except TimeoutError:
+            raise TimeoutError((
+                "Timeout occurred after waiting %g seconds for "
+                "the LakeShore 331 temperature to reach %g K."
+            ) % (timeout, setpoint_value))
 
@@ -22,7 +22,6 @@
 # THE SOFTWARE.
 #
 
-from time import sleep
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import strict_discrete_set
@@ -225,8 +224,7 @@ class Axis(object):
         delay can be specified in seconds.
         """
         self.write("WS%d" % (delay*1e3))
-        while not self.motion_done:
-            sleep(interval)
+        self.controller.adapter.wait_for(lambda: self.motion_done, delay=interval)
 
 
 class ESP300(Instrument):
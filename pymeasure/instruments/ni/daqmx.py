@@ -43,7 +43,11 @@ DAQmx_Val_Cfg_Default = int32(-1)
 DAQmx_Val_Volts = 10348
 DAQmx_Val_Rising = 10280
 DAQmx_Val_FiniteSamps = 10178
+DAQmx_Val_ContSamps = 10123
 DAQmx_Val_GroupByChannel = 1
+# Error codes
+DAQmxErrorSamplesNoLongerAvailable = -200279
+DAQmxErrorInputBufferOverrun = -200010
 
 
 class DAQmx(object):
@@ -57,25 +61,50 @@ class DAQmx(object):
         self.taskHandleAI = TaskHandle(0)
         self.taskHandleAO = TaskHandle(0)
         self.terminated = False
+        self.ringBuffer = None
 
-    def setup_analog_voltage_in(self, channelList, numSamples, sampleRate=10000, scale=3.0):
+    def _create_analog_voltage_in(self, channelList, sampleRate, scale, sampleMode,
+                                  bufferSamples):
         resourceString = ""
         for num, channel in enumerate(channelList):
             if num > 0:
                 resourceString += ", " # Add a comma before entries 2 and so on
             resourceString += self.resourceName + "/ai" + str(num)
         self.numChannels = len(channelList)
-        self.numSamples = numSamples
         self.taskHandleAI = TaskHandle(0)
-        self.dataBuffer = np.zeros((self.numSamples,self.numChannels), dtype=np.float64)
         self.CHK(nidaq.DAQmxCreateTask("",ctypes.byref(self.taskHandleAI)))
         self.CHK(nidaq.DAQmxCreateAIVoltageChan(self.taskHandleAI,resourceString,"",
                                    DAQmx_Val_Cfg_Default,
                                    float64(-scale),float64(scale),
                                    DAQmx_Val_Volts,None))
         self.CHK(nidaq.DAQmxCfgSampClkTiming(self.taskHandleAI,"",float64(sampleRate),
-                                DAQmx_Val_Rising,DAQmx_Val_FiniteSamps,
-                                uInt64(self.numSamples)));
+                                DAQmx_Val_Rising,sampleMode,
+                                uInt64(bufferSamples)));
+
+    def setup_analog_voltage_in(self, channelList, numSamples, sampleRate=10000, scale=3.0):
+        self.numSamples = numSamples
+        self.dataBuffer = np.zeros((self.numSamples,len(channelList)), dtype=np.float64)
+        self._create_analog_voltage_in(channelList, sampleRate, scale,
+                                       DAQmx_Val_FiniteSamps, self.numSamples)
+
+    def setup_analog_voltage_in_continuous(self, channelList, blockSize, sampleRate=10000,
+                                           scale=3.0, numBlocks=2, deviceBlocks=10):
+        """ Sets up the analog input channels for continuous sampling,
+        which are read in blocks of fixed size by :meth:`acquire_blocks`.
+
+        :param channelList: List of the analog input channels
+        :param blockSize: Number of samples per channel in each block
+        :param sampleRate: Sample rate in Hz
+        :param scale: Maximum absolute voltage of the input range
+        :param numBlocks: Number of blocks in the ring buffer the blocks are
+                          read into, which is 2 for double buffering
+        :param deviceBlocks: Size of the input buffer of the driver in blocks,
+                             which bounds the time the reading may lag behind
+        """
+        self.numSamples = blockSize
+        self.ringBuffer = np.zeros((numBlocks, len(channelList), blockSize), dtype=np.float64)
+        self._create_analog_voltage_in(channelList, sampleRate, scale,
+                                       DAQmx_Val_ContSamps, blockSize*deviceBlocks)
 
     def setup_analog_voltage_out(self, channel=0):
         resourceString = self.resourceName + "/ao" + str(channel)
@@ -124,6 +153,47 @@ class DAQmx(object):
                                 self.numChannels*self.numSamples,ctypes.byref(read),None))
         return self.dataBuffer.transpose()
 
+    def acquire_blocks(self, count=None, hasAborted=lambda: False, callback=None):
+        """ Starts the continuous acquisition set up by
+        :meth:`setup_analog_voltage_in_continuous` and yields the blocks of
+        samples as arrays of shape (channels, block size) without restarting
+        the task between blocks. The blocks are views of the ring buffer,
+        so a block is overwritten once the ring buffer wraps around and
+        has to be copied if it is kept longer.
+
+        A RuntimeError is raised if the driver buffer overran, since samples
+        were lost in that case.
+
+        :param count: Number of blocks to acquire, or None to acquire until
+                      hasAborted returns True
+        :param hasAborted: Function that returns True to stop the acquisition
+        :param callback: Optional function that is called with each block
+                         before it is yielded
+        """
+        if self.ringBuffer is None:
+            raise ValueError("Continuous acquisition is not set up")
+        numBlocks = self.ringBuffer.shape[0]
+        read = int32()
+        self.CHK(nidaq.DAQmxStartTask(self.taskHandleAI))
+        try:
+            index = 0
+            while (count is None or index < count) and not hasAborted():
+                block = self.ringBuffer[index % numBlocks]
+                err = nidaq.DAQmxReadAnalogF64(self.taskHandleAI, self.numSamples,
+                                               float64(10.0), DAQmx_Val_GroupByChannel,
+                                               block.ctypes.data, block.size,
+                                               ctypes.byref(read), None)
+                if err in (DAQmxErrorSamplesNoLongerAvailable, DAQmxErrorInputBufferOverrun):
+                    raise RuntimeError("NI-DAQmx buffer overrun after %d blocks, samples "
+                                       "were lost" % index)
+                self.CHK(err)
+                if callback is not None:
+                    callback(block)
+                yield block
+                index += 1
+        finally:
+            nidaq.DAQmxStopTask(self.taskHandleAI)
+
     def acquire_average(self):
         if not self.terminated:
             avg = np.mean(self.acquire(), axis=1)
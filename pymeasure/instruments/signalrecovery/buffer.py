@@ -0,0 +1,162 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+from time import sleep
+
+import numpy as np
+
+
+class DSPCurveBuffer(object):
+    """ Implements the curve buffer of the Signal Recovery and Ametek DSP
+    lock-in amplifiers, which stores several quantities at a fixed interval.
+    The curves are dumped in binary in one pass for all quantities, either
+    once the acquisition has finished or in parts while it continues.
+    The instrument defines the bits of the curves in :code:`curve_bits`. """
+
+    # Scale of the 16 bit curve values of quantities that do not depend on
+    # the sensitivity (phase in centidegrees, ADC inputs in mV)
+    CURVE_SCALES = {'phase': 1e-2}
+    ADC_SCALE = 1e-3
+    # Quantities stored as a fraction of the sensitivity (10000 = full scale)
+    SENSITIVITY_QUANTITIES = ('x', 'y', 'mag')
+    FULL_SCALE = 10000.
+
+    def set_buffer(self, points, quantities=['x'], interval=10.0e-3):
+        """ Configures the curve buffer to store a number of points of the
+        quantities, which are keys of :code:`curve_bits`. The sensitivity
+        curve is added to convert the voltages, if they are stored.
+
+        The X, Y and magnitude curves are converted with the voltage
+        sensitivities, so they are only valid in voltage mode (IMODE 0),
+        and not in the current modes (IMODE 1 and 2).
+
+        :param points: The number of points of each curve
+        :param quantities: The list of quantities to store
+        :param interval: The time between the points in seconds, in
+                         increments of 5 ms
+        """
+        quantities = set(quantities)
+        if quantities.intersection(self.SENSITIVITY_QUANTITIES):
+            quantities.add('sensitivity')
+        self.buffer_quantities = sorted(quantities, key=lambda q: self.curve_bits[q])
+        self.points = points
+        self.write("CBD %d" % sum(self.curve_bits[q] for q in self.buffer_quantities))
+        self.write("LEN %d" % int(points))
+        # interval in increments of 5ms
+        interval = int(float(interval)/5.0e-3)
+        self.write("STR %d" % interval)
+        self.write("NC")
+
+    def start_buffer(self):
+        """ Starts the acquisition of the curves. """
+        self.write("TD")
+
+    def buffer_status(self):
+        """ Returns a tuple of the curve acquisition status, which is 0
+        once the acquisition has finished, and the number of points
+        acquired so far. """
+        status = self.values("M")
+        return int(status[0]), int(status[3])
+
+    def wait_for_buffer(self, should_stop=lambda: False, timeout=60, interval=0.05):
+        """ Blocks until the curve acquisition has finished, returning early
+        if :code:`should_stop` returns True, or raising a TimeoutError after
+        the timeout in seconds.
+
+        :param should_stop: A function that returns True to return early
+        :param timeout: The maximum time to wait in seconds
+        :param interval: The time between the status checks in seconds
+        """
+        return self.adapter.wait_for(lambda: self.buffer_status()[0] == 0,
+                                     timeout, interval, should_stop)
+
+    def buffer_data(self, points=None):
+        """ Returns a dictionary of numpy arrays of the configured
+        quantities, which are dumped from the curve buffer in binary in one
+        pass and converted to physical units.
+
+        :param points: The number of points acquired, which defaults to the
+                       number of points of the buffer
+        """
+        if points is None:
+            points = self.points
+        length = len(self.buffer_quantities)
+        self.write("DCB %d" % sum(self.curve_bits[q] for q in self.buffer_quantities))
+        data = np.frombuffer(self.read_bytes(2 * length * points), dtype='>i2')
+        return self._convert_curves(data.reshape(points, length))
+
+    def stream_buffer(self, should_stop=lambda: False, interval=0.05, block_points=None):
+        """ Starts the curve acquisition and yields dictionaries of numpy
+        arrays of the points acquired since the previous dictionary, while
+        the acquisition continues, until it has finished.
+
+        The curve dump always starts at the first point, so each dump
+        transfers all the points acquired so far. The curves are therefore
+        only dumped once block_points new points are available, or once the
+        acquisition has finished, which bounds the transfer to about
+        points / block_points times the size of the buffer.
+
+        :param should_stop: A function that returns True to stop streaming
+        :param interval: The time between the status checks in seconds
+        :param block_points: The number of new points that triggers a dump,
+                             which defaults to a tenth of the buffer
+        """
+        if block_points is None:
+            block_points = max(self.points // 10, 1)
+        self.start_buffer()
+        read = 0
+        while not should_stop():
+            status, acquired = self.buffer_status()
+            finished = status == 0
+            if acquired > read and (finished or acquired - read >= block_points):
+                data = self.buffer_data(acquired)
+                yield {q: values[read:] for q, values in data.items()}
+                read = acquired
+            if finished:  # Also when halted before all points were acquired
+                break
+            sleep(interval)
+
+    def _convert_curves(self, raw):
+        """ Converts the raw curve values, with a column for each of the
+        buffer quantities, into a dictionary of physical values """
+        data = {}
+        columns = dict(zip(self.buffer_quantities, raw.T))
+        if 'sensitivity' in columns:
+            # The lower 5 bits hold the sensitivity setting
+            data['sensitivity'] = np.take(self.SENSITIVITIES,
+                                          columns['sensitivity'] & 31)
+        for q, values in columns.items():
+            if q == 'sensitivity':
+                continue
+            elif q in self.SENSITIVITY_QUANTITIES:
+                data[q] = values * (data['sensitivity'] / self.FULL_SCALE)
+            elif q.startswith('ADC'):
+                data[q] = values * self.ADC_SCALE
+            else:
+                data[q] = values * self.CURVE_SCALES.get(q, 1.)
+        return data
@@ -27,13 +27,14 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 from pymeasure.instruments import Instrument
+from pymeasure.instruments.signalrecovery.buffer import DSPCurveBuffer
 from pymeasure.instruments.validators import truncated_discrete_set, truncated_range, modular_range, modular_range_bidirectional, strict_discrete_set
 
 from time import sleep
 import numpy as np
 
 
-class DSP7265(Instrument):
+class DSP7265(Instrument, DSPCurveBuffer):
     """This is the class for the DSP 7265 lockin amplifier"""
     # TODO: add regultors on most of these
 
@@ -179,6 +180,7 @@ class DSP7265(Instrument):
             'y': 2,
             'mag': 4,
             'phase': 8,
+            'sensitivity': 16,
             'ADC1': 32,
             'ADC2': 64,
             'ADC3': 128
@@ -250,44 +252,19 @@ class DSP7265(Instrument):
     def gain(self, value):
         self.write("ACGAIN %d" % int(value/10.0))
 
-    def set_buffer(self, points, quantities=['x'], interval=10.0e-3):
-        num = 0
-        for q in quantities:
-            num += self.curve_bits[q]
-        self.points = points
-        self.write("CBD %d" % int(num))
-        self.write("LEN %d" % int(points))
-        # interval in increments of 5ms
-        interval = int(float(interval)/5.0e-3)
-        self.write("STR %d" % interval)
-        self.write("NC")
-
-    def start_buffer(self):
-        self.write("TD")
-
     def get_buffer(self, quantity='x', timeout=1.00, average=False):
-        count = 0
-        maxCount = int(timeout/0.05)
-        failed = False
-        while int(self.values("M")) != 0:
-            # Sleeping
-            sleep(0.05)
-            if count > maxCount:
-                # Count reached max value, wait longer before asking!
-                failed = True
-                break
-        if not failed:
-            data = []
-            # Getting data
-            for i in range(self.length):
-                val = self.values("DC. %d" % self.curve_bits[quantity])
-                data.append(val)
-            if average:
-                return np.mean(data)
-            else:
-                return data
-        else:
+        """ Returns the points of a quantity in the curve buffer, once the
+        acquisition has finished, or their average. Returns [0.0] if the
+        acquisition does not finish within the timeout in seconds. """
+        try:
+            self.wait_for_buffer(timeout=timeout)
+        except TimeoutError:
             return [0.0]
+        data = self.buffer_data()[quantity]
+        if average:
+            return np.mean(data)
+        else:
+            return data
 
     def shutdown(self):
         log.info("Shutting down %s." % self.name)
@@ -369,46 +369,104 @@ class SR830(Instrument):
             return int(query)
 
     def fill_buffer(self, count, has_aborted=lambda: False, delay=0.001):
-        ch1 = np.empty(count, np.float32)
-        ch2 = np.empty(count, np.float32)
-        currentCount = self.buffer_count
-        index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.buffer_data(1, index, currentCount)
-                ch2[index:currentCount] = self.buffer_data(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if has_aborted():
-                self.pause_buffer()
-                return ch1, ch2
-        self.pauseBuffer()
-        ch1[index:count+1] = self.buffer_data(1, index, count)
-        ch2[index:count+1] = self.buffer_data(2, index, count)
-        return ch1, ch2
+        """ Waits for the buffer, which has been started, to fill up to
+        count points and returns the arrays of channel 1 and 2, which are
+        read while the buffer fills
+        """
+        data = np.zeros((count, 2), np.float32)
+        for chunk in self._read_buffer(data, has_aborted, delay):
+            pass
+        return data[:, 0], data[:, 1]
 
     def buffer_measure(self, count, stopRequest=None, delay=1e-3):
-        self.write("FAST0;STRD")
-        ch1 = np.empty(count, np.float64)
-        ch2 = np.empty(count, np.float64)
-        currentCount = self.buffer_count
-        index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.buffer_data(1, index, currentCount)
-                ch2[index:currentCount] = self.buffer_data(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if stopRequest is not None and stopRequest.isSet():
-                self.pauseBuffer()
-                return (0, 0, 0, 0)
-        self.pauseBuffer()
-        ch1[index:count] = self.buffer_data(1, index, count)
-        ch2[index:count] = self.buffer_data(2, index, count)
+        """ Starts the buffer and returns the mean and standard deviation
+        of channel 1 and 2 over count points
+        """
+        self.start_buffer()
+        data = np.empty((count, 2), np.float64)
+        has_aborted = lambda: stopRequest is not None and stopRequest.is_set()
+        for chunk in self._read_buffer(data, has_aborted, delay):
+            pass
+        if has_aborted():
+            return (0, 0, 0, 0)
+        ch1, ch2 = data[:, 0], data[:, 1]
         return (ch1.mean(), ch1.std(), ch2.mean(), ch2.std())
 
+    def _read_buffer(self, data, has_aborted=lambda: False, delay=0.01):
+        """ Reads the points of channel 1 and 2 into the rows of the data
+        array as the buffer fills, yielding the rows of each new chunk,
+        and pauses the buffer when the data is full or on abort
+        """
+        count = len(data)
+        index = 0
+        try:
+            while index < count and not has_aborted():
+                current = min(self.buffer_count, count)
+                if current > index:
+                    data[index:current, 0] = self.get_buffer(1, index, current)
+                    data[index:current, 1] = self.get_buffer(2, index, current)
+                    yield data[index:current]
+                    index = current
+                else:
+                    time.sleep(delay)
+        finally:
+            self.pause_buffer()
+
+    def _read_fast(self, data, chunk_size, has_aborted=lambda: False):
+        """ Reads the points of channel 1 and 2 that are streamed in fast
+        transfer mode into the rows of the data array, yielding the rows
+        of each new chunk
+        """
+        count = len(data)
+        scale = self.sensitivity / 30000.  # Read before the transfer starts
+        index = 0
+        try:
+            self.start_buffer(fast=True)
+            while index < count and not has_aborted():
+                size = min(chunk_size, count - index)
+                raw = np.frombuffer(self.read_bytes(4 * size), dtype='<i2')
+                data[index:index + size] = raw.reshape(size, 2) * scale
+                yield data[index:index + size]
+                index += size
+        finally:
+            self.write("PAUS")
+            self.write("FAST0")
+
+    def stream_buffer(self, count, chunk_size=512, fast=False, out=None,
+                      has_aborted=lambda: False, delay=0.01):
+        """ Resets and starts the buffer, and yields the chunks of points
+        of channel 1 and 2 as they are acquired, until count points are
+        read. The chunks are the new rows of a preallocated array of shape
+        (count, 2), which is filled once the generator is exhausted.
+
+        By default, the points are read from the buffer with binary
+        transfers (TRCB) of the available points of both channels. In fast
+        mode (FAST2), the instrument streams the points of both channels
+        while it acquires them, which supports the highest sample rates.
+        The fast data is scaled by the sensitivity, which is only valid for
+        X and Y displayed on channel 1 and 2 without offset or expansion.
+
+        .. code-block:: python
+
+            data = np.empty((1000, 2), np.float32)
+            for chunk in lockin.stream_buffer(1000, out=data):
+                print(chunk.mean(axis=0))
+
+        :param count: Number of points to acquire
+        :param chunk_size: Number of points read at once in fast mode
+        :param fast: Use the fast transfer mode
+        :param out: Optional array of shape (count, 2) to fill
+        :param has_aborted: Function that returns True to stop the acquisition
+        :param delay: Time in seconds between polls of the buffer count
+        """
+        data = np.empty((count, 2), np.float32) if out is None else out
+        self.reset_buffer()
+        if fast:
+            yield from self._read_fast(data, chunk_size, has_aborted)
+        else:
+            self.start_buffer()
+            yield from self._read_buffer(data, has_aborted, delay)
+
     def pause_buffer(self):
         self.write("PAUS")
 
@@ -428,7 +486,7 @@ class SR830(Instrument):
             i += 1
             if has_aborted():
                 return False
-        self.pauseBuffer()
+        self.pause_buffer()
 
     def get_buffer(self, channel=1, start=0, end=None):
         """ Aquires the 32 bit floating point data through binary transfer
@@ -436,7 +494,7 @@ class SR830(Instrument):
         if end is None:
             end = self.buffer_count
         return self.binary_values("TRCB?%d,%d,%d" % (
-                        channel, start, end-start))
+                        channel, start, end-start), dtype='<f4')
 
     def reset_buffer(self):
         self.write("REST")
@@ -49,7 +49,8 @@ setup(
             'zmq >= 16.0.2',
             'cloudpickle >= 0.3.1'
         ],
-        'python-vxi11': ['python-vxi11 >= 0.9']
+        'python-vxi11': ['python-vxi11 >= 0.9'],
+        'zstd': ['zstandard']
     },
     setup_requires=[
         'pytest-runner'
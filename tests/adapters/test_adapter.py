@@ -24,6 +24,8 @@
 
 import logging
 
+import pytest
+
 from pymeasure.adapters import FakeAdapter
 
 log = logging.getLogger(__name__)
@@ -37,3 +39,41 @@ def test_adapter_values():
     assert a.values("X,Y,Z") == ['X', 'Y', 'Z']
     assert a.values("X,Y,Z", cast=str) == ['X', 'Y', 'Z']
     assert a.values("X.Y.Z", separator='.') == ['X', 'Y', 'Z']
+
+
+def test_adapter_wait_for():
+    a = FakeAdapter()
+    checks = iter([False, False, True])
+    assert a.wait_for(lambda: next(checks), delay=0)
+    assert not a.wait_for(lambda: False, delay=0, should_stop=lambda: True)
+    with pytest.raises(TimeoutError):
+        a.wait_for(lambda: False, timeout=0.01, delay=0.001)
+
+
+def test_adapter_wait_for_srq():
+    class SRQAdapter(FakeAdapter):
+        status_bytes = iter([0, 1, 65])
+
+        def read_stb(self):
+            return next(self.status_bytes)
+
+    assert SRQAdapter().wait_for_srq(delay=0)
+
+
+def test_adapter_write_binary_values():
+    class RawAdapter(FakeAdapter):
+        def __init__(self):
+            super().__init__()
+            self.chunks = []
+
+        def write_raw(self, data, end=True):
+            self.chunks.append((data, end))
+
+    a = RawAdapter()
+    a.write_binary_values("DATA ", [1, -1], dtype='<i2')
+    assert a.chunks == [(b"DATA #14\x01\x00\xff\xff\n", True)]
+
+    a.chunks = []
+    a.write_binary_values("DATA ", [1, -1], dtype='<i2', chunk_size=5)
+    assert b"".join(data for data, end in a.chunks) == b"DATA #14\x01\x00\xff\xff\n"
+    assert [end for data, end in a.chunks] == [False, False, True]
@@ -0,0 +1,72 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+import serial
+
+from pymeasure.adapters import PrologixAdapter
+
+
+class FakeSerial(serial.Serial):
+    """ Unopened serial port that replies to each serial poll of the
+    Prologix controller with the next of the given status bytes, and to
+    reads with the given data """
+
+    def __init__(self, status_bytes=(), data=b""):
+        super().__init__()
+        self.status_bytes = iter(status_bytes)
+        self.data = data
+        self.commands = []
+
+    def write(self, data):
+        self.commands.append(data)
+
+    def read(self, size=1):
+        data, self.data = self.data[:size], self.data[size:]
+        return data
+
+    def readline(self, size=-1):
+        return b"%d\n" % next(self.status_bytes)
+
+
+def test_prologix_wait_for_srq():
+    port = FakeSerial([0, 0, 80])
+    adapter = PrologixAdapter(port, 5)
+    assert adapter.wait_for_srq(10, 0, lambda: False)
+    assert port.commands.count(b"++spoll\n") == 3
+    assert b"++addr 5\n" in port.commands
+
+
+def test_prologix_wait_for_srq_stops_and_times_out():
+    adapter = PrologixAdapter(FakeSerial(iter(lambda: 0, 1)), 5)
+    assert not adapter.wait_for_srq(delay=0, should_stop=lambda: True)
+    with pytest.raises(TimeoutError):
+        adapter.wait_for_srq(timeout=0.01, delay=0.001)
+
+
+def test_prologix_read_bytes():
+    port = FakeSerial(data=b"\x00\x01\n\x02")
+    adapter = PrologixAdapter(port, 12)
+    assert adapter.read_bytes(3) == b"\x00\x01\n"
+    assert port.commands[-1] == b"++read eoi\n"
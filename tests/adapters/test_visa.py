@@ -26,3 +26,31 @@ from pymeasure.adapters import VISAAdapter
 
 def test_visa_version():
   assert VISAAdapter.has_supported_version()
+
+
+def test_visa_wait_for_srq_polls_once():
+    from unittest import mock
+    from pyvisa.errors import VisaIOError
+    from pyvisa.constants import StatusCode
+
+    adapter = VISAAdapter.__new__(VISAAdapter)
+    adapter.connection = mock.MagicMock()
+    adapter.connection.read_stb.return_value = 0
+    timeout = VisaIOError(StatusCode.error_timeout)
+    adapter.connection.wait_on_event.side_effect = [timeout, timeout, None]
+    assert adapter.wait_for_srq(delay=0.001)
+    assert adapter.connection.read_stb.call_count == 1  # No polling while waiting
+    assert adapter.connection.wait_on_event.call_count == 3
+    adapter.connection.disable_event.assert_called_once()
+
+
+def test_visa_binary_values():
+    from unittest import mock
+    import numpy as np
+
+    adapter = VISAAdapter.__new__(VISAAdapter)
+    adapter.connection = mock.MagicMock()
+    adapter.connection.read_raw.return_value = b"#0" + np.arange(3, dtype='<f4').tobytes()
+    values = adapter.binary_values("CURV?", header_bytes=2)
+    adapter.connection.write.assert_called_once_with("CURV?")
+    np.testing.assert_array_equal(values, [0., 1., 2.])
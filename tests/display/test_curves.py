@@ -0,0 +1,130 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+
+import numpy as np
+import pyqtgraph as pg
+
+from pymeasure.display.curves import MinMaxDecimator, BufferCurve, ResultsCurve
+from pymeasure.experiment import Procedure
+from pymeasure.experiment.results import Results
+
+
+def test_decimator_passes_small_data():
+    decimator = MinMaxDecimator(max_blocks=100)
+    x = np.arange(150.)
+    dx, dy = decimator.decimate(x, x ** 2)
+    assert np.array_equal(dx, x)
+    assert np.array_equal(dy, x ** 2)
+
+
+def test_decimator_preserves_envelope():
+    decimator = MinMaxDecimator(max_blocks=100)
+    x = np.arange(10000.)
+    y = np.sin(x / 50.) + (x == 5000) * 10.
+    dx, dy = decimator.decimate(x, y)
+    assert len(dx) <= 2 * 100 + decimator.block_size
+    assert dy.max() == y.max()
+    assert dy.min() == y.min()
+    assert np.all(np.diff(dx) > 0)
+
+
+def test_decimator_incremental_matches_full():
+    x = np.arange(20000.)
+    y = np.random.RandomState(0).normal(size=len(x))
+    y[1234] = np.nan
+
+    incremental = MinMaxDecimator(max_blocks=64)
+    for stop in range(0, len(x) + 1, 777):
+        incremental.decimate(x[:stop], y[:stop])
+    ix, iy = incremental.decimate(x, y)
+
+    full = MinMaxDecimator(max_blocks=64)
+    full.block_size = incremental.block_size
+    fx, fy = full.decimate(x, y)
+    assert np.array_equal(ix, fx)
+    assert np.array_equal(iy, fy)
+
+
+def test_buffer_curve_grows_and_batches(qapp):
+    curve = BufferCurve(batch=True)
+    curve.prepare(4)
+    for i in range(10):
+        curve.append(i, 2 * i)
+    assert curve.xData is None  # Not rendered before an update
+    curve.extend(np.arange(10, 20), np.arange(20, 40, 2))
+    assert len(curve._buffer) == 32
+    curve.update()
+    assert np.array_equal(curve.xData, np.arange(20))
+    assert np.array_equal(curve.yData, 2 * np.arange(20))
+
+
+def test_buffer_curve_with_errors(qapp):
+    curve = BufferCurve(errors=True)
+    curve.prepare(2)
+    for i in range(3):
+        curve.append(i, 2 * i, 0.1, 0.2)  # Rendered on append
+    assert np.array_equal(curve.yData, 2 * np.arange(3))
+    assert np.allclose(curve._errorBars.opts['top'], 0.2)
+    assert np.allclose(curve._errorBars.opts['left'], 0.1)
+
+
+def test_results_curve_follows_view(qapp, tmpdir):
+    class LinearProcedure(Procedure):
+        DATA_COLUMNS = ['Iteration', 'Random Number']
+
+    filename = os.path.join(str(tmpdir), 'data.csv')
+    results = Results(LinearProcedure(), filename)
+    with open(filename, 'a') as f:
+        for i in range(5000):
+            f.write('%d,%f\n' % (i, i / 10.))
+    plot = pg.PlotWidget()
+    curve = ResultsCurve(results, 'Iteration', 'Random Number')
+    plot.addItem(curve)
+    curve.set_full_resolution(True)
+    plot.setXRange(0, 100, padding=0)
+    assert len(curve.xData) == 101  # Re-rendered without new data
+    plot.setXRange(0, 1000, padding=0)
+    assert len(curve.xData) == 1001
+
+
+def test_results_curve_dirty_on_file_change(qapp, tmpdir):
+    class LinearProcedure(Procedure):
+        DATA_COLUMNS = ['Iteration', 'Random Number']
+
+    filename = os.path.join(str(tmpdir), 'data.csv')
+    results = Results(LinearProcedure(), filename)
+    curve = ResultsCurve(results, 'Iteration', 'Random Number')
+    assert curve.is_dirty()
+    curve.update()
+    assert not curve.is_dirty()
+    with open(filename, 'a') as f:  # Written by another process
+        f.write('0,0.1\n')
+    assert results.revision == 0
+    assert curve.is_dirty()
+    curve.update()
+    assert not curve.is_dirty()
+    results.mark_updated()
+    assert curve.is_dirty()
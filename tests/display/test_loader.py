@@ -0,0 +1,54 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+
+from pymeasure.display.loader import ResultsLoader
+from pymeasure.experiment import Procedure
+from pymeasure.experiment.results import Results
+
+
+class LinearProcedure(Procedure):
+    DATA_COLUMNS = ['x', 'y']
+
+
+def test_results_loader(qtbot, tmpdir):
+    filename = os.path.join(str(tmpdir), 'data.csv')
+    Results(LinearProcedure(), filename)
+    with open(filename, 'a') as f:
+        for i in range(100):
+            f.write('%d,%d\n' % (i, 2 * i))
+
+    loader = ResultsLoader()
+    headers = []
+    loader.header_loaded.connect(headers.append)
+    with qtbot.waitSignal(loader.loaded, timeout=5000) as blocker:
+        loader.load(filename)
+    results = blocker.args[0]
+    assert headers == [results]
+    assert results.is_loaded()  # Data handed over by the loader
+    assert results.data.shape == (100, 2)
+
+    loader.shutdown()
+    assert loader.receivers(loader.header_loaded) == 0  # Disconnected
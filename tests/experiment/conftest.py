@@ -0,0 +1,48 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+
+import pytest
+
+from pymeasure.experiment.results import Results
+
+
+@pytest.fixture
+def write_results(tmpdir):
+    """ Returns a function that writes the :class:`Results` of a procedure
+    to a file in tmpdir, with the rows (i, i / 10) for each iteration or
+    the given number of rows, and returns the Results """
+
+    def write(name, procedure, rows=None, **kwargs):
+        filename = os.path.join(str(tmpdir), name)
+        results = Results(procedure, filename, **kwargs)
+        if rows is None:
+            rows = procedure.iterations
+        with open(filename, 'a') as f:
+            for i in range(rows):
+                f.write('%d,%f\n' % (i, i / 10.))
+        return results
+
+    return write
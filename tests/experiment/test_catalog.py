@@ -0,0 +1,99 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+import time
+
+from pymeasure.experiment.catalog import ResultsCatalog
+from pymeasure.experiment.results import Results, BinaryResults
+
+from data.procedure_for_testing import RandomProcedure
+
+
+def test_catalog_query(tmpdir, write_results):
+    directory = str(tmpdir)
+    os.makedirs(os.path.join(directory, 'day'))
+    write_results('a.csv', RandomProcedure(iterations=10, delay=0.001))
+    b = write_results(os.path.join('day', 'b.csv'),
+                      RandomProcedure(iterations=20, delay=0.5)).data_filename
+    c = write_results(os.path.join('day', 'c.csv'),
+                      RandomProcedure(iterations=30, delay=2)).data_filename
+
+    catalog = ResultsCatalog(directory)
+    assert catalog.update() == 3
+    assert catalog.update() == 0
+    assert len(catalog) == 3
+
+    assert catalog.select('RandomProcedure', [('Delay Time', '>', 0.1)]) == [b, c]
+    assert catalog.select(conditions=[('Loop Iterations', '>=', 30)]) == [c]
+    assert catalog.select('OtherProcedure') == []
+    assert catalog.parameters(b)['Delay Time'] == ('0.5', 's')
+
+    results = list(catalog.query(conditions=[('Random Seed', '=', '12345'),
+                                             ('Loop Iterations', '<', 25)],
+                                 procedure_class=RandomProcedure))
+    assert [r.data_filename for r in results] == [os.path.join(directory, 'a.csv'), b]
+    assert not results[1].is_loaded()
+    assert results[1].procedure.iterations == 20
+    assert results[1].data.shape == (20, 2)
+
+    os.remove(c)
+    os.remove(os.path.join(directory, 'a.csv'))
+    time.sleep(0.01)
+    write_results('a.csv', RandomProcedure(iterations=15, delay=0.001))
+    assert catalog.update() == 1
+    assert catalog.select(conditions=[('Loop Iterations', '=', 15)]) == [
+        os.path.join(directory, 'a.csv')]
+    assert len(catalog) == 2
+    catalog.close()
+
+
+def test_catalog_compressed_and_binary(tmpdir):
+    directory = str(tmpdir)
+    for extension in ('csv', 'csv.gz'):
+        filename = os.path.join(directory, 'data.' + extension)
+        results = Results(RandomProcedure(iterations=3), filename)
+        handler = results.handler(filename)
+        for i in range(3):
+            handler.handle({'Iteration': i, 'Random Number': i / 10.})
+        handler.close()
+    filename = os.path.join(directory, 'data.bin')
+    results = BinaryResults(RandomProcedure(iterations=4), filename)
+    handler = results.handler(filename)
+    for i in range(4):
+        handler.handle({'Iteration': i, 'Random Number': i / 10.})
+    handler.close()
+
+    catalog = ResultsCatalog(directory)
+    assert catalog.update() == 2
+    rows = dict(catalog.connection.execute("SELECT path, rows FROM files"))
+    assert rows == {os.path.join(directory, 'data.csv'): 3,
+                    os.path.join(directory, 'data.csv.gz'): 3}
+    catalog.close()
+
+    catalog = ResultsCatalog(directory, extension='bin', database=':memory:')
+    assert catalog.update() == 1
+    assert catalog.select(conditions=[('Loop Iterations', '=', 4)]) == [filename]
+    assert list(catalog.connection.execute("SELECT rows FROM files")) == [(4,)]
+    catalog.close()
@@ -24,9 +24,10 @@
 
 import pytest
 import pickle
+import threading
 
 from pymeasure.experiment.procedure import Procedure, ProcedureWrapper
-from pymeasure.experiment.parameters import Parameter
+from pymeasure.experiment.parameters import Parameter, Measurable
 
 from data.procedure_for_testing import RandomProcedure
 
@@ -44,6 +45,53 @@ def test_parameters():
     assert 'x' in objs
     assert objs['x'].value == p.x
 
+
+def test_parameters_and_measurables_are_discovered_once():
+    class TestProcedure(Procedure):
+        x = Parameter('X', default=5)
+        y = Measurable('Y', default=2)
+        z = Measurable('Z', measure=False)
+
+    a, b = TestProcedure(), TestProcedure(x=7)
+    assert TestProcedure._attribute_cache == (['x'], ['y', 'z'])
+    assert a.parameter_values() == {'x': 5}
+    assert b.parameter_values() == {'x': 7}
+    assert TestProcedure.x.value == 5
+    assert a.MEASURE == {'Y': 'y'}
+    assert a.get_datapoint() == {'Y': 2}
+
+    class SubProcedure(TestProcedure):
+        w = Parameter('W', default=1)
+
+    assert sorted(SubProcedure().parameter_values()) == ['w', 'x']
+
+
+def test_get_datapoint_measures_buses_concurrently():
+    # Each measurement only returns once both buses are being measured;
+    # the barrier is armed after the Measurables have read their defaults
+    barrier = None
+
+    def concurrent(value):
+        def fget():
+            if barrier is not None:
+                barrier.wait()
+            return value
+        return fget
+
+    class TestProcedure(Procedure):
+        DATA_COLUMNS = ['A', 'B']
+        MEASURE_CONCURRENTLY = True
+        MEASURE_TIMESTAMPS = True
+        a = Measurable('A', fget=concurrent(1), bus='GPIB0')
+        b = Measurable('B', fget=concurrent(2), bus='GPIB1')
+
+    procedure = TestProcedure()
+    assert procedure.DATA_COLUMNS == ['A', 'B', 'A Time', 'B Time']
+    barrier = threading.Barrier(2, timeout=5)
+    data = procedure.get_datapoint()
+    assert data['A'] == 1 and data['B'] == 2
+    assert 'A Time' in data and 'B Time' in data
+
 # TODO: Add tests for measureables
 
 def test_procedure_wrapper():
@@ -0,0 +1,94 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import os
+import tempfile
+import time
+
+import pytest
+
+from pymeasure.experiment.results import Results
+
+from data.procedure_for_testing import RandomProcedure
+
+zmq = pytest.importorskip('zmq')
+cloudpickle = pytest.importorskip('cloudpickle')
+
+from pymeasure.experiment.remote import ResultsServer, RemoteResults
+
+PORT, PUBLISH_PORT, SNAPSHOT_PORT = 5991, 5992, 5993
+
+
+def wait_for(condition, timeout=5.):
+    start = time.time()
+    while not condition() and time.time() - start < timeout:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def publisher():
+    context = zmq.Context()
+    socket = context.socket(zmq.PUB)
+    socket.bind('tcp://*:%d' % PORT)
+    yield socket
+    socket.close(linger=0)
+    context.term()
+
+
+def emit(publisher, iterations, start=0):
+    for i in range(start, start + iterations):
+        record = {'Iteration': i, 'Random Number': 0.5}
+        publisher.send_multipart([b'results', cloudpickle.dumps(record)])
+
+
+def test_remote_results_late_join_and_deltas(publisher):
+    procedure = RandomProcedure()
+    results = Results(procedure, tempfile.mktemp())
+    server = ResultsServer(results, PORT, PUBLISH_PORT, SNAPSHOT_PORT, decimations=(10,))
+    server.start()
+    try:
+        time.sleep(0.2)  # Allow the server to subscribe
+        emit(publisher, 50)
+        assert wait_for(lambda: len(server._records) == 50)
+
+        remote = RemoteResults('localhost', PUBLISH_PORT, SNAPSHOT_PORT)
+        decimated = RemoteResults('localhost', PUBLISH_PORT, SNAPSHOT_PORT, step=10)
+        try:
+            assert remote.data.shape == (50, 2)
+            assert list(decimated.data['Iteration']) == [0, 10, 20, 30, 40]
+            assert remote.procedure.__class__.__name__ == 'RandomProcedure'
+
+            time.sleep(0.2)  # Allow the clients to subscribe
+            emit(publisher, 25, start=50)
+            assert wait_for(lambda: len(remote.data) == 75)
+            assert list(remote.data['Iteration']) == list(range(75))
+            assert wait_for(lambda: len(decimated.data) == 8)
+            assert list(decimated.data['Iteration']) == list(range(0, 75, 10))
+        finally:
+            remote.close()
+            decimated.close()
+    finally:
+        server.stop()
+        server.join(1)
@@ -31,7 +31,8 @@ import pickle
 from importlib.machinery import SourceFileLoader
 import pandas as pd
 import numpy as np
-from pymeasure.experiment.results import Results, CSVFormatter
+from pymeasure.experiment.results import (Results, BinaryResults, ResultsIndex, CSVFormatter,
+                                          concat_results, unique_filename)
 from pymeasure.experiment.procedure import Procedure, Parameter
 
 # Load the procedure, without it being in a module
@@ -79,24 +80,27 @@ def test_procedure_wrapper():
 class TestResults:
     # TODO: add a full set of Results tests
 
-    @mock.patch('pymeasure.experiment.results.open', mock.mock_open(), create=True)
+    @mock.patch('pymeasure.experiment.results.open',
+                mock.mock_open(read_data=b'A,B\n1,2\n'), create=True)
     @mock.patch('os.path.exists', return_value=True)
+    @mock.patch('os.path.getsize', return_value=8)
+    @mock.patch.object(Results, 'read_labels', return_value=['A', 'B'])
     @mock.patch('pymeasure.experiment.results.pd.read_csv')
     def test_regression_attr_data_when_up_to_date_should_retain_dtype(self,
-            read_csv_mock, path_exists_mock):
+            read_csv_mock, read_labels_mock, getsize_mock, path_exists_mock):
         procedure_mock = mock.MagicMock(spec=Procedure)
         result = Results(procedure_mock, 'test.csv')
 
-        read_csv_mock.return_value = [pd.DataFrame(data={
+        read_csv_mock.return_value = pd.DataFrame(data={
                 'A': [1,2,3,4,5,6,7],
                 'B': [2,3,4,5,6,7,8]
-            })]
+            })
         first_data = result.data
 
         # if no updates, read_csv returns a zero-row dataframe
-        read_csv_mock.return_value = [pd.DataFrame(data={
+        read_csv_mock.return_value = pd.DataFrame(data={
             'A': [], 'B': []
-            }, dtype=object)]
+            }, dtype=object)
         second_data = result.data
 
         assert second_data.iloc[:,0].dtype is not object
@@ -113,3 +117,226 @@ class TestResults:
         result.reload() # assert no error
         pd.read_csv(filename, comment="#") # assert no error
         assert (result.parameters['par'].value == np.linspace(1,100,17)).all()
+
+
+def test_results_index(tmpdir, write_results):
+    directory = str(tmpdir)
+    for iterations in (10, 20):
+        write_results('data_%d.csv' % iterations, RandomProcedure(iterations=iterations))
+
+    index = ResultsIndex(directory, stats=True)
+    assert index.update() == 2
+    entry = index.entries['data_20.csv']
+    assert entry['procedure'].endswith('RandomProcedure')
+    assert entry['parameters']['Loop Iterations'][0] == '20'
+    assert entry['columns'] == ['Iteration', 'Random Number']
+    assert entry['rows'] == 20
+    assert entry['stats']['Iteration']['max'] == 19
+
+    index = ResultsIndex(directory, stats=True)  # Read from the sidecar file
+    assert index.update() == 0
+    filenames = index.filter(lambda e: e['parameters']['Loop Iterations'][0] == '10')
+    assert filenames == [os.path.join(directory, 'data_10.csv')]
+
+    results = index.load(filenames[0], procedure_class=RandomProcedure)
+    assert not results.is_loaded()
+    assert results.procedure.iterations == 10
+    assert results.data.shape == (10, 2)
+
+
+def test_concat_results(write_results):
+    filenames = []
+    for iterations in (10, 20):
+        results = write_results('data_%d.csv' % iterations,
+                                RandomProcedure(iterations=iterations))
+        filenames.append(results.data_filename)
+
+    for processes in (1, 2):
+        data = concat_results(filenames, columns=['Random Number'],
+                              parameters=['Loop Iterations'],
+                              filename_column='Filename', processes=processes)
+        assert list(data.columns) == ['Random Number', 'Loop Iterations', 'Filename']
+        assert data.shape == (30, 3)
+        assert data['Random Number'].dtype == np.float64  # Not exact as float32
+        assert data['Loop Iterations'].dtype == 'category'
+        assert sorted(data['Loop Iterations'].astype(float).value_counts()) == [10, 20]
+
+    data = concat_results(filenames, processes=1, categorical=False)
+    assert set(data.columns) == {'Iteration', 'Random Number', 'Loop Iterations',
+                                 'Delay Time', 'Random Seed'}
+    assert data['Delay Time'].iloc[0] == 0.001
+    assert data['Iteration'].dtype == np.int8
+
+
+def test_results_columns_and_dtypes(write_results):
+    class TypedProcedure(RandomProcedure):
+        DATA_TYPES = {'Iteration': 'int16', 'Random Number': 'float32'}
+
+    results = write_results('typed.csv', TypedProcedure(), rows=5, columns=['Random Number'])
+    filename = results.data_filename
+    assert list(results.data.columns) == ['Random Number']
+    assert results.data['Random Number'].dtype == np.float32
+
+    with open(filename, 'a') as f:
+        for i in range(5, 8):
+            f.write('%d,%f\n' % (i, i / 10.))
+    assert results.data.shape == (8, 1)
+    assert results.data['Random Number'].iloc[-1] == np.float32(0.7)
+
+    results.set_columns(None)
+    assert not results.is_loaded()
+    assert results.data['Iteration'].dtype == np.int16
+    assert results.data.shape == (8, 2)
+    results.set_columns(['Iteration'])
+    assert results.is_loaded()
+    assert list(results.data.columns) == ['Iteration']
+
+
+def test_binary_results(tmpdir):
+    class TypedProcedure(RandomProcedure):
+        DATA_TYPES = {'Iteration': 'int32'}
+
+    filename = os.path.join(str(tmpdir), 'data.bin')
+    results = BinaryResults(TypedProcedure(iterations=7), filename)
+    handler = results.handler(filename)
+    for i in range(5):
+        handler.handle({'Iteration': i, 'Random Number': i / 10.})
+    assert len(results.records) == 5
+    assert results.column('Iteration')[-1] == 4
+    assert results.data.shape == (5, 2)
+
+    with open(filename, 'ab') as f:  # Incomplete record
+        f.write(b'\x00' * 3)
+    assert len(results.records) == 5
+
+    loaded = Results.load(filename, procedure_class=TypedProcedure)
+    assert isinstance(loaded, BinaryResults)
+    assert loaded.procedure.iterations == 7
+    assert loaded.dtype == results.dtype
+    assert loaded.data['Iteration'].dtype == np.int32
+    np.testing.assert_allclose(loaded.column('Random Number'), np.arange(5) / 10.)
+    handler.close()
+
+    index = ResultsIndex(str(tmpdir), extension='bin', stats=True)
+    assert index.update() == 1
+    entry = index.entries['data.bin']
+    assert entry['columns'] == ['Iteration', 'Random Number']
+    assert entry['rows'] == 5
+    assert entry['stats']['Iteration']['max'] == 4
+
+
+@pytest.mark.parametrize('extension', ['csv.gz', 'csv.zst'])
+def test_compressed_results(tmpdir, extension):
+    if extension.endswith('zst'):
+        pytest.importorskip('zstandard')
+    filename = os.path.join(str(tmpdir), 'data.' + extension)
+    results = Results(RandomProcedure(iterations=3), filename)
+    handler = results.handler(filename, flush_interval=0)
+    for i in range(3):
+        handler.handle({'Iteration': i, 'Random Number': i / 10.})
+    assert results.data.shape == (3, 2)
+
+    for i in range(3, 5):
+        handler.handle({'Iteration': i, 'Random Number': i / 10.})
+    assert results.data['Iteration'].tolist() == [0, 1, 2, 3, 4]
+    handler.close()
+
+    loaded = Results.load(filename)
+    assert loaded.procedure.iterations == 3
+    assert loaded.data.shape == (5, 2)
+    assert ResultsIndex.count_rows(filename, loaded._header_count) == 5
+
+
+def test_results_recover(tmpdir):
+    filename = os.path.join(str(tmpdir), 'crashed.csv')
+    results = Results(RandomProcedure(), filename, checksum=True)
+    handler = results.handler(filename)
+    for i in range(3):
+        handler.handle({'Iteration': i, 'Random Number': i / 10.})
+    handler.close()
+    with open(filename, 'a') as f:
+        f.write('3,0.3#00000000\n')  # Invalid checksum
+        f.write('4,0.')  # Partial line
+    assert results.data['Iteration'].tolist() == [0, 1, 2, 3]
+
+    size = os.path.getsize(filename)
+    assert results.recover() == len('3,0.3#00000000\n4,0.')
+    assert os.path.getsize(filename) < size
+    assert results.data['Iteration'].tolist() == [0, 1, 2]
+    assert results.recover() == 0
+
+    with open(filename, 'a') as f:
+        f.write('3,0.')
+    assert results.data.shape == (3, 2)
+    with open(filename, 'a') as f:
+        f.write('3\n')
+    assert results.data['Random Number'].iloc[-1] == 0.3
+
+
+def test_unique_filename(tmpdir):
+    directory = str(tmpdir)
+    open(os.path.join(directory, 'DATA_7.csv'), 'w').close()
+    filenames = [unique_filename(directory, datetimeformat='') for i in range(3)]
+    assert [os.path.basename(f) for f in filenames] == [
+        'DATA_8.csv', 'DATA_9.csv', 'DATA_10.csv']
+    assert all(os.path.exists(f) for f in filenames)
+
+    open(os.path.join(directory, 'DATA_11.csv'), 'w').close()  # Another process
+    assert unique_filename(directory, datetimeformat='').endswith('DATA_12.csv')
+
+    results = Results(RandomProcedure(), filenames[0])  # Header of the empty file
+    assert Results.load(filenames[0]).procedure.iterations == 100
+    assert results.data.shape == (0, 2)
+
+
+def test_results_recover_crlf(tmpdir):
+    filename = os.path.join(str(tmpdir), 'crlf.csv')
+    Results(RandomProcedure(), filename, checksum=True)
+    formatter = CSVFormatter(['Iteration', 'Random Number'], checksum=True)
+    with open(filename, 'ab') as f:
+        for i in range(3):
+            record = formatter.format({'Iteration': i, 'Random Number': i / 10.})
+            f.write(record.encode() + b'\r\n')
+        f.write(b'3,0.')  # Partial line
+    size = os.path.getsize(filename)
+
+    results = Results.load(filename)
+    assert results.recover() == len('3,0.')
+    assert os.path.getsize(filename) == size - len('3,0.')
+    assert results.data['Iteration'].tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize('extension', ['csv', 'csv.gz'])
+def test_results_reload_in_blocks(tmpdir, extension):
+    filename = os.path.join(str(tmpdir), 'blocks.' + extension)
+    results = Results(RandomProcedure(), filename)
+    handler = results.handler(filename, **({'flush_interval': 0} if 'gz' in extension else {}))
+    for i in range(100):
+        handler.handle({'Iteration': i, 'Random Number': i / 10.})
+    handler.close()
+    with mock.patch.object(Results, 'BLOCK_SIZE', 64):
+        results.reload()
+        assert results.data['Iteration'].tolist() == list(range(100))
+        np.testing.assert_allclose(results.data['Random Number'], np.arange(100) / 10.)
+
+
+def test_results_data_type_error(tmpdir):
+    class TypedProcedure(RandomProcedure):
+        DATA_TYPES = {'Iteration': 'int16'}
+
+    filename = os.path.join(str(tmpdir), 'typed.csv')
+    results = Results(TypedProcedure(), filename)
+    with open(filename, 'a') as f:
+        f.write('a,0.1\n')
+    with pytest.raises(ValueError, match="typed.csv"):
+        results.data
+
+
+def test_results_parser_error_is_not_a_type_error(tmpdir):
+    filename = os.path.join(str(tmpdir), 'data.csv')
+    results = Results(RandomProcedure(), filename)
+    error = pd.errors.ParserError("Error tokenizing data")
+    with mock.patch.object(pd, 'read_csv', side_effect=error) as read_csv:
+        with pytest.raises(pd.errors.ParserError, match="tokenizing"):
+            results._parse("0,0.1\n")
+    assert read_csv.call_count == 2  # Retried skipping the malformed lines
@@ -45,6 +45,7 @@ def test_procedure():
     assert procedure.delay == 0.001
     assert hasattr(procedure, 'execute')
 
+
 def test_worker_stop():
     procedure = RandomProcedure()
     file = tempfile.mktemp()
@@ -55,6 +56,7 @@ def test_worker_stop():
     assert worker.should_stop()
     worker.join()
 
+
 def test_worker_finish():
     procedure = RandomProcedure()
     procedure.iterations = 100
@@ -67,3 +69,16 @@ def test_worker_finish():
 
     new_results = Results.load(file, procedure_class=RandomProcedure)
     assert new_results.data.shape == (100, 2)
+
+
+def test_worker_marks_results_updated():
+    procedure = RandomProcedure()
+    procedure.iterations = 10
+    procedure.delay = 0.001
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    assert results.revision == 0
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=5)
+    assert results.revision == 10
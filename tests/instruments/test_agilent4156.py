@@ -0,0 +1,80 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.agilent import Agilent4156
+
+
+class BlockAdapter(FakeAdapter):
+    """ Replies to the data queries of an Agilent 4156 with definite length
+    blocks of big-endian floats, which are cut after the given number of
+    bytes by the raw read """
+
+    def __init__(self, columns, cut=None):
+        super().__init__()
+        self.columns = columns
+        self.cut = cut
+        self.commands = []
+        self.pending = b""
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def ask(self, command):
+        self.commands.append(command)
+        return {":PAGE:DISP:LIST?": "V1,I1", ":PAGE:DISP:DVAR?": ""}.get(command, "1")
+
+    def read_raw(self):
+        name = self.commands[-1].split("'")[1]
+        values = np.asarray(self.columns[name], dtype='>f8').tobytes()
+        length = str(len(values)).encode()
+        block = b"#" + str(len(length)).encode() + length + values + b"\n"
+        raw, self.pending = block[:self.cut], block[self.cut:] if self.cut else b""
+        return raw
+
+    def read_bytes(self, size):
+        data, self.pending = self.pending[:size], self.pending[size:]
+        return data
+
+
+def test_binary_data():
+    columns = {'V1': [0., 0.5, 1.], 'I1': [1e-3, -2e-3, 10.]}
+    instr = Agilent4156(BlockAdapter(columns))
+    np.testing.assert_array_equal(instr._binary_data(":DATA? 'V1'"), columns['V1'])
+
+    instr = Agilent4156(BlockAdapter(columns, cut=9))  # Termination in the data
+    np.testing.assert_array_equal(instr._binary_data(":DATA? 'I1'"), columns['I1'])
+
+
+def test_get_data(tmpdir):
+    columns = {'V1': np.arange(5.), 'I1': np.arange(5.) * 1e-3}
+    adapter = BlockAdapter(columns)
+    instr = Agilent4156(adapter)
+    data = instr.get_data(path=str(tmpdir.join('data')))
+    assert list(data.columns) == ['V1', 'I1']
+    np.testing.assert_array_equal(data['I1'], columns['I1'])
+    assert adapter.commands[-1] == ":FORM:DATA ASC"
+    assert tmpdir.join('data.csv').check()
@@ -0,0 +1,103 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.agilent import Agilent33500
+from pymeasure.instruments.hp import HP33120A
+
+
+class ArbAdapter(FakeAdapter):
+    """ Records the commands and binary messages, and replies to the byte
+    order and point count queries """
+
+    def __init__(self, points=None):
+        super().__init__()
+        self.points = points
+        self.commands = []
+        self.messages = []
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def write_raw(self, data, end=True):
+        self.messages.append(data)
+
+    def ask(self, command):
+        self.commands.append(command)
+        if command.startswith("FORM:BORD?"):
+            return "NORM\n"
+        return str(self.points)
+
+
+def block(command, values, dtype):
+    data = np.asarray(values, dtype=dtype).tobytes()
+    length = str(len(data))
+    return ("%s#%d%s" % (command, len(length), length)).encode() + data + b"\n"
+
+
+def test_agilent33500_data_arb():
+    adapter = ArbAdapter(points=8)
+    generator = Agilent33500(adapter)
+    values = np.arange(-4, 4) * 1000
+    generator.data_arb('ramp', values)
+    assert adapter.messages == [block("DATA:ARB:DAC ramp, ", values, '<i2')]
+    assert adapter.commands[:2] == ["FORM:BORD?", "FORM:BORD SWAP"]
+    assert adapter.commands[2:] == ["FORM:BORD NORM", "DATA:ATTR:POIN? ramp"]
+
+    adapter.messages = []
+    generator.data_arb('sine', np.linspace(-1, 1, 8), data_format='float')
+    assert adapter.messages == [block("DATA:ARB sine, ", np.linspace(-1, 1, 8), '<f4')]
+
+
+def test_agilent33500_data_arb_errors():
+    generator = Agilent33500(ArbAdapter(points=7))
+    with pytest.raises(ValueError, match="range"):
+        generator.data_arb('ramp', [0, 40000] * 4)
+    with pytest.raises(ValueError, match="integers"):
+        generator.data_arb('ramp', np.linspace(-1, 1, 8))
+    with pytest.raises(ValueError, match="7 points"):
+        generator.data_arb('ramp', np.zeros(8, dtype=int))
+    assert generator.adapter.commands[-2] == "FORM:BORD NORM"  # Restored
+
+
+def test_hp33120A_data_arb():
+    adapter = ArbAdapter(points=8)
+    generator = HP33120A(adapter)
+    adapter.commands = []
+    generator.data_arb('ramp', np.linspace(-1, 1, 8), data_format='float')
+    expected = np.round(np.linspace(-1, 1, 8) * 2047)
+    assert adapter.messages == [block("DATA:DAC VOLATILE, ", expected, '<i2')]
+    assert adapter.commands == ["FORM:BORD?", "FORM:BORD SWAP", "FORM:BORD NORM",
+                                "DATA:ATTR:POIN? VOLATILE", "DATA:COPY ramp, VOLATILE"]
+
+    with pytest.raises(ValueError, match="range"):
+        generator.data_arb('ramp', [0, 3000] * 4)
+    with pytest.raises(ValueError, match="integers"):
+        generator.data_arb('ramp', [0.5] * 8)
+    adapter.points = 6
+    with pytest.raises(ValueError, match="6 points"):
+        generator.data_arb('ramp', np.zeros(8))
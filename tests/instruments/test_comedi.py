@@ -0,0 +1,78 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.instruments.comedi import SynchronousAI
+
+
+class PolynomialConverter(object):
+    """ Converts raw values with a polynomial in (raw - origin), one sample
+    at a time like the comedilib converter """
+
+    def __init__(self, coefficients, origin):
+        self.coefficients = coefficients
+        self.origin = origin
+
+    def get_to_physical_coefficients(self):
+        return self.coefficients
+
+    def get_to_physical_expansion_origin(self):
+        return self.origin
+
+    def to_physical(self, values):
+        return np.array([sum(c * (v - self.origin) ** k
+                             for k, c in enumerate(self.coefficients))
+                         for v in values])
+
+
+class LinearConverter(object):
+    """ Converter that only supports the per sample conversion """
+
+    def to_physical(self, values):
+        return np.array([2. * v - 1. for v in values])
+
+
+def test_to_physical_matches_converters():
+    converters = [PolynomialConverter([-10., 20. / 65535], 0.),
+                  PolynomialConverter([0.5, 1e-4, 3e-9], 32768.)]
+    ai = SynchronousAI.__new__(SynchronousAI)
+    polynomials = ai._polynomials(converters)
+    assert polynomials is not None
+    raw = np.array([[0, 0], [32768, 32768], [65535, 1000]], dtype=np.uint16)
+    out = np.empty(raw.shape, dtype=np.float32)
+    ai._to_physical(raw, out, converters, polynomials)
+    for i, converter in enumerate(converters):
+        np.testing.assert_allclose(out[:, i], converter.to_physical(raw[:, i]), rtol=1e-6)
+
+
+def test_to_physical_without_polynomials():
+    converters = [LinearConverter(), PolynomialConverter([1., 1.], 0.)]
+    ai = SynchronousAI.__new__(SynchronousAI)
+    polynomials = ai._polynomials(converters)
+    assert polynomials is None
+    raw = np.array([[1, 2], [3, 4]], dtype=np.uint16)
+    out = np.empty(raw.shape)
+    ai._to_physical(raw, out, converters, polynomials)
+    np.testing.assert_array_equal(out, [[1., 3.], [5., 5.]])
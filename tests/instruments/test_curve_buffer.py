@@ -0,0 +1,85 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.signalrecovery import DSP7265
+
+
+class CurveAdapter(FakeAdapter):
+    """ Replies to the status and binary curve dump of a DSP 7265, whose
+    buffer holds the X and ADC1 curves, with the sensitivity curve """
+
+    def __init__(self, statuses, points):
+        super().__init__()
+        self.statuses = iter(statuses)
+        self.commands = []
+        # Columns in the order of the curve bits: x, sensitivity, ADC1
+        self.curves = np.array([[1000 * i, 27, -500 * i] for i in range(points)], dtype='>i2')
+
+    def config(self, **kwargs):
+        pass
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def ask(self, command):
+        self.commands.append(command)
+        return next(self.statuses)
+
+    def read_bytes(self, size):
+        return self.curves.tobytes()[:size]
+
+
+def test_buffer_data():
+    adapter = CurveAdapter([], 4)
+    lockin = DSP7265(adapter)
+    lockin.set_buffer(4, ['ADC1', 'x'])
+    assert lockin.buffer_quantities == ['x', 'sensitivity', 'ADC1']
+    assert adapter.commands[0] == "CBD 49"
+
+    data = lockin.buffer_data()
+    assert adapter.commands[-1] == "DCB 49"
+    np.testing.assert_allclose(data['x'], [0., 0.1, 0.2, 0.3])  # 1 V sensitivity
+    np.testing.assert_allclose(data['sensitivity'], 1.)
+    np.testing.assert_allclose(data['ADC1'], [0., -0.5, -1., -1.5])
+
+
+def test_stream_buffer():
+    statuses = ["1,0,0,2", "1,0,0,3", "1,0,0,6", "0,0,0,10"]
+    lockin = DSP7265(CurveAdapter(statuses, 10))
+    lockin.set_buffer(10, ['x', 'ADC1'])
+    blocks = list(lockin.stream_buffer(interval=0, block_points=3))
+    assert [len(block['x']) for block in blocks] == [3, 3, 4]
+    np.testing.assert_allclose(np.concatenate([b['x'] for b in blocks]), np.arange(10) / 10.)
+
+
+def test_stream_buffer_halted():
+    # The acquisition finishes early, with half of the points
+    statuses = ["1,0,0,2", "0,0,0,5"]
+    lockin = DSP7265(CurveAdapter(statuses, 10))
+    lockin.set_buffer(10, ['x', 'ADC1'])
+    blocks = list(lockin.stream_buffer(interval=0))
+    assert [len(block['x']) for block in blocks] == [2, 3]
@@ -0,0 +1,68 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import pytest
+import serial
+
+from pymeasure.instruments.fwbell import FWBell5080
+
+
+class FakeSerial(serial.Serial):
+    """ Unopened serial port that replies to each field query with the
+    next of the given replies """
+
+    def __init__(self, replies):
+        super().__init__()
+        self.replies = list(replies)
+        self.buffer = []
+        self.queries = 0
+
+    def write(self, data):
+        for _ in range(data.count(b"\n")):
+            self.queries += 1
+            if self.replies:
+                self.buffer.append(self.replies.pop(0))
+
+    def read_until(self, terminator=b"\n", size=None):
+        return self.buffer.pop(0) if self.buffer else b""
+
+    def reset_input_buffer(self):
+        self.buffer.clear()
+
+
+def test_stream_fields():
+    port = FakeSerial(b"%d G\r\n" % i for i in range(20))
+    meter = FWBell5080(port)
+    data, rate = meter.stream_fields(20, window=4)
+    assert list(data) == list(range(20))
+    assert port.queries == 20
+    assert rate > 0
+
+
+def test_stream_fields_discards_replies_on_error():
+    port = FakeSerial([b"1 G\r\n", b"2 G\r\n", b"3 G", b"4 G\r\n", b"5 G\r\n"])
+    meter = FWBell5080(port)
+    with pytest.raises(TimeoutError):
+        meter.stream_fields(10, window=4)
+    assert port.buffer == []
@@ -0,0 +1,93 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2019 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+
+from pymeasure.adapters import FakeAdapter
+from pymeasure.instruments.keithley import Keithley2400, Keithley2450
+
+
+class BufferAdapter(FakeAdapter):
+    """ Replies to binary buffer queries with an indefinite length block
+    (#0) of the readings, followed by a line break """
+
+    def __init__(self, readings=(), dtype='<f4', completed=True, acquired=0):
+        super().__init__()
+        self.raw = b"#0" + np.asarray(readings, dtype=dtype).tobytes() + b"\n"
+        self.completed = completed
+        self.acquired = acquired
+        self.commands = []
+
+    def write(self, command):
+        self.commands.append(command)
+
+    def ask(self, command):
+        self.commands.append(command)
+        if command.startswith(":TRAC:ACT?"):
+            return str(self.acquired)
+        return '0,"No error"'
+
+    def binary_values(self, command, header_bytes=0, dtype=np.float32):
+        self.commands.append(command)
+        return np.frombuffer(self.raw, dtype=dtype, offset=header_bytes)
+
+    def wait_for_srq(self, timeout=25, delay=0.1, should_stop=lambda: False):
+        return self.completed
+
+
+def test_binary_buffer_data():
+    readings = [[1., 2., 3., 4.], [5., 6., 7., 8.]]
+    adapter = BufferAdapter(readings)
+    keithley = Keithley2400(adapter)
+    voltage, current, resistance, times = keithley.read_list_sweep()
+    np.testing.assert_array_equal(voltage, [1., 5.])
+    np.testing.assert_array_equal(times, [4., 8.])
+    assert voltage.dtype == np.float64
+    assert adapter.commands[-2:] == [":TRAC:DATA?", ":FORM:DATA ASCII"]
+
+
+def test_upload_source_list():
+    adapter = BufferAdapter()
+    keithley = Keithley2400(adapter)
+    keithley.config_list_sweep(np.arange(250) * 1e-6)
+    uploads = [c for c in adapter.commands if c.startswith(":SOUR:LIST")]
+    assert [c.split(' ')[0] for c in uploads] == [
+        ":SOUR:LIST:CURR", ":SOUR:LIST:CURR:APP", ":SOUR:LIST:CURR:APP"]
+    assert sum(len(c.split(' ')[1].split(',')) for c in uploads) == 250
+
+
+def test_list_sweep_stopped():
+    adapter = BufferAdapter([[0.1, 1e-3, 0.], [0.2, 2e-3, 0.5]], dtype='<f8',
+                            completed=False, acquired=2)
+    keithley = Keithley2450(adapter)
+    voltage, current, resistance, times = keithley.list_sweep(
+        np.linspace(0, 1e-3, 10), should_stop=lambda: True)
+    assert ":ABOR" in adapter.commands
+    assert ':TRAC:DATA? 1, 2, "defbuffer1", READ, SOUR, REL' in adapter.commands
+    np.testing.assert_allclose(resistance, [100., 100.])
+
+    adapter = BufferAdapter(completed=False, acquired=0)
+    voltage, current, resistance, times = Keithley2450(adapter).list_sweep([1e-3])
+    assert len(voltage) == 0
+    assert not any(c.startswith(":TRAC:DATA?") for c in adapter.commands)